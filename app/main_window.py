@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 import logging
+import os
 import sys
 import uuid
-from collections import OrderedDict
+from collections import OrderedDict, deque
 import hashlib
 import json
 import multiprocessing as mp
+import threading
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from types import MappingProxyType
+from typing import Mapping, Optional, TextIO
 import urllib.request
 import urllib.error
 import zipfile
@@ -18,6 +22,7 @@ import soundfile as sf
 import sounddevice as sd
 import shutil
 from datetime import datetime
+from functools import lru_cache
 from PyQt6 import QtCore, QtGui, QtWidgets
 import pyqtgraph as pg
 
@@ -35,15 +40,24 @@ from audio.dsp import (
     compute_power_db,
     compute_mel_spectrogram,
     f0_to_midi,
+    f0s_to_midi,
     midi_to_note,
+    next_regular,
 )
-from audio.ring_buffer import RingBuffer
+from audio.wav_header import read_wav_duration
 from models.parsers import parse_reclist_text, read_text_guess
-from models.romaji import kana_to_romaji_tokens, needs_romaji
+from models.romaji import alias_romaji
 from models.session import Session, Item, ItemStatus
+from models.undo import UndoOp, apply_op, invert_op
 from models.voicebank import import_voicebank, parse_oto_ini
-from storage.session_io import save_session, load_session, export_recordings_json
-from app.vst_batch import VstBatchDialog
+from storage.session_io import (
+    save_session,
+    save_session_data,
+    load_session,
+    load_session_summary,
+    session_file,
+    export_recordings_json,
+)
 from app.voicebank_config_dialog import VoicebankConfigDialog
 
 
@@ -57,6 +71,8 @@ GITHUB_PROFILE_URL = "https://github.com/emeraldsingers"
 GITHUB_RELEASES_URL = "https://github.com/emeraldsingers/UTAU_Recorder/releases"
 GITHUB_URL = "https://github.com/emeraldsingers/UTAU_Recorder"
 YOUTUBE_URL = "https://www.youtube.com/@asoqwer"
+RECORDINGS_DIR = Path("Recordings")
+APP_ICON_PATH = Path(__file__).resolve().parent.parent / "icon" / "icon.ico"
 
 
 def _parse_version(value: str) -> tuple[int, ...]:
@@ -78,6 +94,40 @@ def _is_version_newer(candidate: str, current: str) -> bool:
     cur += (0,) * (length - len(cur))
     return cand > cur
 
+
+_EMPTY_F32 = np.array([], dtype=np.float32)
+_EMPTY_F32.setflags(write=False)
+
+
+@lru_cache(maxsize=4)
+def _silence(frames: int) -> np.ndarray:
+    data = np.zeros(frames, dtype=np.float32)
+    data.setflags(write=False)
+    return data
+
+
+def _unlink_quietly(path: Path) -> None:
+    try:
+        path.unlink(missing_ok=True)
+    except Exception:
+        pass
+
+
+def _read_mono_into(f: sf.SoundFile, out: np.ndarray, block: int = 65536) -> None:
+    if f.channels == 1:
+        done = len(f.read(len(out), dtype="float32", out=out))
+    else:
+        done = 0
+        while done < len(out):
+            chunk = f.read(min(block, len(out) - done), dtype="float32", always_2d=True)
+            if not len(chunk):
+                break
+            np.mean(chunk, axis=1, out=out[done : done + len(chunk)])
+            done += len(chunk)
+    if done < len(out):
+        out[done:] = 0.0
+
+
 def _analysis_cache_key(path: Path) -> str:
     return hashlib.sha1(str(path).encode("utf-8", errors="ignore")).hexdigest()
 
@@ -86,16 +136,56 @@ def _analysis_cache_paths(cache_dir: Path, key: str) -> tuple[Path, Path]:
     return cache_dir / f"{key}.json", cache_dir / f"{key}.npz"
 
 def _note_from_f0s(f0s: np.ndarray) -> str:
-    if f0s.size == 0:
-        return "--"
-    mids = [f0_to_midi(float(f)) for f in f0s if f and f > 0]
-    mids = [m for m in mids if m is not None]
-    if not mids:
+    voiced = f0s[f0s > 0]
+    if voiced.size == 0:
         return "--"
-    avg_midi = float(np.mean(mids))
+    avg_midi = 69.0 + 12.0 * float(np.mean(np.log2(voiced.astype(np.float64) / 440.0)))
     return midi_to_note(avg_midi)
 
 
+WAVE_PLOT_POINTS = 20000
+
+
+def _envelope_bucket(length: int, max_points: int = WAVE_PLOT_POINTS) -> tuple[int, int]:
+    bucket = max(1, length // max(1, max_points // 2))
+    return bucket, length // bucket
+
+
+def _waveform_envelope(
+    wave: np.ndarray,
+    max_points: int = WAVE_PLOT_POINTS,
+    out: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    bucket, count = _envelope_bucket(len(wave), max_points)
+    trimmed = wave[: count * bucket].reshape(count, bucket)
+    if out is None or out.shape != (2 * count,):
+        out = np.empty(2 * count, dtype=np.float32)
+    np.min(trimmed, axis=1, out=out[0::2])
+    np.max(trimmed, axis=1, out=out[1::2])
+    return out
+
+
+def _waveform_axis(length: int, sr: float, max_points: int = WAVE_PLOT_POINTS) -> np.ndarray:
+    if length <= max_points:
+        return np.arange(length, dtype=np.float32) * np.float32(1.0 / sr)
+    bucket, count = _envelope_bucket(length, max_points)
+    return np.repeat(np.arange(count, dtype=np.float32) * np.float32(bucket / sr), 2)
+
+
+def _mel_display_view(mel_db: np.ndarray, width: int) -> tuple[np.ndarray, int]:
+    width = max(256, width)
+    cols = mel_db.shape[1]
+    if cols <= width * 2:
+        return mel_db, cols
+    step = cols // width
+    used = step * width
+    return mel_db[:, :used].reshape(mel_db.shape[0], width, step).max(axis=2), used
+
+
+NOTE_ANALYSIS_SR = 16000
+NOTE_ANALYSIS_SECONDS = 3.0
+
+
 def _analyze_note_task(
     path: str,
     target_sr: int,
@@ -104,38 +194,48 @@ def _analyze_note_task(
     cache_dir: Optional[str],
 ) -> Optional[tuple[str, float, str]]:
     try:
-        file_path = Path(path)
-        if not file_path.exists():
+        try:
+            mtime = os.stat(path).st_mtime
+        except FileNotFoundError:
             return None
-        audio, sr = sf.read(str(file_path), dtype="float32")
+        with sf.SoundFile(path) as handle:
+            sr = handle.samplerate
+            window = int(NOTE_ANALYSIS_SECONDS * sr)
+            if handle.seekable() and handle.frames > window:
+                handle.seek((handle.frames - window) // 2)
+                audio = handle.read(frames=window, dtype="float32", always_2d=False)
+            else:
+                audio = handle.read(dtype="float32", always_2d=False)
+                if len(audio) > window:
+                    start = (len(audio) - window) // 2
+                    audio = audio[start:start + window]
         if audio.ndim > 1:
             audio = np.mean(audio, axis=1)
-        if sr != target_sr:
-            audio = AudioEngine._resample(audio, sr, target_sr)
-            sr = target_sr
+        if sr != NOTE_ANALYSIS_SR:
+            audio = AudioEngine._resample(audio, sr, NOTE_ANALYSIS_SR)
         if algo == "yin":
-            times, f0s = compute_f0_contour_yin(audio, sr)
+            _times, f0s = compute_f0_contour_yin(audio, NOTE_ANALYSIS_SR)
         else:
-            times, f0s = compute_f0_contour(audio, sr)
+            _times, f0s = compute_f0_contour(audio, NOTE_ANALYSIS_SR)
         note = _note_from_f0s(f0s)
         if cache_dir:
             _save_analysis_cache_to_disk(
                 Path(cache_dir),
-                file_path,
-                file_path.stat().st_mtime,
+                Path(path),
+                mtime,
                 algo,
-                sr,
+                target_sr,
                 ref_bits,
-                times,
-                f0s,
-                np.array([], dtype=np.float32),
-                np.array([], dtype=np.float32),
-                np.array([], dtype=np.float32),
-                np.array([], dtype=np.float32),
+                _EMPTY_F32,
+                _EMPTY_F32,
+                _EMPTY_F32,
+                _EMPTY_F32,
+                _EMPTY_F32,
+                _EMPTY_F32,
                 merge_existing=True,
                 note=note,
             )
-        return (str(file_path), file_path.stat().st_mtime, note)
+        return (path, mtime, note)
     except Exception:
         logger.exception("Failed to analyze note for %s", path)
         return None
@@ -165,13 +265,13 @@ def _load_analysis_cache_from_disk(
             return None
         if int(meta.get("ref_bits", -1)) != int(ref_bits):
             return None
-        data = np.load(str(data_path))
-        times = data.get("times", np.array([], dtype=np.float32))
-        f0s = data.get("f0s", np.array([], dtype=np.float32))
-        mel_db = data.get("mel_db", np.array([], dtype=np.float32))
-        mel_times = data.get("mel_times", np.array([], dtype=np.float32))
-        power_times = data.get("power_times", np.array([], dtype=np.float32))
-        power_db = data.get("power_db", np.array([], dtype=np.float32))
+        with np.load(str(data_path), allow_pickle=False) as data:
+            times = data.get("times", _EMPTY_F32)
+            f0s = data.get("f0s", _EMPTY_F32)
+            mel_db = data.get("mel_db", _EMPTY_F32)
+            mel_times = data.get("mel_times", _EMPTY_F32)
+            power_times = data.get("power_times", _EMPTY_F32)
+            power_db = data.get("power_db", _EMPTY_F32)
         has_pitch = bool(meta.get("has_pitch", False))
         has_mel = bool(meta.get("has_mel", False))
         has_power = bool(meta.get("has_power", False))
@@ -233,585 +333,151 @@ def _save_analysis_cache_to_disk(
     if note:
         meta["note"] = note
     cache_dir.mkdir(parents=True, exist_ok=True)
-    meta_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
-    np.savez_compressed(
-        str(data_path),
-        times=times.astype(np.float32, copy=False),
-        f0s=f0s.astype(np.float32, copy=False),
-        mel_db=mel_db.astype(np.float32, copy=False),
-        mel_times=mel_times.astype(np.float32, copy=False),
-        power_times=power_times.astype(np.float32, copy=False),
-        power_db=power_db.astype(np.float32, copy=False),
-    )
+    token = uuid.uuid4().hex
+    tmp_path = data_path.with_name(f"{data_path.name}.{token}.tmp")
+    meta_tmp_path = meta_path.with_name(f"{meta_path.name}.{token}.tmp")
+    try:
+        with tmp_path.open("wb") as f:
+            np.savez(
+                f,
+                times=times.astype(np.float32, copy=False),
+                f0s=f0s.astype(np.float32, copy=False),
+                mel_db=mel_db.astype(np.float32, copy=False),
+                mel_times=mel_times.astype(np.float32, copy=False),
+                power_times=power_times.astype(np.float32, copy=False),
+                power_db=power_db.astype(np.float32, copy=False),
+            )
+        meta_tmp_path.write_text(json.dumps(meta, ensure_ascii=False), encoding="utf-8")
+        tmp_path.replace(data_path)
+        meta_tmp_path.replace(meta_path)
+    except BaseException:
+        _unlink_quietly(tmp_path)
+        _unlink_quietly(meta_tmp_path)
+        raise
+
+
+ANALYSIS_TMP_MAX_AGE = 3600.0
+
+
+def _sweep_stale_cache_tmp(cache_dir: Path) -> None:
+    cutoff = datetime.now().timestamp() - ANALYSIS_TMP_MAX_AGE
+    try:
+        with os.scandir(cache_dir) as it:
+            for entry in it:
+                if entry.name.endswith(".tmp") and entry.stat().st_mtime < cutoff:
+                    _unlink_quietly(Path(entry.path))
+    except OSError:
+        logger.exception("Failed to sweep analysis cache temp files")
+
+
+NOTE_INDEX_NAME = "notes.json"
+
+
+def _load_note_index(cache_dir: Path, algo: str, sr: int, ref_bits: int) -> dict[str, tuple[float, str]]:
+    try:
+        data = json.loads((cache_dir / NOTE_INDEX_NAME).read_text(encoding="utf-8"))
+        if data.get("algo") != algo or int(data.get("sr", -1)) != int(sr):
+            return {}
+        if int(data.get("ref_bits", -1)) != int(ref_bits):
+            return {}
+        return {path: (float(mtime), str(note)) for path, (mtime, note) in data.get("notes", {}).items()}
+    except Exception:
+        return {}
+
+
+def _save_note_index(
+    cache_dir: Path,
+    algo: str,
+    sr: int,
+    ref_bits: int,
+    notes: dict[str, tuple[float, str]],
+) -> None:
+    index_path = cache_dir / NOTE_INDEX_NAME
+    payload = {
+        "algo": str(algo),
+        "sr": int(sr),
+        "ref_bits": int(ref_bits),
+        "notes": {path: [mtime, note] for path, (mtime, note) in notes.items()},
+    }
+    tmp_path = index_path.with_name(f"{index_path.name}.{uuid.uuid4().hex}.tmp")
+    tmp_path.write_text(json.dumps(payload, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(index_path)
+
+
+TRANSLATIONS_DIR = Path(__file__).with_name("translations")
+LANGUAGE_CODES = {"English": "en", "Русский": "ru", "日本語": "ja"}
+
+
+@lru_cache(maxsize=None)
+def _load_language(code: str) -> dict[str, str]:
+    return json.loads((TRANSLATIONS_DIR / f"{code}.json").read_text(encoding="utf-8"))
+
+
+@lru_cache(maxsize=4)
+def _translation_table(lang: str) -> Mapping[str, str]:
+    english = _load_language("en")
+    return MappingProxyType({**english, **_load_language(LANGUAGE_CODES.get(lang, "en"))})
+
+
+def _missing_translation(self, name: str) -> str:
+    if name.startswith("__"):
+        raise AttributeError(name)
+    return name
 
-TRANSLATIONS = {
-    "English": {
-        "app_title": "UTAU Voicebank Recorder",
-        "file": "File",
-        "import": "Import",
-        "settings": "Settings",
-        "edit": "Edit",
-        "tools": "Tools",
-        "vst_tools": "VST Tools",
-        "help": "Help",
-        "about": "About",
-        "check_updates": "Check for updates...",
-        "about_title": "About AsoCorder",
-        "about_version": "Version",
-        "about_github": "Authors GitHub",
-        "about_youtube": "Authors YouTube",
-        "about_releases": "Releases",
-        "about_check_updates": "Check for updates",
-        "about_download_update": "Download update",
-        "about_downloading": "Downloading update...",
-        "about_checking": "Checking for updates...",
-        "about_latest": "Latest",
-        "about_up_to_date": "Up to date",
-        "about_update_available": "Update available",
-        "about_update_failed": "Update check failed",
-        "about_current_newer": "Current version is newer than latest release.",
-        "about_ignore_until_next": "Don't bother until next update",
-        "about_no_assets": "No release archives found.",
-        "about_download_done": "Update downloaded.",
-        "about_download_failed": "Download failed.",
-        "about_extracting": "Extracting update...",
-        "about_extract_failed": "Failed to extract update.",
-        "about_restart_required": "Restart the app to apply the update.",
-        "session_settings": "Session Settings",
-        "session_settings_title": "Edit Session Settings",
-        "session_settings_note": "Changes apply to future recordings.",
-        "session_settings_busy": "Stop recording/preview before editing session settings.",
-        "rename_files_title": "Rename recordings",
-        "rename_files_prompt": "Rename existing files to match new prefix/suffix?",
-        "rename_files_failed": "Failed to rename one or more files.",
-        "new_session": "New Session",
-        "open_session": "Open Session",
-        "save_session": "Save Session",
-        "save_as": "Save Session As",
-        "export_recordings": "Export Recordings JSON",
-        "open_folder": "Open Session Folder",
-        "export_voicebank": "Export Voicebank",
-        "edit_voicebank": "Edit Voicebank",
-        "export_voicebank_title": "Export Voicebank",
-        "export_voicebank_done": "Voicebank exported.",
-        "voicebank_edit_title": "Edit Voicebank",
-        "voicebank_name": "Name",
-        "voicebank_author": "Author",
-        "voicebank_voice": "Voice",
-        "voicebank_web": "Web",
-        "voicebank_version": "Version",
-        "voicebank_image": "Image",
-        "voicebank_sample": "Sample",
-        "voicebank_portrait": "Portrait",
-        "voicebank_portrait_opacity": "Portrait opacity",
-        "voicebank_portrait_height": "Portrait height",
-        "voicebank_text_encoding": "Text encoding",
-        "voicebank_txt_export": "TXT export",
-        "voicebank_singer_type": "Singer type",
-        "voicebank_phonemizer": "Default phonemizer",
-        "voicebank_use_filename": "Use filename as alias",
-        "voicebank_other_info": "Other info",
-        "voicebank_localized_names": "Localized names",
-        "voicebank_add": "Add",
-        "voicebank_remove": "Remove",
-        "voicebank_pick_image": "Select image",
-        "voicebank_pick_sample": "Select sample",
-        "back_exit": "Back / Exit",
-        "save_reclist_to": "Save Reclist To",
-        "import_reclist": "Import Reclist",
-        "import_oremo_comment": "Import OREMO Comment",
-        "import_voicebank": "Import Voicebank",
-        "import_bgm": "Import BGM WAV",
-        "generate_bgm": "Generate BGM Note",
-        "audio_devices": "Audio Devices",
-        "language": "Language",
-        "ui_settings": "UI Settings",
-        "pitch_algorithm": "Pitch algorithm (charts + note)",
-        "pitch_algo_classic": "Classic (autocorr)",
-        "pitch_algo_yin": "New (YIN)",
-        "note_workers": "Note analysis workers",
-        "hold_to_record": "Hold R to record (OREMO style)",
-        "theme": "Theme",
-        "theme_light": "Light",
-        "theme_dark": "Dark",
-        "undo": "Undo",
-        "apply_vst": "Apply VST Plugins...",
-        "vst_batch_title": "VST Batch Processor",
-        "vst_select_audio": "Select audio files from this session",
-        "vst_search_placeholder": "Search by name or file...",
-        "vst_reload": "Reload from session",
-        "vst_select_all": "Select all",
-        "vst_clear_selection": "Clear selection",
-        "vst_use": "Use",
-        "vst_file": "File",
-        "vst_chain_title": "Plugin chain",
-        "vst_chain_presets": "Chain presets",
-        "vst_load_preset": "Load",
-        "vst_save_preset": "Save",
-        "vst_delete_preset": "Delete",
-        "vst_preset_none": "(None)",
-        "vst_preset_name": "Preset name",
-        "vst_plugin_path": "Plugin path",
-        "vst_plugin_preset": "Preset file",
-        "vst_bypass": "Bypass",
-        "vst_add_plugin": "Add plugin",
-        "vst_remove_plugin": "Remove plugin",
-        "vst_move_up": "Move up",
-        "vst_move_down": "Move down",
-        "vst_browse_preset": "Browse preset",
-        "vst_open_ui": "Open plugin UI",
-        "vst_host_cli": "VST host (CLI)",
-        "vst_host_gui": "VST host (GUI)",
-        "vst_tools_settings": "VST Tools Settings",
-        "vst_host_cli_path": "CLI host path",
-        "vst_host_gui_path": "GUI host path",
-        "vst_tools_note": "Paths are stored in settings and used by the batch processor.",
-        "vst_browse": "Browse",
-        "vst_host_note": "Requires external VST hosts: CLI accepts --input/--output/--chain; GUI opens plugin UI to save presets. Set paths in Settings > VST Tools.",
-        "vst_workers": "Parallel jobs",
-        "vst_back": "Back",
-        "vst_next": "Next",
-        "vst_process": "Process",
-        "vst_cancel": "Cancel",
-        "vst_no_files": "Select at least one audio file.",
-        "vst_no_chain": "Add at least one plugin to the chain.",
-        "vst_no_host": "Set a VST host (CLI) first.",
-        "vst_no_gui_host": "Set a VST host (GUI) first.",
-        "vst_no_plugin": "Select a plugin row first.",
-        "vst_preset_prompt": "Save preset as...",
-        "vst_gui_failed": "GUI host exited early. Check the path and build output.",
-        "vst_no_session": "Open or create a session first.",
-        "vst_backup_note": "Backup is created before processing.",
-        "vst_done": "Processing completed.",
-        "start_title": "Start",
-        "start_new": "New",
-        "start_open": "Open",
-        "start_recent": "Recent",
-        "recent_sessions": "Recent Sessions",
-        "current_item": "Current item: --",
-        "current_item_prefix": "Current item: ",
-        "current_note": "Current note: --",
-        "current_note_prefix": "Current note: ",
-        "record": "Record",
-        "stop": "Stop",
-        "rerecord": "Re-record",
-        "preview_bgm": "Preview BGM",
-        "preview_overlay": "Preview Overlay",
-        "bgm_during": "BGM during recording",
-        "auto_next": "Auto next item",
-        "bgm_level": "BGM level",
-        "bgm_overlay_level": "BGM overlay level",
-        "pre_roll": "Pre-roll (ms)",
-        "cut_selection": "Cut Selection",
-        "select_region": "Select Region",
-        "bgm_timing": "BGM timing",
-        "bpm": "BPM",
-        "mora_count": "Mora count",
-        "waveform": "Waveform",
-        "spectrum": "Spectrum",
-        "power": "Power",
-        "f0": "F0",
-        "recorded_f0": "Recorded F0",
-        "mel": "Mel",
-        "table_status": "Status",
-        "table_alias": "Alias",
-        "table_romaji": "Romaji",
-        "table_note": "Note",
-        "table_comment": "Comment",
-        "table_duration": "Duration",
-        "table_file": "File",
-        "recompute_note": "Recompute Note",
-        "new_session_title": "New Recording Session",
-        "session_name": "Session name",
-        "singer": "Singer",
-        "project_path": "Project path",
-        "browse": "Browse",
-        "sample_rate": "Sample rate",
-        "bit_depth": "Bit depth",
-        "channels": "Channels",
-        "output_prefix": "Output prefix",
-        "output_suffix": "Output suffix",
-        "session_note": "Target note",
-        "missing_data": "Missing data",
-        "name_required": "Name is required.",
-        "audio_devices_title": "Audio Devices",
-        "input_device": "Input device",
-        "output_device": "Output device",
-        "default": "Default",
-        "language_title": "Language",
-        "voicebank_options": "Voicebank Import Options",
-        "use_vb_bgm": "Use voicebank samples as BGM (per alias)",
-        "copy_oto": "Copy oto.ini to session",
-        "strip_oto_alias": "Strip prefix/suffix from oto aliases",
-        "bgm_mode_title": "BGM Note",
-        "bgm_note": "Note (e.g. A4)",
-        "bgm_duration": "Duration (sec)",
-        "bgm_mode": "Mode",
-        "bgm_replace": "Replace BGM",
-        "bgm_add": "Add overlay",
-        "bgm_metronome": "Metronome",
-        "import_reclist_title": "Import Reclist",
-        "import_reclist_question": "Replace current reclist or add new entries?",
-        "import_oremo_title": "Import OREMO Comment",
-        "import_oremo_question": "Replace current reclist or add/update comments?",
-        "add_entry": "Add Entry",
-        "delete_entry": "Delete Entry",
-        "delete_selected_title": "Delete recordings",
-        "delete_selected_prompt": "Delete {count} selected entries and their files?",
-        "alias": "Alias",
-        "note_optional": "Note (optional)",
-    },
-    "Русский": {
-        "app_title": "UTAU Voicebank Recorder",
-        "file": "Файл",
-        "import": "Импорт",
-        "settings": "Настройки",
-        "help": "Справка",
-        "about": "О программе",
-        "check_updates": "Проверить обновления...",
-        "about_title": "О программе AsoCorder",
-        "about_version": "Версия",
-        "about_github": "GitHub автора",
-        "about_youtube": "YouTube автора",
-        "about_releases": "Релизы",
-        "about_check_updates": "Проверить обновления",
-        "about_download_update": "Скачать обновление",
-        "about_downloading": "Скачиваю обновление...",
-        "about_checking": "Проверяю обновления...",
-        "about_latest": "Последняя",
-        "about_up_to_date": "Актуальная версия",
-        "about_update_available": "Доступна новая версия",
-        "about_update_failed": "Не удалось проверить обновления",
-        "about_current_newer": "Текущая версия новее, чем в релизах.",
-        "about_ignore_until_next": "Не беспокоить до следующего обновления",
-        "about_no_assets": "Архивы релиза не найдены.",
-        "about_download_done": "Обновление скачано.",
-        "about_download_failed": "Не удалось скачать обновление.",
-        "about_extracting": "Распаковка обновления...",
-        "about_extract_failed": "Не удалось распаковать обновление.",
-        "about_restart_required": "Перезапусти приложение для применения обновления.",
-        "session_settings": "Настройки сессии",
-        "session_settings_title": "Изменить настройки сессии",
-        "session_settings_note": "Изменения применяются к будущим записям.",
-        "session_settings_busy": "Остановите запись/прослушивание перед изменением настроек сессии.",
-        "rename_files_title": "Переименовать записи",
-        "rename_files_prompt": "Переименовать существующие файлы под новый префикс/суффикс?",
-        "rename_files_failed": "Не удалось переименовать один или несколько файлов.",
-        "edit": "Правка",
-        "new_session": "Новая сессия",
-        "open_session": "Открыть сессию",
-        "save_session": "Сохранить сессию",
-        "save_as": "Сохранить как",
-        "export_recordings": "Экспорт записей JSON",
-        "open_folder": "Открыть папку сессии",
-        "export_voicebank": "Экспорт войсбанка",
-        "edit_voicebank": "Редактировать войсбанк",
-        "export_voicebank_title": "Экспорт войсбанка",
-        "export_voicebank_done": "Войсбанк экспортирован.",
-        "voicebank_edit_title": "Редактировать войсбанк",
-        "voicebank_name": "Имя",
-        "voicebank_author": "Автор",
-        "voicebank_voice": "Голос",
-        "voicebank_web": "Сайт",
-        "voicebank_version": "Версия",
-        "voicebank_image": "Изображение",
-        "voicebank_sample": "Семпл",
-        "voicebank_portrait": "Портрет",
-        "voicebank_portrait_opacity": "Прозрачность портрета",
-        "voicebank_portrait_height": "Высота портрета",
-        "voicebank_text_encoding": "Кодировка текста",
-        "voicebank_txt_export": "Экспорт TXT",
-        "voicebank_singer_type": "Тип войсбанка",
-        "voicebank_phonemizer": "Фонемайзер по умолчанию",
-        "voicebank_use_filename": "Использовать имя файла как алиас",
-        "voicebank_other_info": "Прочее",
-        "voicebank_localized_names": "Локализованные имена",
-        "voicebank_add": "Добавить",
-        "voicebank_remove": "Удалить",
-        "voicebank_pick_image": "Выбрать изображение",
-        "voicebank_pick_sample": "Выбрать семпл",
-        "back_exit": "Назад / Выход",
-        "save_reclist_to": "Сохранить реклист как",
-        "import_reclist": "Импорт реклиста",
-        "import_oremo_comment": "Импорт OREMO Comment",
-        "import_voicebank": "Импорт войсбанка",
-        "import_bgm": "Импорт BGM WAV",
-        "generate_bgm": "Сгенерировать BGM ноту",
-        "audio_devices": "Аудиоустройства",
-        "language": "Язык",
-        "ui_settings": "Настройки UI",
-        "pitch_algorithm": "Алгоритм высоты (графики + нота)",
-        "pitch_algo_classic": "Классический (автокорр.)",
-        "pitch_algo_yin": "Новый (YIN)",
-        "note_workers": "Потоки анализа нот",
-        "hold_to_record": "Запись удержанием R (как в OREMO)",
-        "theme": "Тема",
-        "theme_light": "Светлая",
-        "theme_dark": "Темная",
-        "undo": "Отменить",
-        "start_title": "Старт",
-        "start_new": "Новая",
-        "start_open": "Открыть",
-        "start_recent": "Недавние",
-        "recent_sessions": "Последние сессии",
-        "current_item": "Текущий элемент: --",
-        "current_item_prefix": "Текущий элемент: ",
-        "current_note": "Текущая нота: --",
-        "current_note_prefix": "Текущая нота: ",
-        "record": "Запись",
-        "stop": "Стоп",
-        "rerecord": "Перезапись",
-        "preview_bgm": "Прослушать BGM",
-        "preview_overlay": "Прослушать оверлей",
-        "bgm_during": "BGM при записи",
-        "auto_next": "Автопереход",
-        "bgm_level": "Уровень BGM",
-        "bgm_overlay_level": "Уровень оверлея",
-        "pre_roll": "Предролл (мс)",
-        "cut_selection": "Вырезать выделение",
-        "select_region": "Выделить участок",
-        "bgm_timing": "Тайминг BGM",
-        "bpm": "BPM",
-        "mora_count": "Кол-во мор",
-        "waveform": "Вейвформа",
-        "spectrum": "Спектр",
-        "power": "Мощность",
-        "f0": "F0",
-        "recorded_f0": "F0 записи",
-        "mel": "Мел-спектр",
-        "table_status": "Статус",
-        "table_alias": "Алиас",
-        "table_romaji": "Ромадзи",
-        "table_note": "Нота",
-        "table_comment": "Комментарий",
-        "table_duration": "Длительность",
-        "table_file": "Файл",
-        "recompute_note": "Пересчитать ноту",
-        "new_session_title": "Новая сессия записи",
-        "session_name": "Имя сессии",
-        "singer": "Певец",
-        "project_path": "Путь проекта",
-        "browse": "Обзор",
-        "sample_rate": "Частота",
-        "bit_depth": "Битность",
-        "channels": "Каналы",
-        "output_prefix": "Префикс файла",
-        "output_suffix": "Суффикс файла",
-        "session_note": "Целевая нота",
-        "missing_data": "Недостаточно данных",
-        "name_required": "Имя обязательно.",
-        "audio_devices_title": "Аудиоустройства",
-        "input_device": "Входное устройство",
-        "output_device": "Выходное устройство",
-        "default": "По умолчанию",
-        "language_title": "Язык",
-        "voicebank_options": "Опции импорта voicebank",
-        "use_vb_bgm": "Использовать семплы voicebank как BGM (по алиасу)",
-        "copy_oto": "Копировать oto.ini в сессию",
-        "strip_oto_alias": "Убрать префикс/суффикс у алиасов oto",
-        "bgm_mode_title": "BGM нота",
-        "bgm_note": "Нота (например A4)",
-        "bgm_duration": "Длительность (сек)",
-        "bgm_mode": "Режим",
-        "bgm_replace": "Заменить BGM",
-        "bgm_add": "Добавить поверх",
-        "bgm_metronome": "Метроном",
-        "import_reclist_title": "Импорт реклиста",
-        "import_reclist_question": "Заменить текущий реклист или добавить новые?",
-        "import_oremo_title": "Импорт OREMO Comment",
-        "import_oremo_question": "Заменить текущий реклист или добавить/обновить комментарии?",
-        "add_entry": "Добавить",
-        "delete_entry": "Удалить",
-        "delete_selected_title": "Удалить записи",
-        "delete_selected_prompt": "Удалить выбранные записи ({count}) и их файлы?",
-        "alias": "Алиас",
-        "note_optional": "Нота (опц.)",
-    },
-    "日本語": {
-        "app_title": "UTAU Voicebank Recorder",
-        "file": "ファイル",
-        "import": "インポート",
-        "settings": "設定",
-        "help": "ヘルプ",
-        "about": "このソフトについて",
-        "check_updates": "更新を確認...",
-        "about_title": "AsoCorder について",
-        "about_version": "バージョン",
-        "about_github": "GitHub",
-        "about_youtube": "YouTube",
-        "about_releases": "リリース",
-        "about_check_updates": "更新を確認",
-        "about_download_update": "更新をダウンロード",
-        "about_downloading": "更新をダウンロード中...",
-        "about_checking": "更新を確認中...",
-        "about_latest": "最新",
-        "about_up_to_date": "最新です",
-        "about_update_available": "更新があります",
-        "about_update_failed": "更新確認に失敗しました",
-        "about_current_newer": "現在のバージョンは最新リリースより新しいです。",
-        "about_ignore_until_next": "次の更新まで通知しない",
-        "about_no_assets": "アーカイブが見つかりません。",
-        "about_download_done": "更新をダウンロードしました。",
-        "about_download_failed": "ダウンロードに失敗しました。",
-        "about_extracting": "更新を展開中...",
-        "about_extract_failed": "更新の展開に失敗しました。",
-        "about_restart_required": "更新を適用するには再起動してください。",
-        "session_settings": "セッション設定",
-        "session_settings_title": "セッション設定を編集",
-        "session_settings_note": "変更は今後の録音に適用されます。",
-        "session_settings_busy": "録音/プレビューを停止してからセッション設定を変更してください。",
-        "rename_files_title": "録音ファイルの名前変更",
-        "rename_files_prompt": "既存のファイルを新しいプレフィックス/サフィックスに合わせて名前変更しますか？",
-        "rename_files_failed": "一部のファイルの名前変更に失敗しました。",
-        "edit": "編集",
-        "new_session": "新規セッション",
-        "open_session": "セッションを開く",
-        "save_session": "セッションを保存",
-        "save_as": "名前を付けて保存",
-        "export_recordings": "録音一覧JSONを書き出し",
-        "open_folder": "セッションフォルダを開く",
-        "export_voicebank": "音源を書き出す",
-        "edit_voicebank": "音源を編集",
-        "export_voicebank_title": "音源を書き出す",
-        "export_voicebank_done": "音源を書き出しました。",
-        "voicebank_edit_title": "音源を編集",
-        "voicebank_name": "名前",
-        "voicebank_author": "作者",
-        "voicebank_voice": "声",
-        "voicebank_web": "ウェブ",
-        "voicebank_version": "バージョン",
-        "voicebank_image": "画像",
-        "voicebank_sample": "サンプル",
-        "voicebank_portrait": "ポートレート",
-        "voicebank_portrait_opacity": "ポートレート透明度",
-        "voicebank_portrait_height": "ポートレート高さ",
-        "voicebank_text_encoding": "テキストエンコード",
-        "voicebank_txt_export": "TXTエクスポート",
-        "voicebank_singer_type": "音源タイプ",
-        "voicebank_phonemizer": "デフォルト音素化",
-        "voicebank_use_filename": "ファイル名をエイリアスに使う",
-        "voicebank_other_info": "その他",
-        "voicebank_localized_names": "ローカライズ名",
-        "voicebank_add": "追加",
-        "voicebank_remove": "削除",
-        "voicebank_pick_image": "画像を選択",
-        "voicebank_pick_sample": "サンプルを選択",
-        "back_exit": "戻る / 終了",
-        "save_reclist_to": "レコリストを書き出し",
-        "import_reclist": "レコリストをインポート",
-        "import_oremo_comment": "OREMOコメントをインポート",
-        "import_voicebank": "音源をインポート",
-        "import_bgm": "BGM WAVをインポート",
-        "generate_bgm": "BGMノート生成",
-        "audio_devices": "オーディオデバイス",
-        "language": "言語",
-        "ui_settings": "UI設定",
-        "pitch_algorithm": "ピッチアルゴリズム（グラフ＋ノート）",
-        "pitch_algo_classic": "クラシック（自己相関）",
-        "pitch_algo_yin": "新しい（YIN）",
-        "note_workers": "ノート解析ワーカー数",
-        "hold_to_record": "Rキー長押しで録音（OREMO風）",
-        "theme": "テーマ",
-        "theme_light": "ライト",
-        "theme_dark": "ダーク",
-        "undo": "元に戻す",
-        "start_title": "スタート",
-        "start_new": "新規",
-        "start_open": "開く",
-        "start_recent": "最近",
-        "recent_sessions": "最近のセッション",
-        "current_item": "現在の項目: --",
-        "current_item_prefix": "現在の項目: ",
-        "current_note": "現在のノート: --",
-        "current_note_prefix": "現在のノート: ",
-        "record": "録音",
-        "stop": "停止",
-        "rerecord": "再録音",
-        "preview_bgm": "BGMプレビュー",
-        "preview_overlay": "オーバーレイプレビュー",
-        "bgm_during": "録音中BGM",
-        "auto_next": "自動で次へ",
-        "bgm_level": "BGMレベル",
-        "bgm_overlay_level": "BGMオーバーレイ",
-        "pre_roll": "プリロール (ms)",
-        "cut_selection": "選択範囲を削除",
-        "select_region": "範囲を選択",
-        "bgm_timing": "BGMタイミング",
-        "bpm": "BPM",
-        "mora_count": "モーラ数",
-        "waveform": "波形",
-        "spectrum": "スペクトル",
-        "power": "パワー",
-        "f0": "F0",
-        "recorded_f0": "録音F0",
-        "mel": "メル",
-        "table_status": "状態",
-        "table_alias": "エイリアス",
-        "table_romaji": "ローマ字",
-        "table_note": "ノート",
-        "table_comment": "コメント",
-        "table_duration": "長さ",
-        "table_file": "ファイル",
-        "recompute_note": "ノートを再計算",
-        "new_session_title": "新規録音セッション",
-        "session_name": "セッション名",
-        "singer": "歌い手",
-        "project_path": "プロジェクトパス",
-        "browse": "参照",
-        "sample_rate": "サンプルレート",
-        "bit_depth": "ビット深度",
-        "channels": "チャンネル",
-        "output_prefix": "出力プレフィックス",
-        "output_suffix": "出力サフィックス",
-        "session_note": "ターゲットノート",
-        "missing_data": "データ不足",
-        "name_required": "名前が必要です。",
-        "audio_devices_title": "オーディオデバイス",
-        "input_device": "入力デバイス",
-        "output_device": "出力デバイス",
-        "default": "既定",
-        "language_title": "言語",
-        "voicebank_options": "音源インポート設定",
-        "use_vb_bgm": "音源サンプルをBGMとして使用 (エイリアス毎)",
-        "copy_oto": "oto.iniをセッションにコピー",
-        "strip_oto_alias": "otoのエイリアスから接頭/接尾を除去",
-        "bgm_mode_title": "BGMノート",
-        "bgm_note": "ノート (例 A4)",
-        "bgm_duration": "長さ (秒)",
-        "bgm_mode": "モード",
-        "bgm_replace": "BGMを置換",
-        "bgm_add": "上に追加",
-        "bgm_metronome": "メトロノーム",
-        "import_reclist_title": "レコリストをインポート",
-        "import_reclist_question": "既存を置換しますか？それとも追加しますか？",
-        "import_oremo_title": "OREMOコメントをインポート",
-        "import_oremo_question": "既存を置換しますか？それともコメントを追加・更新しますか？",
-        "add_entry": "追加",
-        "delete_entry": "削除",
-        "delete_selected_title": "録音を削除",
-        "delete_selected_prompt": "選択した{count}件とファイルを削除しますか？",
-        "alias": "エイリアス",
-        "note_optional": "ノート (任意)",
-    },
-}
+
+@lru_cache(maxsize=1)
+def _translations_class() -> type:
+    keys = tuple(_load_language("en"))
+    return type("Translations", (), {"__slots__": keys, "__getattr__": _missing_translation})
+
+
+@lru_cache(maxsize=4)
+def tr_obj(lang: str):
+    translations = _translations_class()()
+    for key, value in _translation_table(lang).items():
+        setattr(translations, key, value)
+    return translations
+
+
+@lru_cache(maxsize=1)
+def _app_icon() -> Optional[QtGui.QIcon]:
+    return QtGui.QIcon(str(APP_ICON_PATH)) if APP_ICON_PATH.exists() else None
+
+
+@lru_cache(maxsize=8)
+def _heading_font(pixel_size: int, weight: QtGui.QFont.Weight) -> QtGui.QFont:
+    font = QtGui.QFont()
+    font.setPixelSize(pixel_size)
+    font.setWeight(weight)
+    return font
+
+
+def _recent_session_summary(path: str, cached: Optional[list]) -> Optional[list]:
+    try:
+        stamp = session_file(Path(path)).stat().st_mtime_ns
+        if cached and cached[0] == stamp:
+            return cached
+        return [stamp, *load_session_summary(Path(path))]
+    except Exception:
+        return None
 
 
 def tr(lang: str, key: str) -> str:
-    table = TRANSLATIONS.get(lang) or TRANSLATIONS["English"]
-    return table.get(key, TRANSLATIONS["English"].get(key, key))
+    return _translation_table(lang).get(key, key)
 
 
 class NewSessionDialog(QtWidgets.QDialog):
     def __init__(self, lang: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "new_session_title"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.new_session_title)
         layout = QtWidgets.QFormLayout(self)
 
         self.name_edit = QtWidgets.QLineEdit()
         self.singer_edit = QtWidgets.QLineEdit()
         self.path_edit = QtWidgets.QLineEdit()
-        browse_btn = QtWidgets.QPushButton(tr(self.lang, "browse"))
+        browse_btn = QtWidgets.QPushButton(self._t.browse)
         browse_btn.clicked.connect(self._browse)
 
         path_layout = QtWidgets.QHBoxLayout()
@@ -831,15 +497,15 @@ class NewSessionDialog(QtWidgets.QDialog):
         self.note_edit = QtWidgets.QLineEdit()
         self.note_edit.setPlaceholderText("A4")
 
-        layout.addRow(tr(self.lang, "session_name"), self.name_edit)
-        layout.addRow(tr(self.lang, "singer"), self.singer_edit)
-        layout.addRow(tr(self.lang, "project_path"), path_layout)
-        layout.addRow(tr(self.lang, "sample_rate"), self.sr_spin)
-        layout.addRow(tr(self.lang, "bit_depth"), self.bit_depth_combo)
-        layout.addRow(tr(self.lang, "channels"), self.channels_combo)
-        layout.addRow(tr(self.lang, "output_prefix"), self.output_prefix_edit)
-        layout.addRow(tr(self.lang, "output_suffix"), self.output_suffix_edit)
-        layout.addRow(tr(self.lang, "session_note"), self.note_edit)
+        layout.addRow(self._t.session_name, self.name_edit)
+        layout.addRow(self._t.singer, self.singer_edit)
+        layout.addRow(self._t.project_path, path_layout)
+        layout.addRow(self._t.sample_rate, self.sr_spin)
+        layout.addRow(self._t.bit_depth, self.bit_depth_combo)
+        layout.addRow(self._t.channels, self.channels_combo)
+        layout.addRow(self._t.output_prefix, self.output_prefix_edit)
+        layout.addRow(self._t.output_suffix, self.output_suffix_edit)
+        layout.addRow(self._t.session_note, self.note_edit)
 
         buttons = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Ok
@@ -860,7 +526,7 @@ class NewSessionDialog(QtWidgets.QDialog):
         name = self.name_edit.text().strip()
         path = self.path_edit.text().strip()
         if not name:
-            QtWidgets.QMessageBox.warning(self, tr(self.lang, "missing_data"), tr(self.lang, "name_required"))
+            QtWidgets.QMessageBox.warning(self, self._t.missing_data, self._t.name_required)
             return None
         singer = self.singer_edit.text().strip() or "Unknown"
         if not path:
@@ -882,7 +548,8 @@ class SessionSettingsDialog(QtWidgets.QDialog):
     def __init__(self, lang: str, session: Session, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "session_settings_title"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.session_settings_title)
         layout = QtWidgets.QFormLayout(self)
 
         self.sr_spin = QtWidgets.QSpinBox()
@@ -903,14 +570,14 @@ class SessionSettingsDialog(QtWidgets.QDialog):
         self.note_edit = QtWidgets.QLineEdit(session.target_note or "")
         self.note_edit.setPlaceholderText("A4")
 
-        layout.addRow(tr(self.lang, "sample_rate"), self.sr_spin)
-        layout.addRow(tr(self.lang, "bit_depth"), self.bit_depth_combo)
-        layout.addRow(tr(self.lang, "channels"), self.channels_combo)
-        layout.addRow(tr(self.lang, "output_prefix"), self.output_prefix_edit)
-        layout.addRow(tr(self.lang, "output_suffix"), self.output_suffix_edit)
-        layout.addRow(tr(self.lang, "session_note"), self.note_edit)
+        layout.addRow(self._t.sample_rate, self.sr_spin)
+        layout.addRow(self._t.bit_depth, self.bit_depth_combo)
+        layout.addRow(self._t.channels, self.channels_combo)
+        layout.addRow(self._t.output_prefix, self.output_prefix_edit)
+        layout.addRow(self._t.output_suffix, self.output_suffix_edit)
+        layout.addRow(self._t.session_note, self.note_edit)
 
-        note_label = QtWidgets.QLabel(tr(self.lang, "session_settings_note"))
+        note_label = QtWidgets.QLabel(self._t.session_settings_note)
         note_label.setWordWrap(True)
         layout.addRow(note_label)
 
@@ -936,8 +603,11 @@ class SessionSettingsDialog(QtWidgets.QDialog):
 
 
 class NoteAxis(pg.AxisItem):
+    _NOTE_NAMES = [midi_to_note(i) for i in range(128)]
+
     def tickStrings(self, values, scale, spacing):
-        return [midi_to_note(v) for v in values]
+        names = self._NOTE_NAMES
+        return [names[i] if 0 <= (i := round(v)) < 128 else midi_to_note(v) for v in values]
 
 
 class NoteTableItem(QtWidgets.QTableWidgetItem):
@@ -945,25 +615,48 @@ class NoteTableItem(QtWidgets.QTableWidgetItem):
         super().__init__(text)
         self._priority = priority
 
+    def set_note(self, text: str, priority: int) -> None:
+        self._priority = priority
+        self.setText(text)
+
     def __lt__(self, other: QtWidgets.QTableWidgetItem) -> bool:
         if isinstance(other, NoteTableItem) and self._priority != other._priority:
             return self._priority < other._priority
         return super().__lt__(other)
 
 
+_device_cache: Optional[list] = None
+_device_cache_lock = threading.Lock()
+
+
+def query_devices_cached() -> list:
+    global _device_cache
+    with _device_cache_lock:
+        if _device_cache is None:
+            _device_cache = list(sd.query_devices())
+        return _device_cache
+
+
+def invalidate_device_cache() -> None:
+    global _device_cache
+    with _device_cache_lock:
+        _device_cache = None
+
+
 class AudioSettingsDialog(QtWidgets.QDialog):
     def __init__(self, lang: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "audio_devices_title"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.audio_devices_title)
         layout = QtWidgets.QFormLayout(self)
 
         self.input_combo = QtWidgets.QComboBox()
         self.output_combo = QtWidgets.QComboBox()
         self._populate_devices()
 
-        layout.addRow(tr(self.lang, "input_device"), self.input_combo)
-        layout.addRow(tr(self.lang, "output_device"), self.output_combo)
+        layout.addRow(self._t.input_device, self.input_combo)
+        layout.addRow(self._t.output_device, self.output_combo)
 
         buttons = QtWidgets.QDialogButtonBox(
             QtWidgets.QDialogButtonBox.StandardButton.Ok
@@ -974,31 +667,48 @@ class AudioSettingsDialog(QtWidgets.QDialog):
         layout.addWidget(buttons)
 
     def _populate_devices(self) -> None:
-        self.input_combo.addItem(tr(self.lang, "default"), None)
-        self.output_combo.addItem(tr(self.lang, "default"), None)
-        devices = sd.query_devices()
+        default_label = self._t.default
+        inputs = [self._combo_entry(default_label, None)]
+        outputs = [self._combo_entry(default_label, None)]
+        devices = query_devices_cached()
         for idx, dev in enumerate(devices):
-            name = dev["name"]
+            label = f"{idx}: {dev['name']}"
             if dev["max_input_channels"] > 0:
-                self.input_combo.addItem(f"{idx}: {name}", idx)
+                inputs.append(self._combo_entry(label, idx))
             if dev["max_output_channels"] > 0:
-                self.output_combo.addItem(f"{idx}: {name}", idx)
+                outputs.append(self._combo_entry(label, idx))
+        self._input_index = {entry.data(QtCore.Qt.ItemDataRole.UserRole): row for row, entry in enumerate(inputs)}
+        self._output_index = {entry.data(QtCore.Qt.ItemDataRole.UserRole): row for row, entry in enumerate(outputs)}
+        for combo, entries in ((self.input_combo, inputs), (self.output_combo, outputs)):
+            combo.blockSignals(True)
+            combo.setUpdatesEnabled(False)
+            try:
+                combo.model().invisibleRootItem().appendRows(entries)
+            finally:
+                combo.setUpdatesEnabled(True)
+                combo.blockSignals(False)
+
+    @staticmethod
+    def _combo_entry(label: str, value: Optional[int]) -> QtGui.QStandardItem:
+        entry = QtGui.QStandardItem(label)
+        entry.setData(value, QtCore.Qt.ItemDataRole.UserRole)
+        return entry
 
     def set_selected(self, input_dev: Optional[int], output_dev: Optional[int]) -> None:
-        self._select_combo(self.input_combo, input_dev)
-        self._select_combo(self.output_combo, output_dev)
+        self._select_combo(self.input_combo, self._input_index, input_dev)
+        self._select_combo(self.output_combo, self._output_index, output_dev)
 
     def get_selected(self) -> tuple[Optional[int], Optional[int]]:
         return self.input_combo.currentData(), self.output_combo.currentData()
 
     @staticmethod
-    def _select_combo(combo: QtWidgets.QComboBox, value: Optional[int]) -> None:
-        for i in range(combo.count()):
-            if combo.itemData(i) == value:
-                combo.setCurrentIndex(i)
-                return
+    def _select_combo(combo: QtWidgets.QComboBox, index: dict[Optional[int], int], value: Optional[int]) -> None:
+        row = index.get(value)
+        if row is not None:
+            combo.setCurrentIndex(row)
 
 
+@lru_cache(maxsize=8)
 def _default_tool_path(name: str) -> str:
     exe = f"{name}.exe" if sys.platform == "win32" else name
     return str(Path.cwd() / "tools" / exe)
@@ -1008,8 +718,10 @@ class VstToolsDialog(QtWidgets.QDialog):
     def __init__(self, lang: str, settings: QtCore.QSettings, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
+        self._t = tr_obj(lang)
         self.settings = settings
-        self.setWindowTitle(tr(self.lang, "vst_tools_settings"))
+        self.setStyleSheet("#vstToolsNote { color: #666666; }")
+        self.setWindowTitle(self._t.vst_tools_settings)
         layout = QtWidgets.QFormLayout(self)
 
         self.cli_edit = QtWidgets.QLineEdit(
@@ -1021,20 +733,20 @@ class VstToolsDialog(QtWidgets.QDialog):
 
         cli_row = QtWidgets.QHBoxLayout()
         cli_row.addWidget(self.cli_edit)
-        self.cli_browse_btn = QtWidgets.QPushButton(tr(self.lang, "vst_browse"))
+        self.cli_browse_btn = QtWidgets.QPushButton(self._t.vst_browse)
         self.cli_browse_btn.clicked.connect(lambda: self._browse(self.cli_edit))
         cli_row.addWidget(self.cli_browse_btn)
 
         gui_row = QtWidgets.QHBoxLayout()
         gui_row.addWidget(self.gui_edit)
-        self.gui_browse_btn = QtWidgets.QPushButton(tr(self.lang, "vst_browse"))
+        self.gui_browse_btn = QtWidgets.QPushButton(self._t.vst_browse)
         self.gui_browse_btn.clicked.connect(lambda: self._browse(self.gui_edit))
         gui_row.addWidget(self.gui_browse_btn)
 
-        layout.addRow(tr(self.lang, "vst_host_cli_path"), cli_row)
-        layout.addRow(tr(self.lang, "vst_host_gui_path"), gui_row)
-        note = QtWidgets.QLabel(tr(self.lang, "vst_tools_note"))
-        note.setStyleSheet("color: #666666;")
+        layout.addRow(self._t.vst_host_cli_path, cli_row)
+        layout.addRow(self._t.vst_host_gui_path, gui_row)
+        note = QtWidgets.QLabel(self._t.vst_tools_note)
+        note.setObjectName("vstToolsNote")
         note.setWordWrap(True)
         layout.addRow(note)
 
@@ -1047,7 +759,7 @@ class VstToolsDialog(QtWidgets.QDialog):
         layout.addRow(buttons)
 
     def _browse(self, target: QtWidgets.QLineEdit) -> None:
-        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, tr(self.lang, "vst_browse"), "", "Executable (*)")
+        path, _ = QtWidgets.QFileDialog.getOpenFileName(self, self._t.vst_browse, "", "Executable (*)")
         if path:
             target.setText(path)
 
@@ -1069,17 +781,18 @@ class UiSettingsDialog(QtWidgets.QDialog):
     ) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "ui_settings"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.ui_settings)
         layout = QtWidgets.QFormLayout(self)
         self.lang_combo = QtWidgets.QComboBox()
-        self.lang_combo.addItems(["English", "Русский", "日本語"])
+        self.lang_combo.addItems(list(LANGUAGE_CODES))
         if current_lang:
             idx = self.lang_combo.findText(current_lang)
             if idx >= 0:
                 self.lang_combo.setCurrentIndex(idx)
         self.theme_combo = QtWidgets.QComboBox()
-        self.theme_combo.addItem(tr(self.lang, "theme_light"), "light")
-        self.theme_combo.addItem(tr(self.lang, "theme_dark"), "dark")
+        self.theme_combo.addItem(self._t.theme_light, "light")
+        self.theme_combo.addItem(self._t.theme_dark, "dark")
         if current_theme_key:
             for i in range(self.theme_combo.count()):
                 if self.theme_combo.itemData(i) == current_theme_key:
@@ -1087,8 +800,8 @@ class UiSettingsDialog(QtWidgets.QDialog):
                     break
 
         self.pitch_combo = QtWidgets.QComboBox()
-        self.pitch_combo.addItem(tr(self.lang, "pitch_algo_classic"), "classic")
-        self.pitch_combo.addItem(tr(self.lang, "pitch_algo_yin"), "yin")
+        self.pitch_combo.addItem(self._t.pitch_algo_classic, "classic")
+        self.pitch_combo.addItem(self._t.pitch_algo_yin, "yin")
         if current_pitch_algo:
             for i in range(self.pitch_combo.count()):
                 if self.pitch_combo.itemData(i) == current_pitch_algo:
@@ -1100,13 +813,13 @@ class UiSettingsDialog(QtWidgets.QDialog):
         if current_note_workers:
             self.note_workers_spin.setValue(int(current_note_workers))
 
-        self.hold_to_record_check = QtWidgets.QCheckBox(tr(self.lang, "hold_to_record"))
+        self.hold_to_record_check = QtWidgets.QCheckBox(self._t.hold_to_record)
         self.hold_to_record_check.setChecked(bool(current_hold_to_record))
 
-        layout.addRow(tr(self.lang, "language"), self.lang_combo)
-        layout.addRow(tr(self.lang, "theme"), self.theme_combo)
-        layout.addRow(tr(self.lang, "pitch_algorithm"), self.pitch_combo)
-        layout.addRow(tr(self.lang, "note_workers"), self.note_workers_spin)
+        layout.addRow(self._t.language, self.lang_combo)
+        layout.addRow(self._t.theme, self.theme_combo)
+        layout.addRow(self._t.pitch_algorithm, self.pitch_combo)
+        layout.addRow(self._t.note_workers, self.note_workers_spin)
         layout.addRow(self.hold_to_record_check)
 
         buttons = QtWidgets.QDialogButtonBox(
@@ -1131,15 +844,16 @@ class VoicebankImportDialog(QtWidgets.QDialog):
     def __init__(self, lang: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "voicebank_options"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.voicebank_options)
         layout = QtWidgets.QVBoxLayout(self)
-        self.use_bgm_checkbox = QtWidgets.QCheckBox(tr(self.lang, "use_vb_bgm"))
+        self.use_bgm_checkbox = QtWidgets.QCheckBox(self._t.use_vb_bgm)
         self.use_bgm_checkbox.setChecked(True)
         layout.addWidget(self.use_bgm_checkbox)
-        self.copy_oto_checkbox = QtWidgets.QCheckBox(tr(self.lang, "copy_oto"))
+        self.copy_oto_checkbox = QtWidgets.QCheckBox(self._t.copy_oto)
         self.copy_oto_checkbox.setChecked(True)
         layout.addWidget(self.copy_oto_checkbox)
-        self.strip_oto_checkbox = QtWidgets.QCheckBox(tr(self.lang, "strip_oto_alias"))
+        self.strip_oto_checkbox = QtWidgets.QCheckBox(self._t.strip_oto_alias)
         self.strip_oto_checkbox.setChecked(False)
         layout.addWidget(self.strip_oto_checkbox)
 
@@ -1161,78 +875,130 @@ class VoicebankImportDialog(QtWidgets.QDialog):
         return self.strip_oto_checkbox.isChecked()
 
 
+class RecentSessionsModel(QtCore.QAbstractListModel):
+    EntryRole = QtCore.Qt.ItemDataRole.UserRole
+    PathRole = QtCore.Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, entries: list[dict], parent: Optional[QtCore.QObject] = None) -> None:
+        super().__init__(parent)
+        self._entries = entries
+
+    def rowCount(self, parent: QtCore.QModelIndex = QtCore.QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._entries)
+
+    def data(self, index: QtCore.QModelIndex, role: int = QtCore.Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        entry = self._entries[index.row()]
+        if role == QtCore.Qt.ItemDataRole.DisplayRole:
+            return entry["title"]
+        if role == self.PathRole:
+            return entry["path"]
+        if role == self.EntryRole:
+            return entry
+        return None
+
+
+class RecentSessionDelegate(QtWidgets.QStyledItemDelegate):
+    def __init__(self, parent: QtWidgets.QWidget) -> None:
+        super().__init__(parent)
+        self._title_font = QtGui.QFont(parent.font())
+        self._title_font.setWeight(QtGui.QFont.Weight.DemiBold)
+        self._path_font = QtGui.QFont(parent.font())
+        self._path_font.setPixelSize(11)
+        self._path_color = QtGui.QColor("#808080")
+        self._title_height = QtGui.QFontMetrics(self._title_font).height()
+        self._size_hint = QtCore.QSize(0, self._title_height + QtGui.QFontMetrics(self._path_font).height() + 8)
+
+    def paint(self, painter: QtGui.QPainter, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> None:
+        opt = QtWidgets.QStyleOptionViewItem(option)
+        self.initStyleOption(opt, index)
+        opt.text = ""
+        style = opt.widget.style() if opt.widget else QtWidgets.QApplication.style()
+        style.drawControl(QtWidgets.QStyle.ControlElement.CE_ItemViewItem, opt, painter, opt.widget)
+        rect = option.rect.adjusted(8, 4, -8, -4)
+        align = QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignTop
+        painter.save()
+        painter.setFont(self._title_font)
+        painter.setPen(option.palette.color(QtGui.QPalette.ColorRole.Text))
+        painter.drawText(rect, align, index.data())
+        painter.setFont(self._path_font)
+        painter.setPen(self._path_color)
+        painter.drawText(rect.adjusted(0, self._title_height, 0, 0), align, index.data(RecentSessionsModel.PathRole))
+        painter.restore()
+
+    def sizeHint(self, option: QtWidgets.QStyleOptionViewItem, index: QtCore.QModelIndex) -> QtCore.QSize:
+        return self._size_hint
+
+
 class StartDialog(QtWidgets.QDialog):
+    _STYLE_SHEET = (
+        "#startTitle { font-size: 26px; font-weight: 700; }"
+        "#startSubtitle { color: #808080; }"
+        "#startRecentTitle { font-size: 16px; font-weight: 600; }"
+        "#startFooter { color: #888888; font-size: 10px; }"
+        'QPushButton[role="card"] { font-size: 16px; padding: 12px 18px; }'
+        "#startRecentList::item { padding: 2px; }"
+        "#startRecentList::item:hover { background: #e6f0ff; }"
+        "#startRecentList::item:selected { background: #cfe3ff; }"
+    )
+
     def __init__(self, lang: str, recent: list[dict], parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "recent_sessions"))
+        self._t = tr_obj(lang)
+        self.setStyleSheet(self._STYLE_SHEET)
+        self.setWindowTitle(self._t.recent_sessions)
         self.resize(860, 540)
         layout = QtWidgets.QVBoxLayout(self)
         layout.setContentsMargins(24, 24, 24, 24)
         layout.setSpacing(18)
 
         menubar = QtWidgets.QMenuBar(self)
-        file_menu = menubar.addMenu(tr(self.lang, "file"))
-        new_action = file_menu.addAction(tr(self.lang, "new_session"))
-        open_action = file_menu.addAction(tr(self.lang, "open_session"))
+        file_menu = menubar.addMenu(self._t.file)
+        new_action = file_menu.addAction(self._t.new_session)
+        open_action = file_menu.addAction(self._t.open_session)
         file_menu.addSeparator()
-        close_action = file_menu.addAction(tr(self.lang, "stop"))
-        settings_menu = menubar.addMenu(tr(self.lang, "settings"))
-        ui_action = settings_menu.addAction(tr(self.lang, "ui_settings"))
-        help_menu = menubar.addMenu(tr(self.lang, "help"))
-        about_action = help_menu.addAction(tr(self.lang, "about"))
+        close_action = file_menu.addAction(self._t.stop)
+        settings_menu = menubar.addMenu(self._t.settings)
+        ui_action = settings_menu.addAction(self._t.ui_settings)
+        help_menu = menubar.addMenu(self._t.help)
+        about_action = help_menu.addAction(self._t.about)
         layout.setMenuBar(menubar)
 
-        title = QtWidgets.QLabel(tr(self.lang, "start_title"))
-        title.setStyleSheet("font-size: 26px; font-weight: 700;")
-        subtitle = QtWidgets.QLabel(tr(self.lang, "recent_sessions"))
-        subtitle.setStyleSheet("color: #808080;")
+        title = QtWidgets.QLabel(self._t.start_title)
+        title.setObjectName("startTitle")
+        subtitle = QtWidgets.QLabel(self._t.recent_sessions)
+        subtitle.setObjectName("startSubtitle")
         layout.addWidget(title)
         layout.addWidget(subtitle)
 
         cards = QtWidgets.QHBoxLayout()
         cards.setSpacing(16)
-        self.new_btn = QtWidgets.QPushButton(tr(self.lang, "start_new"))
-        self.open_btn = QtWidgets.QPushButton(tr(self.lang, "start_open"))
+        self.new_btn = QtWidgets.QPushButton(self._t.start_new)
+        self.open_btn = QtWidgets.QPushButton(self._t.start_open)
         for btn in (self.new_btn, self.open_btn):
             btn.setMinimumHeight(64)
-            btn.setStyleSheet(
-                "QPushButton { font-size: 16px; padding: 12px 18px; }"
-            )
+            btn.setProperty("role", "card")
         cards.addWidget(self.new_btn)
         cards.addWidget(self.open_btn)
         layout.addLayout(cards)
 
-        recent_title = QtWidgets.QLabel(tr(self.lang, "start_recent"))
-        recent_title.setStyleSheet("font-size: 16px; font-weight: 600;")
+        recent_title = QtWidgets.QLabel(self._t.start_recent)
+        recent_title.setObjectName("startRecentTitle")
         layout.addWidget(recent_title)
-        self.list_widget = QtWidgets.QListWidget()
+        self.list_widget = QtWidgets.QListView()
+        self.list_widget.setObjectName("startRecentList")
+        self.list_widget.setUniformItemSizes(True)
+        self.list_widget.setLayoutMode(QtWidgets.QListView.LayoutMode.Batched)
+        self.list_widget.setBatchSize(64)
+        self.list_widget.setEditTriggers(QtWidgets.QAbstractItemView.EditTrigger.NoEditTriggers)
         self.list_widget.setAlternatingRowColors(True)
         self.list_widget.setMinimumHeight(260)
         self.list_widget.setSelectionMode(QtWidgets.QAbstractItemView.SelectionMode.SingleSelection)
         self.list_widget.setMouseTracking(True)
-        self.list_widget.setStyleSheet(
-            "QListWidget::item { padding: 2px; }"
-            "QListWidget::item:hover { background: #e6f0ff; }"
-            "QListWidget::item:selected { background: #cfe3ff; }"
-        )
-        for entry in recent:
-            item = QtWidgets.QListWidgetItem()
-            item.setFlags(item.flags() | QtCore.Qt.ItemFlag.ItemIsSelectable | QtCore.Qt.ItemFlag.ItemIsEnabled)
-            widget = QtWidgets.QWidget()
-            v = QtWidgets.QVBoxLayout(widget)
-            v.setContentsMargins(8, 4, 8, 4)
-            title_label = QtWidgets.QLabel(entry["title"])
-            title_label.setStyleSheet("font-weight: 600;")
-            path_label = QtWidgets.QLabel(entry["path"])
-            path_label.setStyleSheet("color: #808080; font-size: 11px;")
-            v.addWidget(title_label)
-            v.addWidget(path_label)
-            item.setSizeHint(widget.sizeHint())
-            self.list_widget.addItem(item)
-            self.list_widget.setItemWidget(item, widget)
-        self.list_widget.setCurrentRow(-1)
-        self.list_widget.clearSelection()
+        self.list_widget.setModel(RecentSessionsModel(recent, self.list_widget))
+        self.list_widget.setItemDelegate(RecentSessionDelegate(self.list_widget))
         layout.addWidget(self.list_widget, 1)
 
         buttons = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.StandardButton.Close)
@@ -1243,7 +1009,7 @@ class StartDialog(QtWidgets.QDialog):
         footer = QtWidgets.QLabel(
             f'{APP_NAME} (v{APP_VERSION}) <a href="{GITHUB_URL}">{GITHUB_URL}</a>'
         )
-        footer.setStyleSheet("color: #888888; font-size: 10px;")
+        footer.setObjectName("startFooter")
         footer.setTextFormat(QtCore.Qt.TextFormat.RichText)
         footer.setTextInteractionFlags(QtCore.Qt.TextInteractionFlag.TextBrowserInteraction)
         footer.setOpenExternalLinks(True)
@@ -1253,7 +1019,7 @@ class StartDialog(QtWidgets.QDialog):
 
         self.new_btn.clicked.connect(self._new_clicked)
         self.open_btn.clicked.connect(self._open_clicked)
-        self.list_widget.itemDoubleClicked.connect(self._recent_clicked)
+        self.list_widget.doubleClicked.connect(self._recent_clicked)
         new_action.triggered.connect(self._new_clicked)
         open_action.triggered.connect(self._open_clicked)
         close_action.triggered.connect(self.reject)
@@ -1262,7 +1028,6 @@ class StartDialog(QtWidgets.QDialog):
 
         self.action: Optional[str] = None
         self.selected_path: Optional[str] = None
-        self._recent_entries = recent
         self.closed_via_x = False
 
     def _new_clicked(self) -> None:
@@ -1273,11 +1038,11 @@ class StartDialog(QtWidgets.QDialog):
         self.action = "open"
         self.accept()
 
-    def _recent_clicked(self, item: QtWidgets.QListWidgetItem) -> None:
+    def _recent_clicked(self, index: QtCore.QModelIndex) -> None:
         self.action = "recent"
-        row = self.list_widget.row(item)
-        if 0 <= row < len(self._recent_entries):
-            self.selected_path = self._recent_entries[row]["full_path"]
+        entry = index.data(RecentSessionsModel.EntryRole)
+        if entry:
+            self.selected_path = entry["full_path"]
         self.accept()
 
     def _ui_clicked(self) -> None:
@@ -1364,7 +1129,8 @@ class AboutDialog(QtWidgets.QDialog):
     def __init__(self, lang: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "about_title"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.about_title)
         self.setMinimumWidth(420)
         self._worker: Optional[UpdateCheckWorker] = None
         self._download_worker: Optional[UpdateDownloadWorker] = None
@@ -1376,16 +1142,16 @@ class AboutDialog(QtWidgets.QDialog):
 
         layout = QtWidgets.QVBoxLayout(self)
         title = QtWidgets.QLabel(APP_NAME)
-        title.setStyleSheet("font-size: 22px; font-weight: 700;")
+        title.setFont(_heading_font(22, QtGui.QFont.Weight.Bold))
         layout.addWidget(title)
 
-        version = QtWidgets.QLabel(f"{tr(self.lang, 'about_version')}: v{APP_VERSION}")
+        version = QtWidgets.QLabel(f"{self._t.about_version}: v{APP_VERSION}")
         layout.addWidget(version)
 
         link_row = QtWidgets.QHBoxLayout()
-        self.github_btn = QtWidgets.QPushButton(tr(self.lang, "about_github"))
-        self.releases_btn = QtWidgets.QPushButton(tr(self.lang, "about_releases"))
-        self.youtube_btn = QtWidgets.QPushButton(tr(self.lang, "about_youtube"))
+        self.github_btn = QtWidgets.QPushButton(self._t.about_github)
+        self.releases_btn = QtWidgets.QPushButton(self._t.about_releases)
+        self.youtube_btn = QtWidgets.QPushButton(self._t.about_youtube)
         link_row.addWidget(self.github_btn)
         link_row.addWidget(self.releases_btn)
         link_row.addWidget(self.youtube_btn)
@@ -1414,10 +1180,14 @@ class AboutDialog(QtWidgets.QDialog):
         QtGui.QDesktopServices.openUrl(QtCore.QUrl(url))
 
 class BgmNoteDialog(QtWidgets.QDialog):
+    _TIMING_INDEX = 0
+    _METRONOME_INDEX = 2
+
     def __init__(self, lang: str, parent: Optional[QtWidgets.QWidget] = None) -> None:
         super().__init__(parent)
         self.lang = lang
-        self.setWindowTitle(tr(self.lang, "bgm_mode_title"))
+        self._t = tr_obj(lang)
+        self.setWindowTitle(self._t.bgm_mode_title)
         layout = QtWidgets.QFormLayout(self)
 
         self.note_edit = QtWidgets.QLineEdit()
@@ -1426,12 +1196,12 @@ class BgmNoteDialog(QtWidgets.QDialog):
         self.duration_spin.setSingleStep(0.1)
         self.duration_spin.setValue(2.0)
         self.timing_combo = QtWidgets.QComboBox()
-        self.timing_combo.addItems([tr(self.lang, "bgm_timing"), tr(self.lang, "bgm_duration")])
+        self.timing_combo.addItems([self._t.bgm_timing, self._t.bgm_duration])
         self.mode_combo = QtWidgets.QComboBox()
         self.mode_combo.addItems([
-            tr(self.lang, "bgm_replace"),
-            tr(self.lang, "bgm_add"),
-            tr(self.lang, "bgm_metronome"),
+            self._t.bgm_replace,
+            self._t.bgm_add,
+            self._t.bgm_metronome,
         ])
         self.bpm_spin = QtWidgets.QSpinBox()
         self.bpm_spin.setRange(40, 240)
@@ -1440,12 +1210,12 @@ class BgmNoteDialog(QtWidgets.QDialog):
         self.mora_spin.setRange(1, 32)
         self.mora_spin.setValue(4)
 
-        self.note_label = QtWidgets.QLabel(tr(self.lang, "bgm_note"))
-        self.mode_label = QtWidgets.QLabel(tr(self.lang, "bgm_mode"))
-        self.timing_label = QtWidgets.QLabel(tr(self.lang, "bgm_timing"))
-        self.duration_label = QtWidgets.QLabel(tr(self.lang, "bgm_duration"))
-        self.bpm_label = QtWidgets.QLabel(tr(self.lang, "bpm"))
-        self.mora_label = QtWidgets.QLabel(tr(self.lang, "mora_count"))
+        self.note_label = QtWidgets.QLabel(self._t.bgm_note)
+        self.mode_label = QtWidgets.QLabel(self._t.bgm_mode)
+        self.timing_label = QtWidgets.QLabel(self._t.bgm_timing)
+        self.duration_label = QtWidgets.QLabel(self._t.bgm_duration)
+        self.bpm_label = QtWidgets.QLabel(self._t.bpm)
+        self.mora_label = QtWidgets.QLabel(self._t.mora_count)
 
         layout.addRow(self.note_label, self.note_edit)
         layout.addRow(self.mode_label, self.mode_combo)
@@ -1466,9 +1236,8 @@ class BgmNoteDialog(QtWidgets.QDialog):
         self._update_visibility()
 
     def _update_visibility(self) -> None:
-        timing = self.timing_combo.currentText()
-        is_timing = timing == tr(self.lang, "bgm_timing")
-        is_metronome = self.mode_combo.currentText() == tr(self.lang, "bgm_metronome")
+        is_timing = self.timing_combo.currentIndex() == self._TIMING_INDEX
+        is_metronome = self.mode_combo.currentIndex() == self._METRONOME_INDEX
         self.duration_label.setVisible(not is_timing)
         self.duration_spin.setVisible(not is_timing)
         self.bpm_label.setVisible(is_timing)
@@ -1495,7 +1264,7 @@ class BgmNoteDialog(QtWidgets.QDialog):
             return None
         mode = self.mode_combo.currentText()
         note = self.note_edit.text().strip()
-        if mode != tr(self.lang, "bgm_metronome") and not note:
+        if self.mode_combo.currentIndex() != self._METRONOME_INDEX and not note:
             return None
         return (
             note,
@@ -1508,13 +1277,13 @@ class BgmNoteDialog(QtWidgets.QDialog):
 
 
 class NoteAnalysisWorker(QtCore.QThread):
-    result = QtCore.pyqtSignal(str, float, str)
+    result = QtCore.pyqtSignal(int, str, float, str)
     progress = QtCore.pyqtSignal(int, int)
     finished = QtCore.pyqtSignal()
 
     def __init__(
         self,
-        files: list[str],
+        files: list[tuple[int, str]],
         target_sr: int,
         algo: str,
         cache_dir: Optional[Path],
@@ -1528,7 +1297,7 @@ class NoteAnalysisWorker(QtCore.QThread):
         self.algo = algo
         self.cache_dir = cache_dir
         self.ref_bits = ref_bits
-        self.max_workers = max(1, int(max_workers))
+        self.max_workers = max(1, min(int(max_workers), os.cpu_count() or 1))
 
     def run(self) -> None:
         total = len(self.files)
@@ -1537,7 +1306,7 @@ class NoteAnalysisWorker(QtCore.QThread):
         cache_dir = str(self.cache_dir) if self.cache_dir is not None else None
         try:
             if self.max_workers <= 1 or total <= 1:
-                for path in self.files:
+                for row, path in self.files:
                     if self.isInterruptionRequested():
                         break
                     result = _analyze_note_task(
@@ -1548,68 +1317,51 @@ class NoteAnalysisWorker(QtCore.QThread):
                         cache_dir,
                     )
                     if result:
-                        self.result.emit(*result)
+                        self.result.emit(row, *result)
                     done += 1
                     self.progress.emit(done, total)
             else:
-                from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
                 try:
-                    with ProcessPoolExecutor(
+                    executor = ProcessPoolExecutor(
                         max_workers=self.max_workers,
                         mp_context=mp.get_context("spawn"),
-                    ) as executor:
-                        futures = {
-                            executor.submit(
-                                _analyze_note_task,
-                                p,
-                                self.target_sr,
-                                self.algo,
-                                self.ref_bits,
-                                cache_dir,
-                            ): p
-                            for p in self.files
-                        }
-                        for future in as_completed(futures):
-                            if self.isInterruptionRequested():
-                                break
-                            try:
-                                result = future.result()
-                            except Exception:
-                                logger.exception("Note analysis worker failed")
-                                result = None
-                            if result:
-                                self.result.emit(*result)
-                            done += 1
-                            self.progress.emit(done, total)
+                    )
+                    self._run_pool(executor, cache_dir, total)
                 except Exception:
                     logger.exception("Process pool failed, falling back to threads")
-                    with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-                        futures = {
-                            executor.submit(
-                                _analyze_note_task,
-                                p,
-                                self.target_sr,
-                                self.algo,
-                                self.ref_bits,
-                                cache_dir,
-                            ): p
-                            for p in self.files
-                        }
-                        for future in as_completed(futures):
-                            if self.isInterruptionRequested():
-                                break
-                            try:
-                                result = future.result()
-                            except Exception:
-                                logger.exception("Note analysis worker failed")
-                                result = None
-                            if result:
-                                self.result.emit(*result)
-                            done += 1
-                            self.progress.emit(done, total)
+                    self._run_pool(ThreadPoolExecutor(max_workers=self.max_workers), cache_dir, total)
         finally:
             self.finished.emit()
 
+    def _run_pool(self, executor: Executor, cache_dir: Optional[str], total: int) -> None:
+        done = 0
+        try:
+            futures = {
+                executor.submit(
+                    _analyze_note_task,
+                    p,
+                    self.target_sr,
+                    self.algo,
+                    self.ref_bits,
+                    cache_dir,
+                ): row
+                for row, p in self.files
+            }
+            for future in as_completed(futures):
+                if self.isInterruptionRequested():
+                    break
+                try:
+                    result = future.result()
+                except Exception:
+                    logger.exception("Note analysis worker failed")
+                    result = None
+                if result:
+                    self.result.emit(futures[future], *result)
+                done += 1
+                self.progress.emit(done, total)
+        finally:
+            executor.shutdown(wait=not self.isInterruptionRequested(), cancel_futures=True)
+
 
 class RecordedAnalysisWorker(QtCore.QThread):
     result = QtCore.pyqtSignal(int, object, object, object, object, object, object, object, bool, bool, bool)
@@ -1665,7 +1417,7 @@ class RecordedAnalysisWorker(QtCore.QThread):
                 times, f0s = self.cached_pitch
                 pitch_done = True
             else:
-                times, f0s = np.array([], dtype=np.float32), np.array([], dtype=np.float32)
+                times, f0s = _EMPTY_F32, _EMPTY_F32
             if self.isInterruptionRequested():
                 return
             if self.compute_mel:
@@ -1675,7 +1427,7 @@ class RecordedAnalysisWorker(QtCore.QThread):
                 mel_db, mel_times = self.cached_mel
                 mel_done = True
             else:
-                mel_db, mel_times = np.array([], dtype=np.float32), np.array([], dtype=np.float32)
+                mel_db, mel_times = _EMPTY_F32, _EMPTY_F32
             if self.isInterruptionRequested():
                 return
             if self.compute_power:
@@ -1685,7 +1437,7 @@ class RecordedAnalysisWorker(QtCore.QThread):
                 power_times, power_db = self.cached_power
                 power_done = True
             else:
-                power_times, power_db = np.array([], dtype=np.float32), np.array([], dtype=np.float32)
+                power_times, power_db = _EMPTY_F32, _EMPTY_F32
             if self.isInterruptionRequested():
                 return
             self.result.emit(
@@ -1707,7 +1459,88 @@ class RecordedAnalysisWorker(QtCore.QThread):
             self.finished.emit()
 
 
+def _scan_voicebank_map(
+    folders: list[Path],
+    prefix: str,
+    suffix: str,
+    out_prefix: str,
+    out_suffix: str,
+) -> dict[str, Path]:
+    mapping: dict[str, Path] = {}
+    strip = MainWindow._strip_fixes
+    for folder in folders:
+        try:
+            with os.scandir(folder) as it:
+                files = {os.path.normcase(entry.name): entry.name for entry in it if entry.is_file()}
+        except OSError:
+            files = {}
+        if os.path.normcase("oto.ini") in files:
+            entries = parse_oto_ini(folder / "oto.ini")
+            for alias, wav_name in entries:
+                wav_path = folder / wav_name
+                if Path(wav_name).name != wav_name:
+                    if not wav_path.exists():
+                        continue
+                elif os.path.normcase(wav_name) not in files:
+                    continue
+                key = strip(Path(wav_name).stem, prefix, suffix, out_prefix, out_suffix)
+                if not key:
+                    continue
+                if key not in mapping:
+                    mapping[key] = wav_path
+            continue
+        for name in sorted(name for norm, name in files.items() if norm.endswith(".wav")):
+            wav = folder / name
+            key = strip(wav.stem, prefix, suffix, out_prefix, out_suffix)
+            if not key or key in mapping:
+                continue
+            mapping[key] = wav
+    return mapping
+
+
+class VoicebankMapWorker(QtCore.QThread):
+    result = QtCore.pyqtSignal(object, object)
+
+    def __init__(
+        self,
+        key: tuple,
+        folders: list[Path],
+        prefix: str,
+        suffix: str,
+        out_prefix: str,
+        out_suffix: str,
+        parent: Optional[QtCore.QObject] = None,
+    ) -> None:
+        super().__init__(parent)
+        self.key = key
+        self.folders = folders
+        self.prefix = prefix
+        self.suffix = suffix
+        self.out_prefix = out_prefix
+        self.out_suffix = out_suffix
+
+    def run(self) -> None:
+        try:
+            mapping = _scan_voicebank_map(self.folders, self.prefix, self.suffix, self.out_prefix, self.out_suffix)
+        except Exception:
+            logger.exception("Failed to build voicebank map")
+            mapping = {}
+        self.result.emit(self.key, mapping)
+
+
 class MainWindow(QtWidgets.QMainWindow):
+    _DEFAULT_ITEM_FLAGS = QtCore.Qt.ItemFlag.ItemIsEnabled | QtCore.Qt.ItemFlag.ItemIsSelectable
+    _EDITABLE_ITEM_FLAGS = _DEFAULT_ITEM_FLAGS | QtCore.Qt.ItemFlag.ItemIsEditable
+    _INPUT_WIDGET_CLASSES = (
+        QtWidgets.QLineEdit,
+        QtWidgets.QTextEdit,
+        QtWidgets.QPlainTextEdit,
+        QtWidgets.QSpinBox,
+        QtWidgets.QDoubleSpinBox,
+        QtWidgets.QComboBox,
+    )
+    _INPUT_WIDGET_TYPES = frozenset(_INPUT_WIDGET_CLASSES)
+
     def __init__(self) -> None:
         super().__init__()
         self.resize(1200, 800)
@@ -1720,9 +1553,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.hold_to_record = bool(self.settings.value("hold_to_record", False))
         self.recent_sessions: list[str] = list(self.settings.value("recent_sessions", []))
         self.setWindowTitle(tr(self.ui_language, "app_title"))
-        icon_path = Path(__file__).resolve().parent.parent / "icon" / "icon.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QtGui.QIcon(str(icon_path)))
+        icon = _app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
 
 
         self.session: Optional[Session] = None
@@ -1730,7 +1563,17 @@ class MainWindow(QtWidgets.QMainWindow):
         self.session_path: Optional[Path] = None
         self.record_start_time: Optional[float] = None
         self.voicebank_samples: dict[str, Path] = {}
+        self._voicebank_map_cache: dict[tuple, dict[str, Path]] = {}
+        self._voicebank_map_pending: Optional[tuple] = None
+        self._voicebank_worker: Optional[VoicebankMapWorker] = None
         self._sung_note_cache: dict[str, tuple[float, str]] = {}
+        self._note_index_key: Optional[tuple] = None
+        self._note_index_saved: dict[str, tuple[float, str]] = {}
+        self._autosave_snapshot: Optional[dict] = None
+        self._autosave_executor = ThreadPoolExecutor(max_workers=1)
+        self._session_write_lock = threading.Lock()
+        self._session_write_seq = 0
+        self._session_written_seq = 0
         self._note_worker: Optional[NoteAnalysisWorker] = None
         self._note_analysis_pending: set[str] = set()
         self._analysis_pitch_worker: Optional[RecordedAnalysisWorker] = None
@@ -1740,6 +1583,59 @@ class MainWindow(QtWidgets.QMainWindow):
         self._recorded_analysis_cache: OrderedDict[tuple, tuple] = OrderedDict()
         self._current_analysis_key: Optional[tuple] = None
         self._current_analysis_meta: Optional[tuple] = None
+        self._midi_scratch: Optional[np.ndarray] = None
+        self._wave_env: Optional[np.ndarray] = None
+        self._wave_x_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._last_wave_range: Optional[tuple[float, float, float]] = None
+        self._visual_inflight = False
+        self._visual_last_cursor = -1
+        self._path_to_row: dict[str, int] = {}
+        self._alias_index: dict[str, Item] = {}
+        self._recorded_count = 0
+        self._row_to_model_index: Optional[list[int]] = None
+        self._table_generation = 0
+        self._note_jobs_generation = -1
+        self._session_dir_owner: Optional[Session] = None
+        self._session_dir_base: Optional[Path] = None
+        self._session_dir_path: Optional[Path] = None
+        self._abs_path_cache: dict[str, Path] = {}
+        self._last_cache_write: dict[str, tuple] = {}
+        self._playhead_lines: list[pg.InfiniteLine] = []
+        self._mono_scratch: Optional[np.ndarray] = None
+        self._wave_render_src: Optional[np.ndarray] = None
+        self._wave_render_key: Optional[float] = None
+        self._sf_cache: OrderedDict[tuple, np.ndarray] = OrderedDict()
+        self._cache_save_executor = ThreadPoolExecutor(max_workers=1)
+        threading.Thread(target=query_devices_cached, daemon=True).start()
+        self._cache_save_lock = threading.Lock()
+        self._pending_cache_saves: dict[tuple, tuple] = {}
+        self._analysis_cache_path: Optional[Path] = None
+        self._table_target_note = ""
+        self._pending_note_updates: dict[int, tuple[str, int]] = {}
+        self._note_flush_timer = QtCore.QTimer(self)
+        self._note_flush_timer.setSingleShot(True)
+        self._note_flush_timer.setInterval(30)
+        self._note_flush_timer.timeout.connect(self._flush_note_updates)
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_session)
+        self._event_queue: deque[tuple[Path, str]] = deque()
+        self._event_log_path: Optional[Path] = None
+        self._event_log_file: Optional[TextIO] = None
+        self._event_flush_timer = QtCore.QTimer(self)
+        self._event_flush_timer.setSingleShot(True)
+        self._event_flush_timer.setInterval(1000)
+        self._event_flush_timer.timeout.connect(self._flush_event_log)
+        self._recent_save_timer = QtCore.QTimer(self)
+        self._recent_save_timer.setSingleShot(True)
+        self._recent_save_timer.setInterval(500)
+        self._recent_save_timer.timeout.connect(self._flush_recent_sessions)
+        self.history_size = 200
+        self._power_ring = np.zeros(2 * self.history_size, dtype=np.float32)
+        self._power_head = 0
+        self._power_count = 0
+        self._power_x = np.empty(0, dtype=np.float32)
         self.note_progress: Optional[QtWidgets.QProgressBar] = None
         self._update_check_worker: Optional[UpdateCheckWorker] = None
         self._update_download_worker: Optional[UpdateDownloadWorker] = None
@@ -1763,37 +1659,39 @@ class MainWindow(QtWidgets.QMainWindow):
         app = QtWidgets.QApplication.instance()
         if app is not None:
             app.installEventFilter(self)
+            app.aboutToQuit.connect(self._shutdown_executors)
 
         self.visual_timer = QtCore.QTimer(self)
         self.visual_timer.setInterval(80)
         self.visual_timer.timeout.connect(self._update_visuals)
-        self.visual_timer.start()
+        self._update_power_axis()
 
         self.play_timer = QtCore.QTimer(self)
         self.play_timer.setInterval(30)
         self.play_timer.timeout.connect(self._update_playhead)
-        self.play_timer.start()
 
         self.autosave_timer = QtCore.QTimer(self)
         self.autosave_timer.setInterval(10000)
         self.autosave_timer.timeout.connect(self._autosave)
         self.autosave_timer.start()
 
-        self.power_history = []
-        self.history_size = 200
         self.playing = False
         self.play_start_time: Optional[QtCore.QElapsedTimer] = None
         self.play_start_pos = 0.0
+        self._play_inv_sr = 0.0
         self.play_duration = 0.0
         self._paused_audio: Optional[np.ndarray] = None
         self._paused_pos = 0.0
         self._paused_sr = 0
         self.selected_audio: Optional[np.ndarray] = None
-        self.undo_stack: list[list[dict]] = []
+        self.undo_stack: list[UndoOp] = []
+        self.redo_stack: list[UndoOp] = []
+        self._undo_owner: Optional[Session] = None
         self._suppress_item_changed = False
         self._note_sort_state = 0
 
     def _build_ui(self) -> None:
+        t = _translation_table(self.ui_language)
         central = QtWidgets.QWidget()
         self.setCentralWidget(central)
 
@@ -1803,13 +1701,13 @@ class MainWindow(QtWidgets.QMainWindow):
 
         self.table = QtWidgets.QTableWidget(0, 7)
         self.table.setHorizontalHeaderLabels([
-            tr(self.ui_language, "table_status"),
-            tr(self.ui_language, "table_alias"),
-            tr(self.ui_language, "table_romaji"),
-            tr(self.ui_language, "table_note"),
-            tr(self.ui_language, "table_comment"),
-            tr(self.ui_language, "table_duration"),
-            tr(self.ui_language, "table_file"),
+            t["table_status"],
+            t["table_alias"],
+            t["table_romaji"],
+            t["table_note"],
+            t["table_comment"],
+            t["table_duration"],
+            t["table_file"],
         ])
         self.table.horizontalHeader().setStretchLastSection(True)
         self.table.horizontalHeader().setSectionsMovable(True)
@@ -1822,18 +1720,18 @@ class MainWindow(QtWidgets.QMainWindow):
         right_panel = QtWidgets.QWidget()
         right_layout = QtWidgets.QVBoxLayout(right_panel)
 
-        self.current_label = QtWidgets.QLabel(tr(self.ui_language, "current_item"))
-        self.note_label = QtWidgets.QLabel(tr(self.ui_language, "current_note"))
+        self.current_label = QtWidgets.QLabel(t["current_item"])
+        self.note_label = QtWidgets.QLabel(t["current_note"])
         right_layout.addWidget(self.current_label)
         right_layout.addWidget(self.note_label)
 
-        self.record_btn = QtWidgets.QPushButton(tr(self.ui_language, "record"))
-        self.stop_btn = QtWidgets.QPushButton(tr(self.ui_language, "stop"))
-        self.rerecord_btn = QtWidgets.QPushButton(tr(self.ui_language, "rerecord"))
-        self.preview_btn = QtWidgets.QPushButton(tr(self.ui_language, "preview_bgm"))
-        self.preview_overlay_btn = QtWidgets.QPushButton(tr(self.ui_language, "preview_overlay"))
-        self.cut_btn = QtWidgets.QPushButton(tr(self.ui_language, "cut_selection"))
-        self.select_btn = QtWidgets.QPushButton(tr(self.ui_language, "select_region"))
+        self.record_btn = QtWidgets.QPushButton(t["record"])
+        self.stop_btn = QtWidgets.QPushButton(t["stop"])
+        self.rerecord_btn = QtWidgets.QPushButton(t["rerecord"])
+        self.preview_btn = QtWidgets.QPushButton(t["preview_bgm"])
+        self.preview_overlay_btn = QtWidgets.QPushButton(t["preview_overlay"])
+        self.cut_btn = QtWidgets.QPushButton(t["cut_selection"])
+        self.select_btn = QtWidgets.QPushButton(t["select_region"])
 
         btn_layout = QtWidgets.QHBoxLayout()
         btn_layout.addWidget(self.record_btn)
@@ -1849,9 +1747,9 @@ class MainWindow(QtWidgets.QMainWindow):
         select_cut_layout.addWidget(self.cut_btn)
         right_layout.addLayout(select_cut_layout)
 
-        self.bgm_checkbox = QtWidgets.QCheckBox(tr(self.ui_language, "bgm_during"))
+        self.bgm_checkbox = QtWidgets.QCheckBox(t["bgm_during"])
         self.bgm_checkbox.setChecked(True)
-        self.auto_next_checkbox = QtWidgets.QCheckBox(tr(self.ui_language, "auto_next"))
+        self.auto_next_checkbox = QtWidgets.QCheckBox(t["auto_next"])
         self.auto_next_checkbox.setChecked(True)
         right_layout.addWidget(self.bgm_checkbox)
         right_layout.addWidget(self.auto_next_checkbox)
@@ -1859,8 +1757,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.bgm_slider = QtWidgets.QSlider(QtCore.Qt.Orientation.Horizontal)
         self.bgm_slider.setRange(0, 100)
         self.bgm_slider.setValue(50)
-        self.bgm_level_label = QtWidgets.QLabel(tr(self.ui_language, "bgm_level"))
-        self.bgm_overlay_label = QtWidgets.QLabel(tr(self.ui_language, "bgm_overlay_level"))
+        self.bgm_level_label = QtWidgets.QLabel(t["bgm_level"])
+        self.bgm_overlay_label = QtWidgets.QLabel(t["bgm_overlay_level"])
         level_row = QtWidgets.QHBoxLayout()
         level_row.addWidget(self.bgm_level_label)
         level_row.addWidget(self.bgm_slider, 1)
@@ -1875,7 +1773,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.pre_roll_spin = QtWidgets.QSpinBox()
         self.pre_roll_spin.setRange(0, 2000)
         self.pre_roll_spin.setValue(300)
-        self.pre_roll_label = QtWidgets.QLabel(tr(self.ui_language, "pre_roll"))
+        self.pre_roll_label = QtWidgets.QLabel(t["pre_roll"])
         right_layout.addWidget(self.pre_roll_label)
         right_layout.addWidget(self.pre_roll_spin)
 
@@ -1891,7 +1789,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self.plot_tabs = QtWidgets.QTabWidget()
         main_layout.addWidget(self.plot_tabs, 1)
 
-        self.wave_plot = pg.PlotWidget(title=tr(self.ui_language, "waveform"))
+        self.wave_plot = pg.PlotWidget(title=t["waveform"])
+        self.wave_plot.disableAutoRange()
         self.wave_curve = self.wave_plot.plot(pen="c")
         self.playhead = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen("w", width=1))
         self.playhead.setVisible(False)
@@ -1899,26 +1798,26 @@ class MainWindow(QtWidgets.QMainWindow):
         self.selection_region = pg.LinearRegionItem(values=(0, 0), movable=True, brush=(200, 200, 255, 50))
         self.selection_region.setVisible(False)
         self.wave_plot.addItem(self.selection_region)
-        self.plot_tabs.addTab(self.wave_plot, tr(self.ui_language, "waveform"))
+        self.plot_tabs.addTab(self.wave_plot, t["waveform"])
 
-        self.spec_plot = pg.PlotWidget(title=tr(self.ui_language, "spectrum"))
+        self.spec_plot = pg.PlotWidget(title=t["spectrum"])
         self.spec_curve = self.spec_plot.plot(pen="m")
         self.spec_playhead = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen("w", width=1))
         self.spec_playhead.setVisible(False)
         self.spec_plot.addItem(self.spec_playhead)
         self.spec_plot.setXLink(self.wave_plot)
-        self.plot_tabs.addTab(self.spec_plot, tr(self.ui_language, "spectrum"))
+        self.plot_tabs.addTab(self.spec_plot, t["spectrum"])
 
-        self.power_plot = pg.PlotWidget(title=tr(self.ui_language, "power"))
+        self.power_plot = pg.PlotWidget(title=t["power"])
         self.power_curve = self.power_plot.plot(pen="y")
         self.power_playhead = pg.InfiniteLine(angle=90, movable=False, pen=pg.mkPen("w", width=1))
         self.power_playhead.setVisible(False)
         self.power_plot.addItem(self.power_playhead)
         self.power_plot.setXLink(self.wave_plot)
-        self.plot_tabs.addTab(self.power_plot, tr(self.ui_language, "power"))
+        self.plot_tabs.addTab(self.power_plot, t["power"])
 
         self.recorded_f0_plot = pg.PlotWidget(
-            title=f"{tr(self.ui_language, 'recorded_f0')} (Piano Roll)",
+            title=f"{t['recorded_f0']} (Piano Roll)",
             axisItems={"left": NoteAxis(orientation="left")},
         )
         self.recorded_f0_plot.showGrid(x=True, y=True, alpha=0.2)
@@ -1931,9 +1830,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.recorded_f0_playhead.setZValue(10)
         self.recorded_f0_plot.addItem(self.recorded_f0_playhead)
         self.recorded_f0_plot.setXLink(self.wave_plot)
-        self.plot_tabs.addTab(self.recorded_f0_plot, tr(self.ui_language, "recorded_f0"))
+        self.plot_tabs.addTab(self.recorded_f0_plot, t["recorded_f0"])
 
-        self.mel_plot = pg.PlotWidget(title=tr(self.ui_language, "mel"))
+        self.mel_plot = pg.PlotWidget(title=t["mel"])
         self.mel_img = pg.ImageItem()
         self.mel_plot.addItem(self.mel_img)
         self.mel_plot.setLabel("left", "Mel bins")
@@ -1942,7 +1841,13 @@ class MainWindow(QtWidgets.QMainWindow):
         self.mel_playhead.setVisible(False)
         self.mel_plot.addItem(self.mel_playhead)
         self.mel_plot.setXLink(self.wave_plot)
-        self.plot_tabs.addTab(self.mel_plot, tr(self.ui_language, "mel"))
+        self._playhead_lines = [
+            self.spec_playhead,
+            self.power_playhead,
+            self.recorded_f0_playhead,
+            self.mel_playhead,
+        ]
+        self.plot_tabs.addTab(self.mel_plot, t["mel"])
 
         self.status_bar = self.statusBar()
         self.note_progress = QtWidgets.QProgressBar()
@@ -1961,45 +1866,49 @@ class MainWindow(QtWidgets.QMainWindow):
             plot.scene().sigMouseClicked.connect(lambda event, p=plot: self._plot_clicked(p, event))
 
     def _build_menu(self) -> None:
+        t = _translation_table(self.ui_language)
         menu = self.menuBar()
-        self.file_menu = menu.addMenu(tr(self.ui_language, "file"))
+        self.file_menu = menu.addMenu(t["file"])
 
-        self.new_action = self.file_menu.addAction(tr(self.ui_language, "new_session"))
-        self.open_action = self.file_menu.addAction(tr(self.ui_language, "open_session"))
-        self.save_action = self.file_menu.addAction(tr(self.ui_language, "save_session"))
-        self.save_as_action = QtGui.QAction(tr(self.ui_language, "save_as"), self)
-        self.save_reclist_action = self.file_menu.addAction(tr(self.ui_language, "save_reclist_to"))
+        self.new_action = self.file_menu.addAction(t["new_session"])
+        self.open_action = self.file_menu.addAction(t["open_session"])
+        self.save_action = self.file_menu.addAction(t["save_session"])
+        self.save_as_action = QtGui.QAction(t["save_as"], self)
+        self.save_reclist_action = self.file_menu.addAction(t["save_reclist_to"])
         self.file_menu.addSeparator()
 
-        self.edit_voicebank_action = self.file_menu.addAction(tr(self.ui_language, "edit_voicebank"))
-        self.export_voicebank_action = self.file_menu.addAction(tr(self.ui_language, "export_voicebank"))
-        self.export_action = self.file_menu.addAction(tr(self.ui_language, "export_recordings"))
-        self.open_folder_action = self.file_menu.addAction(tr(self.ui_language, "open_folder"))
+        self.edit_voicebank_action = self.file_menu.addAction(t["edit_voicebank"])
+        self.export_voicebank_action = self.file_menu.addAction(t["export_voicebank"])
+        self.export_action = self.file_menu.addAction(t["export_recordings"])
+        self.open_folder_action = self.file_menu.addAction(t["open_folder"])
         self.file_menu.addSeparator()
-        self.recent_menu = self.file_menu.addMenu(tr(self.ui_language, "recent_sessions"))
+        self.recent_menu = self.file_menu.addMenu(t["recent_sessions"])
+        self.recent_menu.triggered.connect(self._on_recent_triggered)
         self._rebuild_recent_menu()
         self.file_menu.addSeparator()
-        self.back_action = self.file_menu.addAction(tr(self.ui_language, "back_exit"))
-
-        self.import_menu = menu.addMenu(tr(self.ui_language, "import"))
-        self.import_reclist_action = self.import_menu.addAction(tr(self.ui_language, "import_reclist"))
-        self.import_oremo_action = self.import_menu.addAction(tr(self.ui_language, "import_oremo_comment"))
-        self.import_voicebank_action = self.import_menu.addAction(tr(self.ui_language, "import_voicebank"))
-        self.import_bgm_action = self.import_menu.addAction(tr(self.ui_language, "import_bgm"))
-        self.generate_bgm_action = self.import_menu.addAction(tr(self.ui_language, "generate_bgm"))
-
-        self.tools_menu = menu.addMenu(tr(self.ui_language, "tools"))
-        self.vst_batch_action = self.tools_menu.addAction(tr(self.ui_language, "apply_vst"))
-
-        self.settings_menu = menu.addMenu(tr(self.ui_language, "settings"))
-        self.session_settings_action = self.settings_menu.addAction(tr(self.ui_language, "session_settings"))
-        self.audio_settings_action = self.settings_menu.addAction(tr(self.ui_language, "audio_devices"))
-        self.vst_tools_action = self.settings_menu.addAction(tr(self.ui_language, "vst_tools"))
-        self.ui_settings_action = self.settings_menu.addAction(tr(self.ui_language, "ui_settings"))
-
-        self.edit_menu = menu.addMenu(tr(self.ui_language, "edit"))
-        self.undo_action = self.edit_menu.addAction(tr(self.ui_language, "undo"))
+        self.back_action = self.file_menu.addAction(t["back_exit"])
+
+        self.import_menu = menu.addMenu(t["import"])
+        self.import_reclist_action = self.import_menu.addAction(t["import_reclist"])
+        self.import_oremo_action = self.import_menu.addAction(t["import_oremo_comment"])
+        self.import_voicebank_action = self.import_menu.addAction(t["import_voicebank"])
+        self.import_bgm_action = self.import_menu.addAction(t["import_bgm"])
+        self.generate_bgm_action = self.import_menu.addAction(t["generate_bgm"])
+
+        self.tools_menu = menu.addMenu(t["tools"])
+        self.vst_batch_action = self.tools_menu.addAction(t["apply_vst"])
+
+        self.settings_menu = menu.addMenu(t["settings"])
+        self.session_settings_action = self.settings_menu.addAction(t["session_settings"])
+        self.audio_settings_action = self.settings_menu.addAction(t["audio_devices"])
+        self.vst_tools_action = self.settings_menu.addAction(t["vst_tools"])
+        self.ui_settings_action = self.settings_menu.addAction(t["ui_settings"])
+
+        self.edit_menu = menu.addMenu(t["edit"])
+        self.undo_action = self.edit_menu.addAction(t["undo"])
         self.undo_action.setShortcut(QtGui.QKeySequence.StandardKey.Undo)
+        self.redo_action = self.edit_menu.addAction(t["redo"])
+        self.redo_action.setShortcut(QtGui.QKeySequence("Ctrl+Shift+Z"))
         self.new_action.setShortcut(QtGui.QKeySequence.StandardKey.New)
         self.save_action.setShortcut(QtGui.QKeySequence.StandardKey.Save)
         self.import_reclist_action.setShortcut(QtGui.QKeySequence("Ctrl+I"))
@@ -2009,9 +1918,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.export_voicebank_action.setShortcut(QtGui.QKeySequence("Ctrl+Shift+E"))
         self.back_action.setShortcut(QtGui.QKeySequence("Ctrl+B"))
 
-        self.help_menu = menu.addMenu(tr(self.ui_language, "help"))
-        self.about_action = self.help_menu.addAction(tr(self.ui_language, "about"))
-        self.check_updates_action = self.help_menu.addAction(tr(self.ui_language, "check_updates"))
+        self.help_menu = menu.addMenu(t["help"])
+        self.about_action = self.help_menu.addAction(t["about"])
+        self.check_updates_action = self.help_menu.addAction(t["check_updates"])
 
     def _connect_actions(self) -> None:
         self.new_action.triggered.connect(self._new_session)
@@ -2036,6 +1945,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.vst_tools_action.triggered.connect(self._open_vst_tools)
         self.ui_settings_action.triggered.connect(self._open_ui_settings)
         self.undo_action.triggered.connect(self._undo)
+        self.redo_action.triggered.connect(self._redo)
         self.about_action.triggered.connect(self._open_about)
         self.check_updates_action.triggered.connect(self._manual_check_updates)
 
@@ -2059,8 +1969,9 @@ class MainWindow(QtWidgets.QMainWindow):
         data = dialog.get_data()
         if not data:
             return
+        self._flush_pending_save()
         self._stop_note_worker()
-        self._sung_note_cache.clear()
+        self._clear_sung_note_cache()
         self.session = Session(
             name=data["name"],
             singer=data["singer"],
@@ -2094,8 +2005,9 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path:
             return
         try:
+            self._flush_pending_save()
             self._stop_note_worker()
-            self._sung_note_cache.clear()
+            self._clear_sung_note_cache()
             self.session = load_session(Path(path))
             self._add_recent_session(path)
             self.audio.sample_rate = self.session.sample_rate
@@ -2119,13 +2031,29 @@ class MainWindow(QtWidgets.QMainWindow):
             logger.exception("Failed to open session")
             self._show_error(str(exc))
 
+    def _schedule_save(self) -> None:
+        if self.session:
+            self._save_timer.start()
+
+    def _flush_pending_save(self) -> None:
+        if self._save_timer.isActive():
+            self._save_session()
+        self._close_event_log()
+
     def _save_session(self) -> None:
+        self._save_timer.stop()
         if not self.session:
             return
         try:
-            self.session_path = save_session(self.session)
+            self._session_write_seq += 1
+            seq = self._session_write_seq
+            with self._session_write_lock:
+                self.session_path = save_session(self.session)
+                self._session_written_seq = seq
+            self._autosave_snapshot = None
             if self.session_path:
                 self._add_recent_session(str(self.session_path))
+            self._save_note_index()
             self._set_status("Session saved")
         except Exception as exc:
             logger.exception("Failed to save session")
@@ -2146,10 +2074,27 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _autosave(self) -> None:
         if self.session:
+            snapshot = self.session.to_dict()
+            if snapshot != self._autosave_snapshot:
+                self._autosave_snapshot = snapshot
+                self._session_write_seq += 1
+                args = (snapshot, self._session_dir(), self._session_write_seq)
+                try:
+                    self._autosave_executor.submit(self._write_session_snapshot, *args)
+                except RuntimeError:
+                    self._write_session_snapshot(*args)
+            self._save_note_index()
+
+    def _write_session_snapshot(self, data: dict, session_dir: Path, seq: int) -> None:
+        with self._session_write_lock:
+            if seq < self._session_written_seq:
+                return
             try:
-                save_session(self.session)
+                save_session_data(data, session_dir)
+                self._session_written_seq = seq
             except Exception:
                 logger.exception("Autosave failed")
+                self._autosave_snapshot = None
 
     def _import_reclist(self) -> None:
         if not self.session:
@@ -2167,22 +2112,24 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.StandardButton.No,
             )
             replace_all = choice == QtWidgets.QMessageBox.StandardButton.Yes
+            ops: list[UndoOp] = []
             if replace_all:
-                self._push_undo_state()
+                ops.extend(self._delete_ops_for_all())
                 self.session.items.clear()
             existing = {item.alias for item in self.session.items}
             parsed = [entry for entry in parse_reclist_text(text) if entry[0] not in existing]
-            if parsed and not replace_all:
-                self._push_undo_state()
             for alias, note, comment in parsed:
-                romaji = "_".join(kana_to_romaji_tokens(alias)) if needs_romaji(alias) else None
+                romaji = alias_romaji(alias)
                 item = self.session.add_item(alias, note, romaji=romaji)
                 if comment:
                     item.notes = comment
+                ops.append(UndoOp("add", len(self.session.items) - 1, after=item.to_dict()))
+            if ops:
+                self._push_undo_op(UndoOp("bulk", ops=ops))
             self._save_reclist_copy(text)
             self._log_event("import_reclist", Path(path).name)
             self._refresh_table()
-            self._save_session()
+            self._schedule_save()
         except Exception as exc:
             logger.exception("Failed to import reclist")
             self._show_error(str(exc))
@@ -2203,11 +2150,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtWidgets.QMessageBox.StandardButton.No,
             )
             replace_all = choice == QtWidgets.QMessageBox.StandardButton.Yes
+            ops: list[UndoOp] = []
             if replace_all:
-                self._push_undo_state()
+                ops.extend(self._delete_ops_for_all())
                 self.session.items.clear()
             existing = {item.alias: item for item in self.session.items}
-            added = False
+            existing_rows = {id(item): idx for idx, item in enumerate(self.session.items)}
             for line in text.splitlines():
                 raw = line.strip()
                 if not raw or raw.startswith("#") or raw.startswith(";"):
@@ -2223,20 +2171,25 @@ class MainWindow(QtWidgets.QMainWindow):
                 if not alias:
                     continue
                 if alias in existing:
-                    if comment:
-                        existing[alias].notes = comment
+                    target = existing[alias]
+                    if comment and target.notes != comment:
+                        before = target.to_dict()
+                        target.notes = comment
+                        row = existing_rows.get(id(target))
+                        if row is not None:
+                            ops.append(UndoOp("modify", row, before=before, after=target.to_dict()))
                 else:
-                    romaji = "_".join(kana_to_romaji_tokens(alias)) if needs_romaji(alias) else None
+                    romaji = alias_romaji(alias)
                     item = self.session.add_item(alias, None, romaji=romaji)
                     if comment:
                         item.notes = comment
-                    added = True
-            if added and not replace_all:
-                self._push_undo_state()
+                    ops.append(UndoOp("add", len(self.session.items) - 1, after=item.to_dict()))
+            if ops:
+                self._push_undo_op(UndoOp("bulk", ops=ops))
             self._save_reclist_copy(text)
             self._log_event("import_oremo_comment", Path(path).name)
             self._refresh_table()
-            self._save_session()
+            self._schedule_save()
         except Exception as exc:
             logger.exception("Failed to import OREMO comment")
             self._show_error(str(exc))
@@ -2266,11 +2219,13 @@ class MainWindow(QtWidgets.QMainWindow):
             names = import_voicebank(folder_path, prefix=prefix, suffix=suffix)
             existing = {item.alias for item in self.session.items}
             new_names = [name for name in names if name not in existing]
-            if new_names:
-                self._push_undo_state()
+            ops: list[UndoOp] = []
             for name in new_names:
-                romaji = "_".join(kana_to_romaji_tokens(name)) if needs_romaji(name) else None
-                self.session.add_item(name, romaji=romaji)
+                romaji = alias_romaji(name)
+                item = self.session.add_item(name, romaji=romaji)
+                ops.append(UndoOp("add", len(self.session.items) - 1, after=item.to_dict()))
+            if ops:
+                self._push_undo_op(UndoOp("bulk", ops=ops))
             self._refresh_table()
             self.session.voicebank_path = folder_path
             if str(folder_path) not in self.session.voicebank_paths:
@@ -2289,11 +2244,12 @@ class MainWindow(QtWidgets.QMainWindow):
                     suffix,
                 )
             else:
+                self._voicebank_map_pending = None
                 self.voicebank_samples = {}
             if use_bgm and copy_oto:
                 self._copy_and_adjust_oto(
                     folder_path / "oto.ini",
-                    self.session.session_dir() / "oto.ini",
+                    self._session_dir() / "oto.ini",
                     remove_prefix=prefix,
                     remove_suffix=suffix,
                     add_prefix=self.session.output_prefix,
@@ -2316,7 +2272,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.session.bgm_wav_path = str(Path("BGM") / copied.name)
                 self.session.bgm_note = None
                 self.session.bgm_override = True
-                self._save_session()
+                self._schedule_save()
                 self._log_event("import_bgm", copied.name)
         except Exception as exc:
             logger.exception("Failed to load BGM")
@@ -2335,7 +2291,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.session.bgm_overlay_note = note.strip()
                     self.session.bgm_overlay_duration = dur
                     self.session.bgm_overlay_enabled = True
-                    self._save_session()
+                    self._schedule_save()
                     self._log_event("bgm_overlay", note.strip())
                     self._refresh_table()
                     self._start_note_analysis()
@@ -2350,7 +2306,7 @@ class MainWindow(QtWidgets.QMainWindow):
                     self.session.bgm_overlay_note = None
                     self.session.bgm_overlay_duration = None
                     self.session.bgm_override = True
-                    self._save_session()
+                    self._schedule_save()
                     self._log_event("bgm_metronome", str(bpm))
                     self._save_generated_bgm("metronome", dur)
                     self._refresh_table()
@@ -2376,7 +2332,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.session.bgm_overlay_note = None
                 self.session.bgm_overlay_duration = None
                 self.session.bgm_override = True
-                self._save_session()
+                self._schedule_save()
                 self._log_event("bgm_generate", note.strip())
                 self._save_generated_bgm(note.strip(), dur)
                 self._refresh_table()
@@ -2403,15 +2359,15 @@ class MainWindow(QtWidgets.QMainWindow):
         if not path:
             return
         try:
-            lines = []
-            for item in self.session.items:
-                if item.notes:
-                    lines.append(f"{item.alias}\\t{item.notes}")
-                elif item.note:
-                    lines.append(f"{item.alias}\\t{item.note}")
-                else:
-                    lines.append(item.alias)
-            Path(path).write_text("\n".join(lines), encoding="utf-8")
+            with open(path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+                write = f.write
+                for item in self.session.items:
+                    write(item.alias)
+                    extra = item.notes or item.note
+                    if extra:
+                        write("\t")
+                        write(extra)
+                    write("\n")
             self._set_status("Reclist saved")
         except Exception as exc:
             self._show_error(str(exc))
@@ -2422,24 +2378,26 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.session.voicebank_use_bgm:
             paths = []
             if self.session.voicebank_paths:
-                paths = [Path(p) for p in self.session.voicebank_paths if Path(p).exists()]
+                paths = [Path(p) for p in self.session.voicebank_paths]
             elif self.session.voicebank_path and self.session.voicebank_path.exists():
                 paths = [self.session.voicebank_path]
             if paths:
-                self.voicebank_samples = self._build_voicebank_map(
+                self._request_voicebank_map(
                     paths,
                     self.session.voicebank_prefix,
                     self.session.voicebank_suffix,
                 )
             else:
+                self._voicebank_map_pending = None
                 self.voicebank_samples = {}
         else:
+            self._voicebank_map_pending = None
             self.voicebank_samples = {}
         if self.session.bgm_wav_path:
             try:
                 bgm_path = Path(self.session.bgm_wav_path)
                 if not bgm_path.is_absolute():
-                    bgm_path = self.session.session_dir() / bgm_path
+                    bgm_path = self._session_dir() / bgm_path
                 self.audio.load_bgm_wav(bgm_path)
             except Exception:
                 logger.exception("Failed to load saved BGM WAV")
@@ -2508,7 +2466,8 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.audio.stream.stop()
                 self.audio.stream.close()
                 self.audio.stream = None
-            self.audio._ring = RingBuffer(size=self.session.sample_rate * 5)
+            self.audio._ring.resize(self.session.sample_rate * 5)
+            self.audio._ring.clear()
             self.audio.set_pre_roll_ms(self.pre_roll_spin.value())
 
         if rename_files:
@@ -2526,8 +2485,9 @@ class MainWindow(QtWidgets.QMainWindow):
                 cached = self._sung_note_cache.pop(old_abs, None)
                 if cached:
                     self._sung_note_cache[new_abs] = cached
-
-        self._save_session()
+            self._save_session()
+        else:
+            self._schedule_save()
         self._refresh_table()
         self._start_note_analysis()
 
@@ -2546,6 +2506,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.audio.set_devices(input_dev, output_dev)
             self._set_status("Audio devices updated")
         except Exception as exc:
+            invalidate_device_cache()
             self._show_error(str(exc))
 
     def _open_ui_settings(self) -> None:
@@ -2573,7 +2534,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self.settings.setValue("hold_to_record", bool(hold_to_record))
         self._apply_language()
         self._apply_theme()
-        self._sung_note_cache.clear()
+        self._clear_sung_note_cache()
         self._start_note_analysis()
         self._update_recorded_analysis()
 
@@ -2788,6 +2749,8 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.session:
             QtWidgets.QMessageBox.warning(self, tr(self.ui_language, "apply_vst"), tr(self.ui_language, "vst_no_session"))
             return
+        from app.vst_batch import VstBatchDialog
+
         dialog = VstBatchDialog(lambda key: tr(self.ui_language, key), self.settings, self.session, self)
         dialog.exec()
 
@@ -2797,7 +2760,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _open_session_folder(self) -> None:
         if not self.session:
             return
-        folder = self.session.session_dir()
+        folder = self._session_dir()
         QtGui.QDesktopServices.openUrl(QtCore.QUrl.fromLocalFile(str(folder)))
 
     @staticmethod
@@ -2926,10 +2889,11 @@ class MainWindow(QtWidgets.QMainWindow):
     def _export_voicebank(self) -> None:
         if not self.session:
             return
+        self._flush_pending_save()
         base = QtWidgets.QFileDialog.getExistingDirectory(
             self,
             tr(self.ui_language, "export_voicebank_title"),
-            str(self.session.session_dir()),
+            str(self._session_dir()),
         )
         if not base:
             return
@@ -2942,14 +2906,14 @@ class MainWindow(QtWidgets.QMainWindow):
                 continue
             src = Path(item.wav_path)
             if not src.is_absolute():
-                src = self.session.session_dir() / src
+                src = self._session_dir() / src
             if not src.exists():
                 continue
             shutil.copy2(src, out_dir / src.name)
 
-        src_vb = self.session.session_dir()
+        src_vb = self._session_dir()
         if src_vb and src_vb.exists():
-            oto_src = self.session.session_dir() / "oto.ini"
+            oto_src = self._session_dir() / "oto.ini"
             if oto_src.exists():
                 if self.session.voicebank_oto_strip_aliases:
                     self._copy_and_adjust_oto_alias(
@@ -2986,12 +2950,12 @@ class MainWindow(QtWidgets.QMainWindow):
     def _edit_voicebank(self) -> None:
         if not self.session:
             return
-        folder = self.session.session_dir()
+        folder = self._session_dir()
         if not folder or not folder.exists():
             folder_str = QtWidgets.QFileDialog.getExistingDirectory(
                 self,
                 tr(self.ui_language, "edit_voicebank"),
-                str(self.session.session_dir()),
+                str(self._session_dir()),
             )
             if not folder_str:
                 return
@@ -3000,28 +2964,9 @@ class MainWindow(QtWidgets.QMainWindow):
         dialog.exec()
 
     def _maybe_show_start_dialog(self) -> None:
-        recent_entries = []
-        for path in self.recent_sessions[:10]:
-            try:
-                session = load_session(Path(path))
-                recorded = sum(1 for item in session.items if item.status != ItemStatus.PENDING)
-                total = len(session.items)
-                title = f"{session.singer} — {session.name}  [{recorded}/{total}]"
-            except Exception:
-                title = Path(path).stem
-            try:
-                rel_path = Path(path).resolve().relative_to(Path.cwd().resolve())
-                rel_text = str(rel_path)
-            except Exception:
-                rel_text = str(Path(path))
-            recent_entries.append({
-                "title": title,
-                "path": rel_text,
-                "full_path": path,
-            })
-        dialog = StartDialog(self.ui_language, recent_entries, self)
-        dialog.show()
         QtCore.QTimer.singleShot(600, self._auto_check_updates)
+        dialog = StartDialog(self.ui_language, self._recent_session_entries(), self)
+        dialog.show()
         if dialog.exec() != QtWidgets.QDialog.DialogCode.Accepted:
             if dialog.closed_via_x:
                 self.close()
@@ -3035,10 +2980,45 @@ class MainWindow(QtWidgets.QMainWindow):
         elif dialog.action == "settings":
             self._open_ui_settings()
 
+    def _recent_session_entries(self) -> list[dict]:
+        paths = self.recent_sessions[:10]
+        try:
+            cached = json.loads(self.settings.value("recent_summaries", "{}") or "{}")
+        except (TypeError, ValueError):
+            cached = {}
+        if not isinstance(cached, dict):
+            cached = {}
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            summaries = list(executor.map(_recent_session_summary, paths, [cached.get(p) for p in paths]))
+        fresh = {path: summary for path, summary in zip(paths, summaries) if summary}
+        if fresh != cached:
+            self.settings.setValue("recent_summaries", json.dumps(fresh, ensure_ascii=False))
+        cwd = os.getcwd()
+        recent_entries = []
+        for path, summary in zip(paths, summaries):
+            if summary:
+                _stamp, singer, name, recorded, total = summary
+                title = f"{singer} — {name}  [{recorded}/{total}]"
+            else:
+                title = Path(path).stem
+            try:
+                rel_text = os.path.relpath(path, cwd)
+            except ValueError:
+                rel_text = str(Path(path))
+            if rel_text == os.pardir or rel_text.startswith(os.pardir + os.sep):
+                rel_text = str(Path(path))
+            recent_entries.append({
+                "title": title,
+                "path": rel_text,
+                "full_path": path,
+            })
+        return recent_entries
+
     def _open_recent_path(self, path: str) -> None:
         try:
+            self._flush_pending_save()
             self._stop_note_worker()
-            self._sung_note_cache.clear()
+            self._clear_sung_note_cache()
             self.session = load_session(Path(path))
             self._add_recent_session(path)
             self.audio.sample_rate = self.session.sample_rate
@@ -3053,27 +3033,38 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _add_recent_session(self, path: str) -> None:
         path = str(Path(path))
+        if self.recent_sessions and self.recent_sessions[0] == path:
+            return
         if path in self.recent_sessions:
             self.recent_sessions.remove(path)
         self.recent_sessions.insert(0, path)
         self.recent_sessions = self.recent_sessions[:10]
-        self.settings.setValue("recent_sessions", self.recent_sessions)
+        self._recent_save_timer.start()
         self._rebuild_recent_menu()
 
+    def _flush_recent_sessions(self) -> None:
+        self._recent_save_timer.stop()
+        self.settings.setValue("recent_sessions", self.recent_sessions)
+
     def _rebuild_recent_menu(self) -> None:
         if not hasattr(self, "recent_menu"):
             return
         self.recent_menu.clear()
         if not self.recent_sessions:
-            empty = QtGui.QAction("-", self)
+            empty = QtGui.QAction("-", self.recent_menu)
             empty.setEnabled(False)
             self.recent_menu.addAction(empty)
             return
         for path in self.recent_sessions[:10]:
-            action = QtGui.QAction(path, self)
-            action.triggered.connect(lambda checked=False, p=path: self._open_recent_path(p))
+            action = QtGui.QAction(path, self.recent_menu)
+            action.setData(path)
             self.recent_menu.addAction(action)
 
+    def _on_recent_triggered(self, action: QtGui.QAction) -> None:
+        path = action.data()
+        if path:
+            self._open_recent_path(path)
+
     def _create_temp_session(self) -> None:
         if self.session:
             return
@@ -3099,7 +3090,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if not self.session:
             return
         try:
-            path = self.session.session_dir() / "reclist.txt"
+            path = self._session_dir() / "reclist.txt"
             path.parent.mkdir(parents=True, exist_ok=True)
             path.write_text(text, encoding="utf-8")
         except Exception:
@@ -3108,9 +3099,19 @@ class MainWindow(QtWidgets.QMainWindow):
     def _copy_to_session(self, src: Path, folder: str) -> Path:
         if not self.session:
             return src
-        dst_dir = self.session.session_dir() / folder
+        dst_dir = self._session_dir() / folder
         dst_dir.mkdir(parents=True, exist_ok=True)
         dst = dst_dir / src.name
+        try:
+            src_stat = src.stat()
+            dst_stat = dst.stat()
+        except FileNotFoundError:
+            dst_stat = None
+        if dst_stat is not None and (
+            os.path.samestat(src_stat, dst_stat)
+            or (dst_stat.st_size == src_stat.st_size and dst_stat.st_mtime_ns == src_stat.st_mtime_ns)
+        ):
+            return dst
         shutil.copy2(src, dst)
         return dst
 
@@ -3123,115 +3124,154 @@ class MainWindow(QtWidgets.QMainWindow):
                 return
             safe_note = note.replace(" ", "_")
             name = f"bgm_{safe_note}.wav"
-            out_path = self.session.session_dir() / "BGM" / name
+            out_path = self._session_dir() / "BGM" / name
             out_path.parent.mkdir(parents=True, exist_ok=True)
             sf.write(str(out_path), audio, self.audio.sample_rate)
             self.session.bgm_wav_path = str(Path("BGM") / name)
-            self._save_session()
+            self._schedule_save()
         except Exception:
             logger.exception("Failed to save generated BGM")
 
     def _log_event(self, event: str, detail: str = "") -> None:
-        if not self.session:
+        self._log_events([(event, detail)])
+
+    def _log_events(self, events: list[tuple[str, str]]) -> None:
+        if not self.session or not events:
+            return
+        log_path = self._session_dir() / "event_log.txt"
+        timestamp = datetime.now().isoformat(timespec="seconds")
+        self._event_queue.extend((log_path, f"{timestamp}\t{event}\t{detail}\n") for event, detail in events)
+        if not self._event_flush_timer.isActive():
+            self._event_flush_timer.start()
+
+    def _flush_event_log(self) -> None:
+        self._event_flush_timer.stop()
+        batches: dict[Path, list[str]] = {}
+        while self._event_queue:
+            log_path, line = self._event_queue.popleft()
+            batches.setdefault(log_path, []).append(line)
+        for log_path, lines in batches.items():
+            try:
+                f = self._event_log_handle(log_path)
+                f.write("".join(lines))
+                f.flush()
+            except Exception:
+                logger.exception("Failed to write event log")
+                self._close_event_log_file()
+
+    def _event_log_handle(self, log_path: Path) -> TextIO:
+        if self._event_log_file is not None and self._event_log_path == log_path:
+            return self._event_log_file
+        self._close_event_log_file()
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self._event_log_file = log_path.open("a", encoding="utf-8")
+        self._event_log_path = log_path
+        return self._event_log_file
+
+    def _close_event_log_file(self) -> None:
+        if self._event_log_file is None:
             return
         try:
-            log_path = self.session.session_dir() / "event_log.txt"
-            log_path.parent.mkdir(parents=True, exist_ok=True)
-            timestamp = datetime.now().isoformat(timespec="seconds")
-            line = f"{timestamp}\t{event}\t{detail}\n"
-            with log_path.open("a", encoding="utf-8") as f:
-                f.write(line)
+            self._event_log_file.close()
         except Exception:
-            logger.exception("Failed to write event log")
+            logger.exception("Failed to close event log")
+        self._event_log_file = None
+        self._event_log_path = None
+
+    def _close_event_log(self) -> None:
+        self._flush_event_log()
+        self._close_event_log_file()
 
     def _apply_language(self) -> None:
-        self.setWindowTitle(tr(self.ui_language, "app_title"))
-        icon_path = Path(__file__).resolve().parent.parent / "icon" / "icon.ico"
-        if icon_path.exists():
-            self.setWindowIcon(QtGui.QIcon(str(icon_path)))
-
-        self.file_menu.setTitle(tr(self.ui_language, "file"))
-        self.import_menu.setTitle(tr(self.ui_language, "import"))
-        self.tools_menu.setTitle(tr(self.ui_language, "tools"))
-        self.settings_menu.setTitle(tr(self.ui_language, "settings"))
-        self.edit_menu.setTitle(tr(self.ui_language, "edit"))
+        t = _translation_table(self.ui_language)
+        self.setWindowTitle(t["app_title"])
+        icon = _app_icon()
+        if icon is not None:
+            self.setWindowIcon(icon)
+
+        self.file_menu.setTitle(t["file"])
+        self.import_menu.setTitle(t["import"])
+        self.tools_menu.setTitle(t["tools"])
+        self.settings_menu.setTitle(t["settings"])
+        self.edit_menu.setTitle(t["edit"])
         if hasattr(self, "help_menu"):
-            self.help_menu.setTitle(tr(self.ui_language, "help"))
-
-        self.new_action.setText(tr(self.ui_language, "new_session"))
-        self.open_action.setText(tr(self.ui_language, "open_session"))
-        self.save_action.setText(tr(self.ui_language, "save_session"))
-        self.save_as_action.setText(tr(self.ui_language, "save_as"))
-        self.export_action.setText(tr(self.ui_language, "export_recordings"))
-        self.open_folder_action.setText(tr(self.ui_language, "open_folder"))
-        self.export_voicebank_action.setText(tr(self.ui_language, "export_voicebank"))
-        self.edit_voicebank_action.setText(tr(self.ui_language, "edit_voicebank"))
-        self.save_reclist_action.setText(tr(self.ui_language, "save_reclist_to"))
-        self.recent_menu.setTitle(tr(self.ui_language, "recent_sessions"))
+            self.help_menu.setTitle(t["help"])
+
+        self.new_action.setText(t["new_session"])
+        self.open_action.setText(t["open_session"])
+        self.save_action.setText(t["save_session"])
+        self.save_as_action.setText(t["save_as"])
+        self.export_action.setText(t["export_recordings"])
+        self.open_folder_action.setText(t["open_folder"])
+        self.export_voicebank_action.setText(t["export_voicebank"])
+        self.edit_voicebank_action.setText(t["edit_voicebank"])
+        self.save_reclist_action.setText(t["save_reclist_to"])
+        self.recent_menu.setTitle(t["recent_sessions"])
         if hasattr(self, "back_action"):
-            self.back_action.setText(tr(self.ui_language, "back_exit"))
-        self.import_reclist_action.setText(tr(self.ui_language, "import_reclist"))
-        self.import_oremo_action.setText(tr(self.ui_language, "import_oremo_comment"))
-        self.import_voicebank_action.setText(tr(self.ui_language, "import_voicebank"))
-        self.import_bgm_action.setText(tr(self.ui_language, "import_bgm"))
-        self.generate_bgm_action.setText(tr(self.ui_language, "generate_bgm"))
-        self.vst_batch_action.setText(tr(self.ui_language, "apply_vst"))
-        self.session_settings_action.setText(tr(self.ui_language, "session_settings"))
-        self.audio_settings_action.setText(tr(self.ui_language, "audio_devices"))
-        self.vst_tools_action.setText(tr(self.ui_language, "vst_tools"))
-        self.ui_settings_action.setText(tr(self.ui_language, "ui_settings"))
-        self.undo_action.setText(tr(self.ui_language, "undo"))
+            self.back_action.setText(t["back_exit"])
+        self.import_reclist_action.setText(t["import_reclist"])
+        self.import_oremo_action.setText(t["import_oremo_comment"])
+        self.import_voicebank_action.setText(t["import_voicebank"])
+        self.import_bgm_action.setText(t["import_bgm"])
+        self.generate_bgm_action.setText(t["generate_bgm"])
+        self.vst_batch_action.setText(t["apply_vst"])
+        self.session_settings_action.setText(t["session_settings"])
+        self.audio_settings_action.setText(t["audio_devices"])
+        self.vst_tools_action.setText(t["vst_tools"])
+        self.ui_settings_action.setText(t["ui_settings"])
+        self.undo_action.setText(t["undo"])
+        self.redo_action.setText(t["redo"])
         if hasattr(self, "about_action"):
-            self.about_action.setText(tr(self.ui_language, "about"))
+            self.about_action.setText(t["about"])
         if hasattr(self, "check_updates_action"):
-            self.check_updates_action.setText(tr(self.ui_language, "check_updates"))
+            self.check_updates_action.setText(t["check_updates"])
 
         if self.current_item:
             duration = ""
             if self.current_item.duration_sec:
                 duration = f" ({self.current_item.duration_sec:.2f}s)"
             self.current_label.setText(
-                f"{tr(self.ui_language, 'current_item_prefix')}{self.current_item.alias}{duration}"
+                f"{t['current_item_prefix']}{self.current_item.alias}{duration}"
             )
         else:
-            self.current_label.setText(tr(self.ui_language, "current_item"))
+            self.current_label.setText(t["current_item"])
         if self.note_label.text().endswith("--"):
-            self.note_label.setText(tr(self.ui_language, "current_note"))
-        self.record_btn.setText(tr(self.ui_language, "record"))
-        self.stop_btn.setText(tr(self.ui_language, "stop"))
-        self.rerecord_btn.setText(tr(self.ui_language, "rerecord"))
-        self.preview_btn.setText(tr(self.ui_language, "preview_bgm"))
-        self.preview_overlay_btn.setText(tr(self.ui_language, "preview_overlay"))
-        self.cut_btn.setText(tr(self.ui_language, "cut_selection"))
-        self.select_btn.setText(tr(self.ui_language, "select_region"))
-        self.bgm_checkbox.setText(tr(self.ui_language, "bgm_during"))
-        self.auto_next_checkbox.setText(tr(self.ui_language, "auto_next"))
-        self.bgm_level_label.setText(tr(self.ui_language, "bgm_level"))
-        self.bgm_overlay_label.setText(tr(self.ui_language, "bgm_overlay_level"))
-        self.pre_roll_label.setText(tr(self.ui_language, "pre_roll"))
+            self.note_label.setText(t["current_note"])
+        self.record_btn.setText(t["record"])
+        self.stop_btn.setText(t["stop"])
+        self.rerecord_btn.setText(t["rerecord"])
+        self.preview_btn.setText(t["preview_bgm"])
+        self.preview_overlay_btn.setText(t["preview_overlay"])
+        self.cut_btn.setText(t["cut_selection"])
+        self.select_btn.setText(t["select_region"])
+        self.bgm_checkbox.setText(t["bgm_during"])
+        self.auto_next_checkbox.setText(t["auto_next"])
+        self.bgm_level_label.setText(t["bgm_level"])
+        self.bgm_overlay_label.setText(t["bgm_overlay_level"])
+        self.pre_roll_label.setText(t["pre_roll"])
 
         self.table.setHorizontalHeaderLabels([
-            tr(self.ui_language, "table_status"),
-            tr(self.ui_language, "table_alias"),
-            tr(self.ui_language, "table_romaji"),
-            tr(self.ui_language, "table_note"),
-            tr(self.ui_language, "table_comment"),
-            tr(self.ui_language, "table_duration"),
-            tr(self.ui_language, "table_file"),
+            t["table_status"],
+            t["table_alias"],
+            t["table_romaji"],
+            t["table_note"],
+            t["table_comment"],
+            t["table_duration"],
+            t["table_file"],
         ])
 
-        self.wave_plot.setTitle(tr(self.ui_language, "waveform"))
-        self.spec_plot.setTitle(tr(self.ui_language, "spectrum"))
-        self.power_plot.setTitle(tr(self.ui_language, "power"))
-        self.recorded_f0_plot.setTitle(f"{tr(self.ui_language, 'recorded_f0')} (Piano Roll)")
-        self.mel_plot.setTitle(tr(self.ui_language, "mel"))
+        self.wave_plot.setTitle(t["waveform"])
+        self.spec_plot.setTitle(t["spectrum"])
+        self.power_plot.setTitle(t["power"])
+        self.recorded_f0_plot.setTitle(f"{t['recorded_f0']} (Piano Roll)")
+        self.mel_plot.setTitle(t["mel"])
 
         if self.plot_tabs.count() >= 5:
-            self.plot_tabs.setTabText(0, tr(self.ui_language, "waveform"))
-            self.plot_tabs.setTabText(1, tr(self.ui_language, "spectrum"))
-            self.plot_tabs.setTabText(2, tr(self.ui_language, "power"))
-            self.plot_tabs.setTabText(3, tr(self.ui_language, "recorded_f0"))
-            self.plot_tabs.setTabText(4, tr(self.ui_language, "mel"))
+            self.plot_tabs.setTabText(0, t["waveform"])
+            self.plot_tabs.setTabText(1, t["spectrum"])
+            self.plot_tabs.setTabText(2, t["power"])
+            self.plot_tabs.setTabText(3, t["recorded_f0"])
+            self.plot_tabs.setTabText(4, t["mel"])
 
     def _apply_theme(self) -> None:
         if self.ui_theme == "dark":
@@ -3290,11 +3330,9 @@ class MainWindow(QtWidgets.QMainWindow):
         self.selected_audio = None
         self._clear_analysis()
         self._stop_playback()
-        out_dir = self.session.recordings_dir()
-        out_dir.mkdir(parents=True, exist_ok=True)
-        prefix = self.session.output_prefix if self.session else ""
-        suffix = self.session.output_suffix if self.session else ""
-        out_path = out_dir / f"{prefix}{self.current_item.alias}{suffix}.wav"
+        rel_path = self._recording_rel_path(self.current_item.alias)
+        out_path = self._session_dir() / rel_path
+        out_path.parent.mkdir(parents=True, exist_ok=True)
         try:
             if (
                 self.bgm_checkbox.isChecked()
@@ -3306,6 +3344,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 self.audio.load_bgm_wav(self.voicebank_samples[self.current_item.alias])
             self.audio.set_pre_roll_ms(self.pre_roll_spin.value())
             self.audio.start_recording(out_path, self.bgm_checkbox.isChecked())
+            self.visual_timer.start()
             self._log_event("record_start", self.current_item.alias)
         except Exception as exc:
             logger.exception("Recording failed")
@@ -3343,6 +3382,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 ):
                     self.audio.load_bgm_wav(self.voicebank_samples[self.current_item.alias])
                 self.audio.play_bgm()
+                self.visual_timer.start()
         except Exception as exc:
             self._show_error(str(exc))
 
@@ -3356,28 +3396,32 @@ class MainWindow(QtWidgets.QMainWindow):
             if self.audio._bgm_overlay is None or getattr(self.audio._bgm_overlay, "size", 0) == 0:
                 self._show_error("No overlay BGM set")
                 return
-            self.audio._bgm_data = np.zeros(int(self.audio.sample_rate * 2), dtype=np.float32)
+            self.audio._bgm_data = _silence(int(self.audio.sample_rate * 2))
             self.audio._bgm_pos = 0
             self.audio._bgm_overlay_pos = 0
             self.audio.set_overlay_enabled(True)
             self.audio.play_bgm()
+            self.visual_timer.start()
         except Exception as exc:
             self._show_error(str(exc))
 
     def _finalize_recording(self) -> None:
         if not self.session or not self.current_item:
             return
-        prefix = self.session.output_prefix if self.session else ""
-        suffix = self.session.output_suffix if self.session else ""
-        rel_path = Path("Recordings") / f"{prefix}{self.current_item.alias}{suffix}.wav"
-        abs_path = self.session.session_dir() / rel_path
+        rel_path = self._recording_rel_path(self.current_item.alias)
+        abs_path = self._session_dir() / rel_path
         if abs_path.exists():
-            info = sf.info(str(abs_path))
-            self.current_item.duration_sec = info.frames / info.samplerate
+            duration = read_wav_duration(abs_path)
+            if duration is None:
+                info = sf.info(str(abs_path))
+                duration = info.frames / info.samplerate
+            self.current_item.duration_sec = duration
             self.current_item.wav_path = str(rel_path)
+            if self.current_item.status == ItemStatus.PENDING:
+                self._recorded_count += 1
             self.current_item.status = ItemStatus.RECORDED
-            self._refresh_table()
-            self._save_session()
+            self._table_update_row(self._model_row_of(self.current_item))
+            self._schedule_save()
             self._analyze_selected_item()
             self._start_note_analysis()
             if self.playhead:
@@ -3404,69 +3448,183 @@ class MainWindow(QtWidgets.QMainWindow):
         self.audio.set_pre_roll_ms(self.pre_roll_spin.value())
 
     def _refresh_table(self) -> None:
+        self._row_to_model_index = None
+        self._path_to_row.clear()
+        self._pending_note_updates.clear()
+        self._table_generation += 1
         if not self.session:
+            self._table_target_note = ""
+            self._alias_index.clear()
+            self._recorded_count = 0
             self.table.setRowCount(0)
             return
+        self._rebuild_alias_index()
         note_sort_state = getattr(self, "_note_sort_state", 0)
-        self._suppress_item_changed = True
-        self.table.setSortingEnabled(False)
-        self.table.setRowCount(len(self.session.items))
         target_note = self._target_bgm_note()
-        for row, item in enumerate(self.session.items):
-            status_item = QtWidgets.QTableWidgetItem(item.status.value)
-            status_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
-            self.table.setItem(row, 0, status_item)
-
-            alias_item = QtWidgets.QTableWidgetItem(item.alias)
-            alias_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
-            self.table.setItem(row, 1, alias_item)
-            romaji_text = ""
-            if item.romaji is None and needs_romaji(item.alias):
-                item.romaji = "_".join(kana_to_romaji_tokens(item.alias))
-            if item.romaji:
-                romaji_text = item.romaji.replace(" ", "_")
-            romaji_item = QtWidgets.QTableWidgetItem(romaji_text)
-            romaji_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
-            self.table.setItem(row, 2, romaji_item)
-            note_text = item.note or ""
-            if target_note and item.wav_path:
-                sung_note = self._get_cached_sung_note(item.wav_path)
-                if sung_note is None:
-                    note_text = "..."
-                else:
-                    note_text = self._format_note_check(target_note, sung_note)
+        self._table_target_note = target_note
+        if target_note:
+            self._ensure_note_index()
+        self._suppress_item_changed = True
+        self.table.setUpdatesEnabled(False)
+        try:
+            self.table.setSortingEnabled(False)
+            self.table.setRowCount(len(self.session.items))
+            self.table.blockSignals(True)
+            try:
+                for row, item in enumerate(self.session.items):
+                    self._populate_table_row(row, item, target_note)
+            finally:
+                self.table.blockSignals(False)
+            if note_sort_state != 0:
+                order = (
+                    QtCore.Qt.SortOrder.AscendingOrder
+                    if note_sort_state > 0
+                    else QtCore.Qt.SortOrder.DescendingOrder
+                )
+                self.table.setSortingEnabled(True)
+                self.table.sortItems(3, order)
+        finally:
+            self.table.setUpdatesEnabled(True)
+            self._suppress_item_changed = False
+
+    def _table_cell(self, row: int, col: int, flags: QtCore.Qt.ItemFlag) -> QtWidgets.QTableWidgetItem:
+        cell = self.table.item(row, col)
+        if cell is None:
+            cell = QtWidgets.QTableWidgetItem()
+            cell.setFlags(flags)
+            self.table.setItem(row, col, cell)
+        return cell
+
+    def _populate_table_row(self, row: int, item: Item, target_note: str) -> None:
+        default_flags = self._DEFAULT_ITEM_FLAGS
+        editable_flags = self._EDITABLE_ITEM_FLAGS
+        status_item = self._table_cell(row, 0, default_flags)
+        status_item.setText(item.status.value)
+        status_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
+
+        self._table_cell(row, 1, editable_flags).setText(item.alias)
+        romaji_text = ""
+        if item.romaji is None:
+            item.romaji = alias_romaji(item.alias)
+        if item.romaji:
+            romaji_text = item.romaji.replace(" ", "_")
+        self._table_cell(row, 2, default_flags).setText(romaji_text)
+        if item.wav_path:
+            abs_key = str(self._abs_wav_path(item.wav_path))
+            self._path_to_row[abs_key] = row
+        note_text = item.note or ""
+        if target_note and item.wav_path:
+            cached = self._sung_note_cache.get(abs_key)
+            sung_note = cached[1] if cached else self._get_cached_sung_note(item.wav_path)
+            if sung_note is None:
+                note_text = "..."
+            else:
+                note_text = self._format_note_check(target_note, sung_note)
+        note_item = self.table.item(row, 3)
+        if isinstance(note_item, NoteTableItem):
+            note_item.set_note(note_text, self._note_sort_priority(note_text))
+        else:
             note_item = NoteTableItem(note_text, self._note_sort_priority(note_text))
-            note_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
+            note_item.setFlags(default_flags)
             self.table.setItem(row, 3, note_item)
-            comment_item = QtWidgets.QTableWidgetItem(item.notes or "")
-            comment_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
-            self.table.setItem(row, 4, comment_item)
-            duration = f"{item.duration_sec:.2f}" if item.duration_sec else ""
-            duration_item = QtWidgets.QTableWidgetItem(duration)
-            duration_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
-            self.table.setItem(row, 5, duration_item)
-
-            file_item = QtWidgets.QTableWidgetItem(item.wav_path or "")
-            file_item.setData(QtCore.Qt.ItemDataRole.UserRole, row)
-            self.table.setItem(row, 6, file_item)
-            for col in range(7):
-                item_widget = self.table.item(row, col)
-                if item_widget is None:
-                    continue
-                flags = item_widget.flags()
-                if col in (1, 4):
-                    item_widget.setFlags(flags | QtCore.Qt.ItemFlag.ItemIsEditable)
-                else:
-                    item_widget.setFlags(flags & ~QtCore.Qt.ItemFlag.ItemIsEditable)
+        self._table_cell(row, 4, editable_flags).setText(item.notes or "")
+        duration = f"{item.duration_sec:.2f}" if item.duration_sec else ""
+        self._table_cell(row, 5, default_flags).setText(duration)
+        self._table_cell(row, 6, default_flags).setText(item.wav_path or "")
+
+    def _rebuild_alias_index(self) -> None:
+        self._alias_index = {item.alias: item for item in self.session.items} if self.session else {}
+        self._recorded_count = (
+            sum(1 for item in self.session.items if item.status != ItemStatus.PENDING) if self.session else 0
+        )
+
+    def _item_in_session(self, item: Item) -> bool:
+        if self._alias_index.get(item.alias) is item:
+            return True
+        return any(it is item for it in self.session.items) if self.session else False
+
+    def _drop_alias(self, item: Item) -> None:
+        if self._alias_index.get(item.alias) is item:
+            del self._alias_index[item.alias]
+
+    def _table_rows_incremental(self) -> bool:
+        return bool(self.session) and getattr(self, "_note_sort_state", 0) == 0 and not self.table.isSortingEnabled()
+
+    def _begin_table_edit(self) -> None:
+        self._flush_note_updates()
+        self._suppress_item_changed = True
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+
+    def _end_table_edit(self, first_shifted: Optional[int] = None) -> None:
+        if first_shifted is not None:
+            for row in range(first_shifted, self.table.rowCount()):
+                cell = self.table.item(row, 0)
+                if cell is not None:
+                    cell.setData(QtCore.Qt.ItemDataRole.UserRole, row)
+            self._path_to_row.clear()
+            for row, item in enumerate(self.session.items):
+                if item.wav_path:
+                    self._path_to_row[str(self._abs_wav_path(item.wav_path))] = row
+            self._table_generation += 1
+        self._row_to_model_index = None
+        self.table.blockSignals(False)
+        self.table.setUpdatesEnabled(True)
         self._suppress_item_changed = False
-        if note_sort_state != 0:
-            order = (
-                QtCore.Qt.SortOrder.AscendingOrder
-                if note_sort_state > 0
-                else QtCore.Qt.SortOrder.DescendingOrder
-            )
-            self.table.setSortingEnabled(True)
-            self.table.sortItems(3, order)
+
+    def _table_update_row(self, row: int) -> None:
+        if not self._table_rows_incremental() or not (0 <= row < len(self.session.items)):
+            self._refresh_table()
+            return
+        self._begin_table_edit()
+        try:
+            self._populate_table_row(row, self.session.items[row], self._table_target_note)
+        finally:
+            self._end_table_edit()
+
+    def _model_row_of(self, item: Item) -> int:
+        items = self.session.items if self.session else []
+        row = self.table.currentRow()
+        if 0 <= row < self.table.rowCount():
+            row_map = self._row_model_map()
+            hint = row_map[row] if row < len(row_map) else row
+            if 0 <= hint < len(items) and items[hint] is item:
+                return hint
+        return next((idx for idx, candidate in enumerate(items) if candidate is item), -1)
+
+    def _table_insert_row(self, row: int) -> None:
+        if not self._table_rows_incremental() or self.table.rowCount() + 1 != len(self.session.items):
+            self._refresh_table()
+            return
+        self._begin_table_edit()
+        try:
+            self.table.insertRow(row)
+            self._populate_table_row(row, self.session.items[row], self._table_target_note)
+        finally:
+            self._end_table_edit(row)
+
+    def _table_remove_rows(self, rows: list[int]) -> None:
+        if not self._table_rows_incremental() or self.table.rowCount() - len(rows) != len(self.session.items):
+            self._refresh_table()
+            return
+        if not rows:
+            return
+        runs: list[tuple[int, int]] = []
+        for row in sorted(rows, reverse=True):
+            if runs and runs[-1][0] == row + 1:
+                runs[-1] = (row, runs[-1][1] + 1)
+            else:
+                runs.append((row, 1))
+        if len(rows) > 100 and len(rows) / len(runs) < 10:
+            self._refresh_table()
+            return
+        model = self.table.model()
+        self._begin_table_edit()
+        try:
+            for first, count in runs:
+                model.removeRows(first, count)
+        finally:
+            self._end_table_edit(min(rows))
 
     def _target_bgm_note(self) -> str:
         if not self.session:
@@ -3480,11 +3638,14 @@ class MainWindow(QtWidgets.QMainWindow):
             return self.session.bgm_overlay_note.strip()
         return ""
 
-    @staticmethod
-    def _normalize_note(note: str) -> str:
-        return note.strip().upper().replace(" ", "")
+    _NOTE_NORMALIZE_TABLE = str.maketrans("abcdefghijklmnopqrstuvwxyz", "ABCDEFGHIJKLMNOPQRSTUVWXYZ", " ")
+
+    @classmethod
+    def _normalize_note(cls, note: str) -> str:
+        return note.strip().translate(cls._NOTE_NORMALIZE_TABLE)
 
     @staticmethod
+    @lru_cache(maxsize=256)
     def _note_to_midi(note: str) -> Optional[int]:
         freq = note_to_freq(note)
         if not freq:
@@ -3494,11 +3655,13 @@ class MainWindow(QtWidgets.QMainWindow):
             return None
         return int(round(midi))
 
-    def _format_note_check(self, target: str, sung: str) -> str:
-        target_midi = self._note_to_midi(target)
-        sung_midi = self._note_to_midi(sung)
+    @staticmethod
+    @lru_cache(maxsize=512)
+    def _format_note_check(target: str, sung: str) -> str:
+        target_midi = MainWindow._note_to_midi(target)
+        sung_midi = MainWindow._note_to_midi(sung)
         if target_midi is None or sung_midi is None:
-            is_match = self._normalize_note(target) == self._normalize_note(sung)
+            is_match = MainWindow._normalize_note(target) == MainWindow._normalize_note(sung)
             mark = "✅" if is_match else "❌"
             return f"{mark} ({sung})"
 
@@ -3523,12 +3686,47 @@ class MainWindow(QtWidgets.QMainWindow):
             return 2
         return 3
 
+    def _clear_sung_note_cache(self) -> None:
+        self._sung_note_cache.clear()
+        self._note_index_key = None
+        self._note_index_saved = {}
+
+    def _note_index_params(self) -> Optional[tuple]:
+        cache_dir = self._analysis_cache_dir()
+        if cache_dir is None:
+            return None
+        return (cache_dir, self.pitch_algo, self.session.sample_rate, self.session.bit_depth)
+
+    def _ensure_note_index(self) -> None:
+        params = self._note_index_params()
+        if params is None or params == self._note_index_key:
+            return
+        self._note_index_key = params
+        loaded = _load_note_index(*params)
+        for path, entry in loaded.items():
+            try:
+                mtime = os.stat(path).st_mtime
+            except OSError:
+                continue
+            if entry[0] == mtime:
+                self._sung_note_cache.setdefault(path, entry)
+        self._note_index_saved = loaded
+
+    def _save_note_index(self) -> None:
+        params = self._note_index_params()
+        if params is None or params != self._note_index_key or self._sung_note_cache == self._note_index_saved:
+            return
+        try:
+            _save_note_index(*params, self._sung_note_cache)
+            self._note_index_saved = dict(self._sung_note_cache)
+        except OSError:
+            logger.exception("Failed to save note index")
+
     def _get_cached_sung_note(self, wav_rel: str) -> Optional[str]:
         if not self.session:
             return None
-        abs_path = Path(wav_rel)
-        if not abs_path.is_absolute():
-            abs_path = self.session.session_dir() / abs_path
+        self._ensure_note_index()
+        abs_path = self._abs_wav_path(wav_rel)
         cache_key = str(abs_path)
         cached = self._sung_note_cache.get(cache_key)
         if not cached:
@@ -3542,9 +3740,7 @@ class MainWindow(QtWidgets.QMainWindow):
     def _recompute_note_for_selection(self) -> None:
         if not self.session or not self.current_item or not self.current_item.wav_path:
             return
-        abs_path = Path(self.current_item.wav_path)
-        if not abs_path.is_absolute():
-            abs_path = self.session.session_dir() / abs_path
+        abs_path = self._abs_wav_path(self.current_item.wav_path)
         if not abs_path.exists():
             return
         cache_key = str(abs_path)
@@ -3567,13 +3763,12 @@ class MainWindow(QtWidgets.QMainWindow):
     def _collect_note_analysis_files(self) -> list[str]:
         if not self.session:
             return []
+        self._ensure_note_index()
         files: list[str] = []
         for item in self.session.items:
             if not item.wav_path:
                 continue
-            abs_path = Path(item.wav_path)
-            if not abs_path.is_absolute():
-                abs_path = self.session.session_dir() / abs_path
+            abs_path = self._abs_wav_path(item.wav_path)
             if not abs_path.exists():
                 continue
             try:
@@ -3600,7 +3795,7 @@ class MainWindow(QtWidgets.QMainWindow):
         cache_dir = self._analysis_cache_dir()
         ref_bits = self.session.bit_depth if self.session else 16
         self._note_worker = NoteAnalysisWorker(
-            files,
+            self._note_analysis_jobs(files),
             self.session.sample_rate,
             self.pitch_algo,
             cache_dir,
@@ -3614,6 +3809,11 @@ class MainWindow(QtWidgets.QMainWindow):
         self._update_note_progress(0, len(files))
         self._note_worker.start()
 
+    def _note_analysis_jobs(self, files: list[str]) -> list[tuple[int, str]]:
+        self._note_jobs_generation = self._table_generation
+        rows = self._path_to_row
+        return [(rows.get(path, -1), path) for path in files]
+
     def _load_note_from_disk_cache(self, abs_path: Path) -> Optional[str]:
         if not self.session:
             return None
@@ -3640,6 +3840,10 @@ class MainWindow(QtWidgets.QMainWindow):
             return str(note)
         if has_pitch and f0s.size:
             computed = _note_from_f0s(f0s)
+            write_key = str(abs_path)
+            write_state = (mtime, self.pitch_algo, computed)
+            if self._last_cache_write.get(write_key) == write_state:
+                return computed
             _save_analysis_cache_to_disk(
                 cache_dir,
                 abs_path,
@@ -3649,18 +3853,19 @@ class MainWindow(QtWidgets.QMainWindow):
                 ref_bits,
                 times,
                 f0s,
-                np.array([], dtype=np.float32),
-                np.array([], dtype=np.float32),
-                np.array([], dtype=np.float32),
-                np.array([], dtype=np.float32),
+                _EMPTY_F32,
+                _EMPTY_F32,
+                _EMPTY_F32,
+                _EMPTY_F32,
                 merge_existing=True,
                 note=computed,
             )
+            self._last_cache_write[write_key] = write_state
             return computed
         return None
 
     def _start_note_analysis(self) -> None:
-        target_note = self._target_bgm_note()
+        target_note = self._table_target_note
         if not target_note or not self.session:
             return
         files = self._collect_note_analysis_files()
@@ -3685,31 +3890,81 @@ class MainWindow(QtWidgets.QMainWindow):
                 worker.wait(2000)
             setattr(self, attr, None)
 
+    def _session_dir(self) -> Path:
+        session = self.session
+        if session is not self._session_dir_owner or session.base_path is not self._session_dir_base:
+            self._session_dir_owner = session
+            self._session_dir_base = session.base_path
+            self._session_dir_path = session.session_dir()
+            self._abs_path_cache.clear()
+            self._analysis_cache_path = None
+        return self._session_dir_path
+
+    def _recording_rel_path(self, alias: str) -> Path:
+        return RECORDINGS_DIR / f"{self.session.output_prefix}{alias}{self.session.output_suffix}.wav"
+
+    def _abs_wav_path(self, wav_path: str) -> Path:
+        session_dir = self._session_dir()
+        abs_path = self._abs_path_cache.get(wav_path)
+        if abs_path is None:
+            abs_path = Path(wav_path)
+            if not abs_path.is_absolute():
+                abs_path = session_dir / abs_path
+            self._abs_path_cache[wav_path] = abs_path
+        return abs_path
+
     def _analysis_cache_dir(self) -> Optional[Path]:
         if not self.session:
             return None
-        path = self.session.session_dir() / "_analysis_cache"
-        path.mkdir(parents=True, exist_ok=True)
-        return path
-
-    def _on_note_analysis_result(self, path: str, mtime: float, note: str) -> None:
+        session_dir = self._session_dir()
+        if self._analysis_cache_path is None:
+            path = session_dir / "_analysis_cache"
+            path.mkdir(parents=True, exist_ok=True)
+            _sweep_stale_cache_tmp(path)
+            self._analysis_cache_path = path
+        return self._analysis_cache_path
+
+    def _on_note_analysis_result(self, row: int, path: str, mtime: float, note: str) -> None:
         self._sung_note_cache[path] = (mtime, note)
         if not self.session:
             return
-        target_note = self._target_bgm_note()
+        target_note = self._table_target_note
         if not target_note:
             return
-        for row, item in enumerate(self.session.items):
-            if not item.wav_path:
-                continue
-            abs_path = Path(item.wav_path)
-            if not abs_path.is_absolute():
-                abs_path = self.session.session_dir() / abs_path
-            if str(abs_path) == path:
-                note_text = self._format_note_check(target_note, note)
-                note_item = NoteTableItem(note_text, self._note_sort_priority(note_text))
-                self.table.setItem(row, 3, note_item)
-                break
+        if row < 0 or self._note_jobs_generation != self._table_generation:
+            row = self._path_to_row.get(path)
+        if row is not None:
+            note_text = self._format_note_check(target_note, note)
+            self._pending_note_updates[row] = (note_text, self._note_sort_priority(note_text))
+            if not self._note_flush_timer.isActive():
+                self._note_flush_timer.start()
+
+    def _flush_note_updates(self) -> None:
+        if not self._pending_note_updates:
+            return
+        pending = self._pending_note_updates
+        self._pending_note_updates = {}
+        sorting = self.table.isSortingEnabled()
+        self.table.setSortingEnabled(False)
+        self.table.setUpdatesEnabled(False)
+        self.table.blockSignals(True)
+        try:
+            for row, (note_text, priority) in pending.items():
+                if row >= self.table.rowCount():
+                    continue
+                note_item = self.table.item(row, 3)
+                if isinstance(note_item, NoteTableItem):
+                    note_item.set_note(note_text, priority)
+                else:
+                    note_item = NoteTableItem(note_text, priority)
+                    note_item.setFlags(self._DEFAULT_ITEM_FLAGS)
+                    self.table.setItem(row, 3, note_item)
+        finally:
+            self.table.blockSignals(False)
+            self.table.setUpdatesEnabled(True)
+        if sorting:
+            self.table.setSortingEnabled(True)
+            self._row_to_model_index = None
 
     def _on_note_analysis_finished(self) -> None:
         if self._note_analysis_pending:
@@ -3719,7 +3974,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 cache_dir = self._analysis_cache_dir()
                 ref_bits = self.session.bit_depth if self.session else 16
                 self._note_worker = NoteAnalysisWorker(
-                    files,
+                    self._note_analysis_jobs(files),
                     self.session.sample_rate,
                     self.pitch_algo,
                     cache_dir,
@@ -3752,7 +4007,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _update_visuals(self) -> None:
         if not self.audio.is_active():
+            self.visual_timer.stop()
+            return
+        if self._visual_inflight:
             return
+        cursor = self.audio.get_write_cursor()
+        if cursor == self._visual_last_cursor:
+            return
+        self._visual_inflight = True
+        try:
+            self._draw_visuals()
+        finally:
+            self._visual_inflight = False
+        self._visual_last_cursor = cursor
+
+    def _draw_visuals(self) -> None:
         if self.audio.preview and not self.audio.recording:
             buffer = self.audio.get_preview_audio()
         else:
@@ -3780,29 +4049,67 @@ class MainWindow(QtWidgets.QMainWindow):
                 wave_sr = self.audio.sample_rate
             else:
                 wave_sr = self.audio.get_waveform_sample_rate()
-        wave_x = np.linspace(0, len(wave) / wave_sr, len(wave))
-        if len(wave) > 20000:
-            step = max(1, len(wave) // 20000)
-            wave = wave[::step]
-            wave_x = wave_x[::step]
+        wave_x = self._cached_wave_axis(len(wave), wave_sr)
+        if len(wave) > WAVE_PLOT_POINTS:
+            wave = _waveform_envelope(wave, out=self._wave_env)
+            self._wave_env = wave
         self.wave_curve.setData(wave_x, wave)
-        self.wave_plot.enableAutoRange(axis="xy", enable=True)
-        self.wave_plot.plotItem.vb.autoRange()
+        self._wave_render_src = None
+        self._update_wave_range(float(wave_x[-1]), float(wave.min()), float(wave.max()))
 
-        freqs, mag = compute_fft(buffer, self.audio.sample_rate)
+        freqs, mag = compute_fft(buffer, self.audio.sample_rate, n_fft=next_regular(len(buffer)))
         self.spec_curve.setData(freqs, mag)
 
-        rms = compute_rms(buffer)
-        self.power_history.append(rms)
-        if len(self.power_history) > self.history_size:
-            self.power_history.pop(0)
-        power_x = np.arange(len(self.power_history)) * (self.visual_timer.interval() / 1000.0)
-        self.power_curve.setData(power_x, self.power_history)
+        self._push_power(compute_rms(buffer))
+        n = self._power_count
+        start = (self._power_head - n) % self.history_size
+        self.power_curve.setData(self._power_x[:n], self._power_ring[start:start + n])
 
         f0 = estimate_f0(buffer, self.audio.sample_rate)
         note, cents = note_from_f0(f0)
         self.note_label.setText(f"{tr(self.ui_language, 'current_note_prefix')}{note} ({cents:+.1f} cents)")
 
+    def _push_power(self, rms: float) -> None:
+        head = self._power_head
+        self._power_ring[head] = rms
+        self._power_ring[head + self.history_size] = rms
+        self._power_head = (head + 1) % self.history_size
+        self._power_count = min(self._power_count + 1, self.history_size)
+
+    def _update_wave_range(self, x_max: float, y_min: float, y_max: float) -> None:
+        last = self._last_wave_range
+        if last is not None:
+            x_hi, y_lo, y_hi = last
+            fits = x_max <= x_hi and y_lo <= y_min and y_max <= y_hi
+            tight = x_max >= 0.8 * x_hi and (y_max - y_min) >= 0.8 * (y_hi - y_lo)
+            if fits and tight:
+                return
+        margin = 0.05 * max(y_max - y_min, 1e-6)
+        new = (x_max * 1.05, y_min - margin, y_max + margin)
+        self._last_wave_range = new
+        self.wave_plot.setRange(
+            xRange=(0.0, new[0]),
+            yRange=(new[1], new[2]),
+            padding=0,
+            disableAutoRange=True,
+        )
+
+    def _update_power_axis(self) -> None:
+        interval_s = self.visual_timer.interval() / 1000.0
+        self._power_x = np.arange(self.history_size, dtype=np.float32) * np.float32(interval_s)
+
+    def _cached_wave_axis(self, length: int, sr: float) -> np.ndarray:
+        key = (length, float(sr))
+        wave_x = self._wave_x_cache.get(key)
+        if wave_x is None:
+            wave_x = _waveform_axis(length, sr)
+            self._wave_x_cache[key] = wave_x
+            while len(self._wave_x_cache) > 4:
+                self._wave_x_cache.popitem(last=False)
+        else:
+            self._wave_x_cache.move_to_end(key)
+        return wave_x
+
     def _plot_clicked(self, plot: pg.PlotWidget, event: QtCore.QEvent) -> None:
         if not self.playhead:
             return
@@ -3823,30 +4130,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if self.table:
             if self.table.state() == QtWidgets.QAbstractItemView.State.EditingState:
                 return False
-            if widget and self.table.isAncestorOf(widget):
-                if isinstance(
-                    widget,
-                    (
-                        QtWidgets.QLineEdit,
-                        QtWidgets.QTextEdit,
-                        QtWidgets.QPlainTextEdit,
-                        QtWidgets.QSpinBox,
-                        QtWidgets.QDoubleSpinBox,
-                        QtWidgets.QComboBox,
-                    ),
-                ):
-                    return False
-        if isinstance(
-            widget,
-            (
-                QtWidgets.QLineEdit,
-                QtWidgets.QTextEdit,
-                QtWidgets.QPlainTextEdit,
-                QtWidgets.QSpinBox,
-                QtWidgets.QDoubleSpinBox,
-                QtWidgets.QComboBox,
-            ),
-        ):
+        if type(widget) in self._INPUT_WIDGET_TYPES or isinstance(widget, self._INPUT_WIDGET_CLASSES):
             return False
         return True
 
@@ -3869,7 +4153,7 @@ class MainWindow(QtWidgets.QMainWindow):
             if not self.audio.recording and not self.audio.preview:
                 if self.playing:
                     if self.play_start_time is not None:
-                        elapsed = self.play_start_time.elapsed() / 1000.0
+                        elapsed = self.play_start_time.nsecsElapsed() * 1e-9
                         self._paused_pos = max(0.0, self.play_start_pos + elapsed)
                     else:
                         self._paused_pos = 0.0
@@ -3978,10 +4262,12 @@ class MainWindow(QtWidgets.QMainWindow):
             sd.stop()
             sd.play(audio[start_sample:], samplerate=sr, device=output_device)
             self.playing = True
+            self.play_timer.start()
             self.play_start_time = QtCore.QElapsedTimer()
             self.play_start_time.start()
-            self.play_start_pos = start_sample / sr
-            self.play_duration = (len(audio) - start_sample) / sr
+            self._play_inv_sr = 1.0 / sr
+            self.play_start_pos = start_sample * self._play_inv_sr
+            self.play_duration = (len(audio) - start_sample) * self._play_inv_sr
             self.playhead.setVisible(True)
             self.playhead.setPos(self.play_start_pos)
         except Exception as exc:
@@ -3989,35 +4275,21 @@ class MainWindow(QtWidgets.QMainWindow):
 
     def _update_playhead(self) -> None:
         if not self.playing or not self.playhead or self.play_start_time is None:
+            self.play_timer.stop()
             return
-        elapsed = self.play_start_time.elapsed() / 1000.0
+        elapsed = self.play_start_time.nsecsElapsed() * 1e-9
         pos = self.play_start_pos + elapsed
         self.playhead.setPos(pos)
-        if hasattr(self, "spec_playhead"):
-            self.spec_playhead.setVisible(True)
-            self.spec_playhead.setPos(pos)
-        if hasattr(self, "power_playhead"):
-            self.power_playhead.setVisible(True)
-            self.power_playhead.setPos(pos)
-        if hasattr(self, "recorded_f0_playhead"):
-            self.recorded_f0_playhead.setVisible(True)
-            self.recorded_f0_playhead.setPos(pos)
-        if hasattr(self, "mel_playhead"):
-            self.mel_playhead.setVisible(True)
-            self.mel_playhead.setPos(pos)
+        for line in self._playhead_lines:
+            line.setVisible(True)
+            line.setPos(pos)
         if elapsed >= self.play_duration:
             self.playing = False
             self._paused_audio = None
             self._paused_pos = 0.0
             self._paused_sr = 0
-            if hasattr(self, "spec_playhead"):
-                self.spec_playhead.setVisible(False)
-            if hasattr(self, "power_playhead"):
-                self.power_playhead.setVisible(False)
-            if hasattr(self, "recorded_f0_playhead"):
-                self.recorded_f0_playhead.setVisible(False)
-            if hasattr(self, "mel_playhead"):
-                self.mel_playhead.setVisible(False)
+            for line in self._playhead_lines:
+                line.setVisible(False)
 
     def _stop_playback(self) -> None:
         if self.playing:
@@ -4026,16 +4298,8 @@ class MainWindow(QtWidgets.QMainWindow):
         self._paused_audio = None
         self._paused_pos = 0.0
         self._paused_sr = 0
-        if hasattr(self, "spec_playhead"):
-            self.spec_playhead.setVisible(False)
-        if hasattr(self, "power_playhead"):
-            self.power_playhead.setVisible(False)
-        if hasattr(self, "recorded_f0_playhead"):
-            self.recorded_f0_playhead.setVisible(False)
-        if hasattr(self, "mel_playhead"):
-            self.mel_playhead.setVisible(False)
-        if hasattr(self, "mel_playhead"):
-            self.mel_playhead.setVisible(False)
+        for line in self._playhead_lines:
+            line.setVisible(False)
 
     def _update_recorded_analysis(self) -> None:
         audio = self.selected_audio if self.selected_audio is not None else self.audio.get_waveform_audio()
@@ -4054,7 +4318,7 @@ class MainWindow(QtWidgets.QMainWindow):
         self._stop_recorded_worker()
         ref_bits = self.session.bit_depth if self.session else 16
         cache_dir = self._analysis_cache_dir()
-        empty = np.array([], dtype=np.float32)
+        empty = _EMPTY_F32
         times = empty
         f0s = empty
         mel_db = empty
@@ -4138,7 +4402,11 @@ class MainWindow(QtWidgets.QMainWindow):
             cache_key[3] if cache_key else None,
             cache_key[4] if cache_key else None,
         )
-        audio_copy = audio.astype(np.float32, copy=True)
+        if audio.dtype != np.float32 or not audio.flags.c_contiguous:
+            audio_copy = np.ascontiguousarray(audio, dtype=np.float32)
+        else:
+            audio_copy = audio.view()
+        audio_copy.setflags(write=False)
         if compute_pitch:
             self._analysis_pitch_worker = RecordedAnalysisWorker(
                 audio_copy,
@@ -4195,7 +4463,7 @@ class MainWindow(QtWidgets.QMainWindow):
         if cache_key is not None and cache_key != self._current_analysis_key:
             return
 
-        empty = np.array([], dtype=np.float32)
+        empty = _EMPTY_F32
         existing = self._recorded_analysis_cache.get(cache_key) if cache_key else None
         if existing:
             (
@@ -4250,23 +4518,28 @@ class MainWindow(QtWidgets.QMainWindow):
             while len(self._recorded_analysis_cache) > self._analysis_cache_limit:
                 self._recorded_analysis_cache.popitem(last=False)
             if (pitch_done or mel_done or power_done) and self._current_analysis_meta and self._current_analysis_meta[0] is not None:
-                cache_dir = self._analysis_cache_dir()
-                if cache_dir:
-                    _save_analysis_cache_to_disk(
-                        cache_dir,
-                        self._current_analysis_meta[0],
-                        float(self._current_analysis_meta[1]),
-                        str(self._current_analysis_meta[2]),
-                        int(self._current_analysis_meta[3]),
-                        int(self._current_analysis_meta[4]),
-                        times,
-                        f0s,
-                        mel_db,
-                        mel_times,
-                        power_times,
-                        power_db,
-                        merge_existing=True,
-                    )
+                try:
+                    cache_dir = self._analysis_cache_dir()
+                    if cache_dir:
+                        self._queue_analysis_cache_save(
+                            cache_key,
+                            (
+                                cache_dir,
+                                self._current_analysis_meta[0],
+                                float(self._current_analysis_meta[1]),
+                                str(self._current_analysis_meta[2]),
+                                int(self._current_analysis_meta[3]),
+                                int(self._current_analysis_meta[4]),
+                                ex_times if ex_has_pitch else empty,
+                                ex_f0s if ex_has_pitch else empty,
+                                ex_mel_db if ex_has_mel else empty,
+                                ex_mel_times if ex_has_mel else empty,
+                                ex_power_times if ex_has_power else empty,
+                                ex_power_db if ex_has_power else empty,
+                            ),
+                        )
+                except Exception:
+                    logger.exception("Failed to queue analysis cache save")
 
         self._apply_recorded_analysis(
             ex_times if ex_has_pitch else empty,
@@ -4277,6 +4550,28 @@ class MainWindow(QtWidgets.QMainWindow):
             ex_power_db if ex_has_power else empty,
         )
 
+    def _queue_analysis_cache_save(self, cache_key: tuple, args: tuple) -> None:
+        with self._cache_save_lock:
+            queued = cache_key in self._pending_cache_saves
+            self._pending_cache_saves[cache_key] = args
+        if not queued:
+            try:
+                self._cache_save_executor.submit(self._run_analysis_cache_save, cache_key)
+            except RuntimeError:
+                with self._cache_save_lock:
+                    self._pending_cache_saves.pop(cache_key, None)
+                logger.exception("Failed to queue analysis cache save")
+
+    def _run_analysis_cache_save(self, cache_key: tuple) -> None:
+        with self._cache_save_lock:
+            args = self._pending_cache_saves.pop(cache_key, None)
+        if args is None:
+            return
+        try:
+            _save_analysis_cache_to_disk(*args, merge_existing=True)
+        except Exception:
+            logger.exception("Failed to save analysis cache")
+
     def _apply_recorded_analysis(
         self,
         times: np.ndarray,
@@ -4287,13 +4582,16 @@ class MainWindow(QtWidgets.QMainWindow):
         power_db: np.ndarray,
     ) -> None:
         if times.size and f0s.size:
-            midi_vals = np.array([f0_to_midi(f) if f > 0 else np.nan for f in f0s], dtype=np.float32)
-            self.recorded_f0_curve.setData(times, midi_vals)
+            self._midi_scratch = f0s_to_midi(f0s, out=self._midi_scratch)
+            self.recorded_f0_curve.setData(times, self._midi_scratch)
         else:
             self.recorded_f0_curve.setData([], [])
         if mel_db.size:
-            self.mel_img.setImage(mel_db.T, autoLevels=True)
-            self.mel_img.setRect(QtCore.QRectF(0, 0, float(mel_times[-1]) if mel_times.size else 1.0, mel_db.shape[0]))
+            mel_view, used = _mel_display_view(mel_db, self.mel_plot.width())
+            levels = (float(np.nanmin(mel_view)), float(np.nanmax(mel_view)))
+            self.mel_img.setImage(mel_view.T, autoLevels=False, levels=levels)
+            mel_end = float(mel_times[min(used, mel_times.size) - 1]) if mel_times.size else 1.0
+            self.mel_img.setRect(QtCore.QRectF(0, 0, mel_end, mel_db.shape[0]))
             if mel_times.size:
                 self.mel_plot.setLimits(xMin=0, xMax=float(mel_times[-1]))
         else:
@@ -4304,6 +4602,23 @@ class MainWindow(QtWidgets.QMainWindow):
         else:
             self.power_curve.setData([], [])
 
+    def _load_selected_audio(self, abs_path: Path) -> np.ndarray:
+        audio, sr = sf.read(str(abs_path), dtype="float32")
+        needs_resample = sr != self.audio.sample_rate
+        if audio.ndim > 1:
+            if needs_resample:
+                n = audio.shape[0]
+                if self._mono_scratch is None or self._mono_scratch.size < n:
+                    self._mono_scratch = np.empty(n, dtype=np.float32)
+                mono = self._mono_scratch[:n]
+                np.mean(audio, axis=1, out=mono)
+                audio = mono
+            else:
+                audio = np.mean(audio, axis=1)
+        if needs_resample:
+            audio = self.audio._resample(audio, sr, self.audio.sample_rate)
+        return audio
+
     def _analyze_selected_item(self) -> None:
         if not self.session or not self.current_item or not self.current_item.wav_path:
             self.selected_audio = None
@@ -4312,25 +4627,25 @@ class MainWindow(QtWidgets.QMainWindow):
         self._paused_audio = None
         self._paused_pos = 0.0
         self._paused_sr = 0
-        abs_path = self.session.session_dir() / self.current_item.wav_path
+        abs_path = self._abs_wav_path(self.current_item.wav_path)
         if not abs_path.exists():
             self.selected_audio = None
             self._clear_analysis()
             return
         try:
-            audio, sr = sf.read(str(abs_path), dtype="float32")
-            if audio.ndim > 1:
-                audio = np.mean(audio, axis=1)
-            if sr != self.audio.sample_rate:
-                audio = self.audio._resample(audio, sr, self.audio.sample_rate)
+            audio = self._cached_audio(abs_path)
+            if audio is None:
+                audio = self._load_selected_audio(abs_path)
+                self._store_cached_audio(abs_path, audio)
             self.selected_audio = audio
             self._render_waveform(audio)
             snippet = audio[-2048:] if audio.size >= 2048 else audio
             freqs, mag = compute_fft(snippet, self.audio.sample_rate)
             self.spec_curve.setData(freqs, mag)
             rms = compute_rms(snippet)
-            self.power_history = [rms]
-            self.power_curve.setData([0.0], self.power_history)
+            self._power_count = 0
+            self._push_power(rms)
+            self.power_curve.setData([0.0], [rms])
             f0 = estimate_f0(snippet, self.audio.sample_rate)
             note, cents = note_from_f0(f0)
             self.note_label.setText(f"{tr(self.ui_language, 'current_note_prefix')}{note} ({cents:+.1f} cents)")
@@ -4372,6 +4687,7 @@ class MainWindow(QtWidgets.QMainWindow):
         )
         self.table.setSortingEnabled(True)
         self.table.sortItems(3, order)
+        self._row_to_model_index = None
 
     def _table_context_menu(self, pos: QtCore.QPoint) -> None:
         menu = QtWidgets.QMenu(self)
@@ -4397,15 +4713,16 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         note, _ = QtWidgets.QInputDialog.getText(self, tr(self.ui_language, "add_entry"), tr(self.ui_language, "note_optional"))
         alias = alias.strip()
-        if any(item.alias == alias for item in self.session.items):
+        if alias in self._alias_index:
             self._show_error("Alias already exists")
             return
-        romaji = "_".join(kana_to_romaji_tokens(alias)) if needs_romaji(alias) else None
-        self._push_undo_state()
-        self.session.add_item(alias, note.strip() or None, romaji=romaji)
+        romaji = alias_romaji(alias)
+        item = self.session.add_item(alias, note.strip() or None, romaji=romaji)
+        self._alias_index[alias] = item
+        self._push_undo_op(UndoOp("add", len(self.session.items) - 1, after=item.to_dict()))
         self._log_event("add_entry", alias)
-        self._refresh_table()
-        self._save_session()
+        self._table_insert_row(len(self.session.items) - 1)
+        self._schedule_save()
 
     def _delete_entry(self) -> None:
         if not self.session:
@@ -4413,34 +4730,39 @@ class MainWindow(QtWidgets.QMainWindow):
         row = self.table.currentRow()
         if row < 0:
             return
-        self._push_undo_state()
-        alias = self.session.items[row].alias
-        self.session.items.pop(row)
+        removed = self.session.items.pop(row)
+        self._drop_alias(removed)
+        if removed.status != ItemStatus.PENDING:
+            self._recorded_count -= 1
+        alias = removed.alias
+        self._push_undo_op(UndoOp("delete", row, before=removed.to_dict()))
         self._log_event("delete_entry", alias)
-        self._refresh_table()
-        self._save_session()
+        self._table_remove_rows([row])
+        self._schedule_save()
+
+    def _row_model_map(self) -> list[int]:
+        if self._row_to_model_index is None:
+            if self.table.isSortingEnabled():
+                rows: list[int] = []
+                for row in range(self.table.rowCount()):
+                    cell = self.table.item(row, 0)
+                    value = cell.data(QtCore.Qt.ItemDataRole.UserRole) if cell is not None else None
+                    rows.append(value if isinstance(value, int) else row)
+            else:
+                rows = list(range(self.table.rowCount()))
+            self._row_to_model_index = rows
+        return self._row_to_model_index
 
     def _selected_model_indices(self) -> list[int]:
         if not self.session:
             return []
-        model_rows: list[int] = []
         selection = self.table.selectionModel()
         if selection is None:
             return []
-        for index in selection.selectedRows():
-            row = index.row()
-            item = self.table.item(row, 0)
-            if item is not None:
-                model_index = item.data(QtCore.Qt.ItemDataRole.UserRole)
-            else:
-                model_index = row
-            try:
-                model_index = int(model_index)
-            except (TypeError, ValueError):
-                model_index = row
-            if 0 <= model_index < len(self.session.items):
-                model_rows.append(model_index)
-        return sorted(set(model_rows))
+        row_map = self._row_model_map()
+        count = len(self.session.items)
+        model_rows = {row_map[index.row()] for index in selection.selectedRows() if index.row() < len(row_map)}
+        return sorted(idx for idx in model_rows if 0 <= idx < count)
 
     def _delete_selected_entries(self, delete_files: bool = False) -> None:
         if not self.session:
@@ -4460,28 +4782,39 @@ class MainWindow(QtWidgets.QMainWindow):
             )
             if reply != QtWidgets.QMessageBox.StandardButton.Yes:
                 return
-        self._push_undo_state()
+        ops: list[UndoOp] = []
+        events: list[tuple[str, str]] = []
+        unlink_paths: list[Path] = []
+        current_removed = False
         for idx in sorted(indices, reverse=True):
             if idx < 0 or idx >= len(self.session.items):
                 continue
             item = self.session.items[idx]
+            if item is self.current_item:
+                current_removed = True
             if delete_files and item.wav_path:
-                abs_path = Path(item.wav_path)
-                if not abs_path.is_absolute():
-                    abs_path = self.session.session_dir() / abs_path
-                try:
-                    abs_path.unlink(missing_ok=True)
-                except Exception:
-                    pass
+                abs_path = self._abs_wav_path(item.wav_path)
+                unlink_paths.append(abs_path)
                 self._sung_note_cache.pop(str(abs_path), None)
-            self._log_event("delete_entry", item.alias)
+            events.append(("delete_entry", item.alias))
+            ops.append(UndoOp("delete", idx, before=item.to_dict()))
             self.session.items.pop(idx)
-        if self.current_item and self.current_item not in self.session.items:
+            self._drop_alias(item)
+            if item.status != ItemStatus.PENDING:
+                self._recorded_count -= 1
+        if unlink_paths:
+            executor = ThreadPoolExecutor(max_workers=min(32, len(unlink_paths)))
+            executor.map(_unlink_quietly, unlink_paths)
+            executor.shutdown(wait=False)
+        self._log_events(events)
+        if ops:
+            self._push_undo_op(UndoOp("bulk", ops=ops))
+        if current_removed:
             self.current_item = None
             self.selected_audio = None
             self._clear_analysis()
-        self._refresh_table()
-        self._save_session()
+        self._table_remove_rows([op.index for op in ops])
+        self._schedule_save()
 
     def _item_changed(self, item: QtWidgets.QTableWidgetItem) -> None:
         if self._suppress_item_changed or not self.session:
@@ -4495,42 +4828,101 @@ class MainWindow(QtWidgets.QMainWindow):
             new_alias = item.text().strip()
             if not new_alias:
                 return
-            if any(it.alias == new_alias for i, it in enumerate(self.session.items) if i != row):
+            if self._alias_index.get(new_alias, current) is not current:
                 self._show_error("Alias already exists")
-                self._refresh_table()
+                self._set_cell_text(item, current.alias)
                 return
-            self._push_undo_state()
+            before = current.to_dict()
+            self._drop_alias(current)
             current.alias = new_alias
-            current.romaji = "_".join(kana_to_romaji_tokens(new_alias)) if needs_romaji(new_alias) else None
-            self._refresh_table()
-            self._save_session()
+            self._alias_index[new_alias] = current
+            current.romaji = alias_romaji(new_alias)
+            self._push_undo_op(UndoOp("modify", row, before=before, after=current.to_dict()))
+            if item.text() != new_alias:
+                self._set_cell_text(item, new_alias)
+            romaji_item = self.table.item(item.row(), 2)
+            if romaji_item is not None:
+                self._set_cell_text(romaji_item, current.romaji.replace(" ", "_") if current.romaji else "")
+            self._schedule_save()
         elif col == 4:
-            self._push_undo_state()
+            before = current.to_dict()
             current.notes = item.text()
-            self._save_session()
+            self._push_undo_op(UndoOp("modify", row, before=before, after=current.to_dict()))
+            self._schedule_save()
+
+    def _set_cell_text(self, cell: QtWidgets.QTableWidgetItem, text: str) -> None:
+        self._suppress_item_changed = True
+        try:
+            cell.setText(text)
+        finally:
+            self._suppress_item_changed = False
 
-    def _push_undo_state(self) -> None:
+    def _sync_undo_owner(self) -> None:
+        if self.session is not self._undo_owner:
+            self._undo_owner = self.session
+            self.undo_stack.clear()
+            self.redo_stack.clear()
+
+    def _push_undo_op(self, op: UndoOp) -> None:
         if not self.session:
             return
-        snapshot = [item.to_dict() for item in self.session.items]
-        self.undo_stack.append(snapshot)
+        self._sync_undo_owner()
+        self.redo_stack.clear()
+        self.undo_stack.append(op)
         if len(self.undo_stack) > 50:
             self.undo_stack.pop(0)
 
+    def _delete_ops_for_all(self) -> list[UndoOp]:
+        items = self.session.items if self.session else []
+        return [UndoOp("delete", idx, before=items[idx].to_dict()) for idx in range(len(items) - 1, -1, -1)]
+
     def _undo(self) -> None:
-        if not self.session or not self.undo_stack:
+        if not self.session:
             return
-        snapshot = self.undo_stack.pop()
-        self.session.items = [Item.from_dict(data) for data in snapshot]
-        self._refresh_table()
-        self._save_session()
+        self._sync_undo_owner()
+        if not self.undo_stack:
+            return
+        op = self.undo_stack.pop()
+        inverse = invert_op(op)
+        apply_op(self.session.items, inverse)
+        self.redo_stack.append(inverse)
+        self._after_history_change(inverse)
+
+    def _redo(self) -> None:
+        if not self.session:
+            return
+        self._sync_undo_owner()
+        if not self.redo_stack:
+            return
+        op = self.redo_stack.pop()
+        inverse = invert_op(op)
+        apply_op(self.session.items, inverse)
+        self.undo_stack.append(inverse)
+        self._after_history_change(inverse)
+
+    def _after_history_change(self, op: UndoOp) -> None:
+        self._rebuild_alias_index()
+        if self.current_item and not self._item_in_session(self.current_item):
+            self.current_item = None
+            self.selected_audio = None
+            self._clear_analysis()
+        if op.kind == "add":
+            self._table_insert_row(op.index)
+        elif op.kind == "delete":
+            self._table_remove_rows([op.index])
+        elif op.kind == "modify":
+            self._table_update_row(op.index)
+        else:
+            self._refresh_table()
+        self._schedule_save()
 
     def _clear_analysis(self) -> None:
         self._stop_recorded_worker()
         self._current_analysis_key = None
         self.wave_curve.setData([], [])
+        self._wave_render_src = None
         self.spec_curve.setData([], [])
-        self.power_history = []
+        self._power_count = 0
         self.power_curve.setData([], [])
         self.recorded_f0_curve.setData([], [])
         self.mel_img.clear()
@@ -4539,32 +4931,27 @@ class MainWindow(QtWidgets.QMainWindow):
             self.playhead.setVisible(False)
         if self.selection_region:
             self.selection_region.setVisible(False)
-        if hasattr(self, "spec_playhead"):
-            self.spec_playhead.setVisible(False)
-        if hasattr(self, "power_playhead"):
-            self.power_playhead.setVisible(False)
-        if hasattr(self, "recorded_f0_playhead"):
-            self.recorded_f0_playhead.setVisible(False)
+        for line in self._playhead_lines:
+            line.setVisible(False)
 
     def _progress_text(self) -> str:
         if not self.session:
             return "-- / --"
-        recorded = sum(1 for item in self.session.items if item.status != ItemStatus.PENDING)
-        total = len(self.session.items)
-        return f"{recorded} / {total}"
+        return f"{self._recorded_count} / {len(self.session.items)}"
 
     def _render_waveform(self, audio: np.ndarray) -> None:
         if audio.size == 0:
             return
-        wave = audio
-        wave_x = np.linspace(0, len(wave) / self.audio.sample_rate, len(wave))
-        if len(wave) > 20000:
-            step = max(1, len(wave) // 20000)
-            wave = wave[::step]
-            wave_x = wave_x[::step]
-        self.wave_curve.setData(wave_x, wave)
+        render_key = float(self.audio.sample_rate)
+        if audio is not self._wave_render_src or render_key != self._wave_render_key:
+            wave_x = self._cached_wave_axis(len(audio), self.audio.sample_rate)
+            wave = _waveform_envelope(audio) if len(audio) > WAVE_PLOT_POINTS else audio
+            self.wave_curve.setData(wave_x, wave)
+            self._wave_render_src = audio
+            self._wave_render_key = render_key
         self.wave_plot.enableAutoRange(axis="xy", enable=True)
         self.wave_plot.plotItem.vb.autoRange()
+        self._last_wave_range = None
         if self.selection_region:
             self.selection_region.setVisible(False)
         if self.playhead:
@@ -4578,28 +4965,32 @@ class MainWindow(QtWidgets.QMainWindow):
             return
         if not self.selection_region or not self.selection_region.isVisible():
             return
-        abs_path = self.session.session_dir() / self.current_item.wav_path
+        abs_path = self._abs_wav_path(self.current_item.wav_path)
         if not abs_path.exists():
             return
         try:
-            audio, sr = sf.read(str(abs_path), dtype="float32")
-            if audio.ndim > 1:
-                audio = np.mean(audio, axis=1)
-            if sr != self.audio.sample_rate:
-                audio = self.audio._resample(audio, sr, self.audio.sample_rate)
-                sr = self.audio.sample_rate
             start_sec, end_sec = self.selection_region.getRegion()
             if end_sec <= start_sec:
                 return
-            start_s = max(0, int(start_sec * sr))
-            end_s = min(len(audio), int(end_sec * sr))
-            if end_s <= start_s:
-                return
-            new_audio = np.concatenate((audio[:start_s], audio[end_s:]))
-            sf.write(str(abs_path), new_audio, sr, subtype="PCM_16")
+            sr = self.audio.sample_rate
+            cached = self._cached_audio(abs_path)
+            if cached is not None:
+                start_s = max(0, int(start_sec * sr))
+                end_s = min(len(cached), int(end_sec * sr))
+                if end_s <= start_s:
+                    return
+                new_audio = np.concatenate((cached[:start_s], cached[end_s:]))
+            else:
+                new_audio = self._cut_from_file(abs_path, start_sec, end_sec)
+                if new_audio is None:
+                    return
+            pcm = np.clip(np.round(new_audio * 32768.0), -32768, 32767).astype(np.int16)
+            sf.write(str(abs_path), pcm, sr, subtype="PCM_16")
+            new_audio = pcm.astype(np.float32) / np.float32(32768.0)
+            self._store_cached_audio(abs_path, new_audio)
             self.selected_audio = new_audio
             self.current_item.duration_sec = len(new_audio) / sr if len(new_audio) else 0.0
-            self._save_session()
+            self._schedule_save()
             self._analyze_selected_item()
             self._refresh_table()
             if self.current_item:
@@ -4611,6 +5002,50 @@ class MainWindow(QtWidgets.QMainWindow):
             logger.exception("Failed to cut selection")
             self._show_error(str(exc))
 
+    def _cut_from_file(self, abs_path: Path, start_sec: float, end_sec: float) -> Optional[np.ndarray]:
+        with sf.SoundFile(str(abs_path)) as f:
+            sr = f.samplerate
+            if sr == self.audio.sample_rate:
+                start_s = max(0, int(start_sec * sr))
+                end_s = min(f.frames, int(end_sec * sr))
+                if end_s <= start_s:
+                    return None
+                new_audio = np.empty(f.frames - (end_s - start_s), dtype=np.float32)
+                _read_mono_into(f, new_audio[:start_s])
+                f.seek(end_s)
+                _read_mono_into(f, new_audio[start_s:])
+                return new_audio
+        audio, sr = sf.read(str(abs_path), dtype="float32")
+        if audio.ndim > 1:
+            audio = np.mean(audio, axis=1)
+        audio = self.audio._resample(audio, sr, self.audio.sample_rate)
+        sr = self.audio.sample_rate
+        start_s = max(0, int(start_sec * sr))
+        end_s = min(len(audio), int(end_sec * sr))
+        if end_s <= start_s:
+            return None
+        return np.concatenate((audio[:start_s], audio[end_s:]))
+
+    def _cached_audio(self, abs_path: Path) -> Optional[np.ndarray]:
+        try:
+            key = (str(abs_path), abs_path.stat().st_mtime, int(self.audio.sample_rate))
+        except OSError:
+            return None
+        audio = self._sf_cache.get(key)
+        if audio is not None:
+            self._sf_cache.move_to_end(key)
+        return audio
+
+    def _store_cached_audio(self, abs_path: Path, audio: np.ndarray) -> None:
+        try:
+            key = (str(abs_path), abs_path.stat().st_mtime, int(self.audio.sample_rate))
+        except OSError:
+            return
+        self._sf_cache[key] = audio
+        self._sf_cache.move_to_end(key)
+        while len(self._sf_cache) > 4:
+            self._sf_cache.popitem(last=False)
+
     def _toggle_selection(self) -> None:
         if not self.selection_region:
             return
@@ -4627,40 +5062,83 @@ class MainWindow(QtWidgets.QMainWindow):
         self.selection_region.setRegion((start, end))
         self.selection_region.setVisible(True)
 
+    @staticmethod
+    def _voicebank_fingerprint(folder: Path) -> tuple[int, int]:
+        try:
+            folder_mtime = folder.stat().st_mtime_ns
+        except OSError:
+            return -1, -1
+        try:
+            oto_mtime = (folder / "oto.ini").stat().st_mtime_ns
+        except OSError:
+            oto_mtime = -1
+        return folder_mtime, oto_mtime
+
+    def _voicebank_map_key(self, folders: list[Path], prefix: str, suffix: str) -> tuple:
+        out_prefix = self.session.output_prefix if self.session else ""
+        out_suffix = self.session.output_suffix if self.session else ""
+        return (
+            prefix,
+            suffix,
+            out_prefix,
+            out_suffix,
+            tuple((str(folder), self._voicebank_fingerprint(folder)) for folder in folders),
+        )
+
+    def _store_voicebank_map(self, key: tuple, mapping: dict[str, Path]) -> None:
+        if len(self._voicebank_map_cache) >= 8:
+            self._voicebank_map_cache.pop(next(iter(self._voicebank_map_cache)))
+        self._voicebank_map_cache[key] = mapping
+
     def _build_voicebank_map(self, folders: list[Path], prefix: str, suffix: str) -> dict[str, Path]:
-        mapping: dict[str, Path] = {}
-        for folder in folders:
-            oto_path = folder / "oto.ini"
-            if oto_path.exists():
-                entries = parse_oto_ini(oto_path)
-                for alias, wav_name in entries:
-                    wav_path = folder / wav_name
-                    if not wav_path.exists():
-                        continue
-                    key = self._normalize_alias(Path(wav_name).stem, prefix, suffix)
-                    if not key:
-                        continue
-                    if key not in mapping:
-                        mapping[key] = wav_path
-                continue
-            for wav in sorted(folder.glob("*.wav")):
-                key = self._normalize_alias(wav.stem, prefix, suffix)
-                if not key or key in mapping:
-                    continue
-                mapping[key] = wav
+        self._voicebank_map_pending = None
+        key = self._voicebank_map_key(folders, prefix, suffix)
+        mapping = self._voicebank_map_cache.get(key)
+        if mapping is None:
+            mapping = _scan_voicebank_map(folders, prefix, suffix, key[2], key[3])
+            self._store_voicebank_map(key, mapping)
         return mapping
 
+    def _request_voicebank_map(self, folders: list[Path], prefix: str, suffix: str) -> None:
+        key = self._voicebank_map_key(folders, prefix, suffix)
+        mapping = self._voicebank_map_cache.get(key)
+        if mapping is not None:
+            self._voicebank_map_pending = None
+            self.voicebank_samples = mapping
+            return
+        self.voicebank_samples = {}
+        self._voicebank_map_pending = key
+        worker = VoicebankMapWorker(key, folders, prefix, suffix, key[2], key[3], self)
+        worker.result.connect(self._on_voicebank_map_result)
+        worker.finished.connect(worker.deleteLater)
+        self._voicebank_worker = worker
+        worker.start()
+
+    def _on_voicebank_map_result(self, key: tuple, mapping: dict[str, Path]) -> None:
+        self._store_voicebank_map(key, mapping)
+        if key == self._voicebank_map_pending:
+            self._voicebank_map_pending = None
+            self.voicebank_samples = mapping
+
+    def _stop_voicebank_worker(self) -> None:
+        worker = self._voicebank_worker
+        self._voicebank_worker = None
+        self._voicebank_map_pending = None
+        if worker is not None:
+            try:
+                if worker.isRunning():
+                    worker.wait(2000)
+            except RuntimeError:
+                pass
+
     def _normalize_alias(self, name: str, prefix: str, suffix: str) -> str:
-        if prefix and name.startswith(prefix):
-            name = name[len(prefix):]
-        if suffix and name.endswith(suffix):
-            name = name[: -len(suffix)]
-        if self.session:
-            if self.session.output_prefix and name.startswith(self.session.output_prefix):
-                name = name[len(self.session.output_prefix):]
-            if self.session.output_suffix and name.endswith(self.session.output_suffix):
-                name = name[: -len(self.session.output_suffix)]
-        return name.strip()
+        out_prefix = self.session.output_prefix if self.session else ""
+        out_suffix = self.session.output_suffix if self.session else ""
+        return self._strip_fixes(name, prefix, suffix, out_prefix, out_suffix)
+
+    @staticmethod
+    def _strip_fixes(name: str, prefix: str, suffix: str, out_prefix: str, out_suffix: str) -> str:
+        return name.removeprefix(prefix).removesuffix(suffix).removeprefix(out_prefix).removesuffix(out_suffix).strip()
 
     def _rename_recordings_for_prefix_suffix(
         self,
@@ -4671,8 +5149,8 @@ class MainWindow(QtWidgets.QMainWindow):
             return True, {}
         mapping: dict[str, str] = {}
         errors = False
-        temp_entries: list[tuple[Path, Path, Item, Path, Path]] = []
-        base = self.session.session_dir()
+        entries: list[tuple[Path, Path, Item, Path]] = []
+        base = self._session_dir()
         for item in self.session.items:
             if not item.wav_path:
                 continue
@@ -4691,33 +5169,52 @@ class MainWindow(QtWidgets.QMainWindow):
                 item.wav_path = str(new_rel)
                 mapping[str(old_abs)] = str(new_abs)
                 continue
-            if new_abs.exists():
-                errors = True
-                continue
-            temp_path = old_abs.with_name(f".tmp_rename_{uuid.uuid4().hex}{old_abs.suffix}")
-            try:
-                old_abs.replace(temp_path)
-            except Exception:
-                errors = True
-                continue
-            temp_entries.append((temp_path, new_abs, item, new_rel, old_abs))
+            entries.append((old_abs, new_abs, item, new_rel))
 
-        for temp_path, new_abs, item, new_rel, old_abs in temp_entries:
+        occupied = {old_abs for old_abs, _new, _item, _rel in entries}
+        moved: dict[Path, Path] = {}
+        for parent in {new_abs.parent for _old, new_abs, _item, _rel in entries}:
             try:
-                new_abs.parent.mkdir(parents=True, exist_ok=True)
-                if new_abs.exists():
-                    errors = True
-                    temp_path.replace(old_abs)
-                    continue
-                temp_path.replace(new_abs)
-                item.wav_path = str(new_rel)
-                mapping[str(old_abs)] = str(new_abs)
+                parent.mkdir(parents=True, exist_ok=True)
             except Exception:
-                errors = True
+                pass
+        pending = entries
+        while pending:
+            blocked: list[tuple[Path, Path, Item, Path]] = []
+            for entry in pending:
+                old_abs, new_abs, item, new_rel = entry
+                if new_abs in occupied:
+                    blocked.append(entry)
+                    continue
+                occupied.discard(old_abs)
+                src = moved.pop(old_abs, old_abs)
+                try:
+                    if new_abs.exists():
+                        errors = True
+                        if src != old_abs and not old_abs.exists():
+                            src.replace(old_abs)
+                        continue
+                    src.replace(new_abs)
+                    item.wav_path = str(new_rel)
+                    mapping[str(old_abs)] = str(new_abs)
+                except Exception:
+                    errors = True
+                    try:
+                        if src != old_abs and not old_abs.exists():
+                            src.replace(old_abs)
+                    except Exception:
+                        pass
+            if blocked and len(blocked) == len(pending):
+                old_abs = blocked[0][0]
+                temp_path = old_abs.with_name(f".tmp_rename_{uuid.uuid4().hex}{old_abs.suffix}")
                 try:
-                    temp_path.replace(old_abs)
+                    old_abs.replace(temp_path)
                 except Exception:
-                    pass
+                    errors = True
+                    break
+                occupied.discard(old_abs)
+                moved[old_abs] = temp_path
+            pending = blocked
         return (not errors), mapping
 
     def _set_status(self, message: str) -> None:
@@ -4726,6 +5223,17 @@ class MainWindow(QtWidgets.QMainWindow):
     def _show_error(self, message: str) -> None:
         QtWidgets.QMessageBox.critical(self, "Error", message)
 
+    @staticmethod
+    def _drain_executor(executor: ThreadPoolExecutor) -> None:
+        try:
+            executor.submit(lambda: None).result()
+        except RuntimeError:
+            pass
+
+    def _shutdown_executors(self) -> None:
+        self._cache_save_executor.shutdown(wait=True)
+        self._autosave_executor.shutdown(wait=True)
+
     def closeEvent(self, event: QtGui.QCloseEvent) -> None:
         try:
             if self.audio.recording:
@@ -4736,5 +5244,12 @@ class MainWindow(QtWidgets.QMainWindow):
             pass
         self._stop_note_worker()
         self._stop_recorded_worker()
+        self._stop_voicebank_worker()
+        self._drain_executor(self._cache_save_executor)
+        self._save_timer.stop()
+        self._close_event_log()
+        if self._recent_save_timer.isActive():
+            self._flush_recent_sessions()
         self._autosave()
+        self._drain_executor(self._autosave_executor)
         super().closeEvent(event)
@@ -12,10 +12,11 @@ import threading
 from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Callable, Optional
 
-from PyQt6 import QtCore, QtWidgets
+from PyQt6 import QtCore, QtGui, QtWidgets
 
 from models.session import Session
 
@@ -68,6 +69,14 @@ def _default_tool_path(name: str) -> str:
     return str(Path.cwd() / "tools" / exe)
 
 
+@lru_cache(maxsize=1)
+def _heading_font() -> QtGui.QFont:
+    font = QtGui.QFont()
+    font.setPixelSize(16)
+    font.setWeight(QtGui.QFont.Weight.DemiBold)
+    return font
+
+
 def _subprocess_creationflags() -> int:
     if sys.platform == "win32":
         return subprocess.CREATE_NO_WINDOW
@@ -289,7 +298,7 @@ class VstFileSelectionPage(QtWidgets.QWidget):
         layout = QtWidgets.QVBoxLayout(self)
 
         title = QtWidgets.QLabel(self._t("vst_select_audio"))
-        title.setStyleSheet("font-size: 16px; font-weight: 600;")
+        title.setFont(_heading_font())
         layout.addWidget(title)
 
         search_layout = QtWidgets.QHBoxLayout()
@@ -397,7 +406,7 @@ class VstMixerPage(QtWidgets.QWidget):
 
         layout = QtWidgets.QVBoxLayout(self)
         header = QtWidgets.QLabel(self._t("vst_chain_title"))
-        header.setStyleSheet("font-size: 16px; font-weight: 600;")
+        header.setFont(_heading_font())
         layout.addWidget(header)
 
         preset_row = QtWidgets.QHBoxLayout()
@@ -6,9 +6,12 @@ from typing import Optional, Tuple
 import numpy as np
 
 
-NOTE_NAMES = ["C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B"]
+NOTE_NAMES = ("C", "C#", "D", "D#", "E", "F", "F#", "G", "G#", "A", "A#", "B")
+_NOTE_INDEX = {name: idx for idx, name in enumerate(NOTE_NAMES)}
 NOISE_GATE_RMS = 0.01
 
+_REGULAR_CACHE: dict[int, int] = {}
+
 
 def compute_rms(frame: np.ndarray) -> float:
     if frame.size == 0:
@@ -16,12 +19,36 @@ def compute_rms(frame: np.ndarray) -> float:
     return float(np.sqrt(np.mean(np.square(frame), dtype=np.float64)))
 
 
-def compute_fft(frame: np.ndarray, sr: int) -> Tuple[np.ndarray, np.ndarray]:
+def next_regular(n: int) -> int:
+    cached = _REGULAR_CACHE.get(n)
+    if cached is not None:
+        return cached
+    m = max(1, n)
+    while True:
+        rest = m
+        for p in (2, 3, 5):
+            while rest % p == 0:
+                rest //= p
+        if rest == 1:
+            break
+        m += 1
+    _REGULAR_CACHE[n] = m
+    return m
+
+
+def _autocorrelation(frame: np.ndarray, max_lag: int) -> np.ndarray:
+    n = next_regular(2 * len(frame))
+    spectrum = np.fft.rfft(frame, n=n)
+    return np.fft.irfft(spectrum * np.conj(spectrum), n=n)[:max_lag + 1]
+
+
+def compute_fft(frame: np.ndarray, sr: int, n_fft: Optional[int] = None) -> Tuple[np.ndarray, np.ndarray]:
     if frame.size == 0:
         return np.array([]), np.array([])
+    n = max(len(frame), n_fft or 0)
     window = np.hanning(len(frame))
-    spectrum = np.fft.rfft(frame * window)
-    freqs = np.fft.rfftfreq(len(frame), 1.0 / sr)
+    spectrum = np.fft.rfft(frame * window, n=n)
+    freqs = np.fft.rfftfreq(n, 1.0 / sr)
     magnitude = np.abs(spectrum)
     return freqs, magnitude
 
@@ -37,9 +64,8 @@ def estimate_f0(frame: np.ndarray, sr: int, fmin: float = 50.0, fmax: float = 10
     if np.max(np.abs(frame)) < 1e-4:
         return None
 
-    autocorr = np.correlate(frame, frame, mode="full")
-    autocorr = autocorr[len(autocorr) // 2:]
-    if autocorr[0] == 0:
+    autocorr = _autocorrelation(frame, len(frame) - 1)
+    if autocorr[0] <= 0:
         return None
 
     lag_min = int(sr / fmax)
@@ -80,28 +106,24 @@ def estimate_f0_yin(
     if max_tau <= min_tau:
         return None
 
-    diff = np.zeros(max_tau + 1, dtype=np.float32)
-    for tau in range(1, max_tau + 1):
-        diff[tau] = np.sum((frame[:-tau] - frame[tau:]) ** 2)
-
-    cmnd = np.zeros_like(diff)
-    cmnd[0] = 1.0
-    running_sum = 0.0
-    for tau in range(1, max_tau + 1):
-        running_sum += diff[tau]
-        if running_sum > 0.0:
-            cmnd[tau] = diff[tau] * tau / running_sum
-        else:
-            cmnd[tau] = 1.0
-
-    tau = None
-    for t in range(min_tau, max_tau):
-        if cmnd[t] < threshold:
-            while t + 1 <= max_tau and cmnd[t + 1] < cmnd[t]:
-                t += 1
-            tau = t
-            break
-    if tau is None:
+    samples = frame.astype(np.float64)
+    n = len(samples)
+    taus = np.arange(max_tau + 1)
+    energy = np.concatenate(([0.0], np.cumsum(samples * samples)))
+    diff = energy[n - taus] + (energy[n] - energy[taus]) - 2.0 * _autocorrelation(samples, max_tau)
+    diff[0] = 0.0
+    np.maximum(diff, 0.0, out=diff)
+
+    cmnd = np.ones_like(diff)
+    running_sum = np.cumsum(diff[1:])
+    np.divide(diff[1:] * taus[1:], running_sum, out=cmnd[1:], where=running_sum > 0.0)
+
+    below = np.flatnonzero(cmnd[min_tau:max_tau] < threshold)
+    if below.size:
+        tau = min_tau + int(below[0])
+        while tau + 1 <= max_tau and cmnd[tau + 1] < cmnd[tau]:
+            tau += 1
+    else:
         tau = int(np.argmin(cmnd[min_tau:max_tau + 1])) + min_tau
     if tau <= 0:
         return None
@@ -125,6 +147,20 @@ def f0_to_midi(f0: Optional[float]) -> Optional[float]:
     return 69 + 12 * math.log2(f0 / 440.0)
 
 
+_MIDI_OFFSET = 12.0 * math.log2(440.0) - 69.0
+
+
+def f0s_to_midi(f0s: np.ndarray, out: Optional[np.ndarray] = None) -> np.ndarray:
+    f0s = np.asarray(f0s, dtype=np.float32)
+    if out is None or out.shape != f0s.shape or out.dtype != np.float32:
+        out = np.empty(f0s.shape, dtype=np.float32)
+    out.fill(np.nan)
+    np.log2(f0s, out=out, where=f0s > 0)
+    out *= 12.0
+    out -= _MIDI_OFFSET
+    return out
+
+
 def midi_to_note(midi: Optional[float]) -> str:
     if midi is None:
         return "--"
@@ -144,13 +180,14 @@ def note_to_freq(note: str) -> Optional[float]:
     else:
         name = note[:1]
         octave_str = note[1:]
-    if name not in NOTE_NAMES:
+    semitone = _NOTE_INDEX.get(name)
+    if semitone is None:
         return None
     try:
         octave = int(octave_str)
     except ValueError:
         return None
-    midi = (octave + 1) * 12 + NOTE_NAMES.index(name)
+    midi = (octave + 1) * 12 + semitone
     return 440.0 * 2 ** ((midi - 69) / 12)
 
 
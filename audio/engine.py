@@ -33,6 +33,7 @@ class AudioEngine(QtCore.QObject):
         self.pre_roll_samples = 0
 
         self._ring = RingBuffer(size=sample_rate * 5)
+        self._write_cursor = 0
         self._record_file: Optional[sf.SoundFile] = None
         self._record_lock = threading.Lock()
         self._bgm_data: Optional[np.ndarray] = None
@@ -309,6 +310,9 @@ class AudioEngine(QtCore.QObject):
     def get_latest_audio(self, length: int) -> np.ndarray:
         return self._ring.get(length)
 
+    def get_write_cursor(self) -> int:
+        return self._write_cursor
+
     def get_waveform_audio(self) -> np.ndarray:
         if self.recording:
             return self._get_recorded_concat()
@@ -370,6 +374,7 @@ class AudioEngine(QtCore.QObject):
             self.status.emit(str(status))
         mono_in = indata[:, 0] if indata.ndim > 1 else indata
         self._ring.push(mono_in)
+        self._write_cursor += frames
 
         if self.recording:
             with self._record_lock:
@@ -481,10 +486,18 @@ class AudioEngine(QtCore.QObject):
         if sr_in == sr_out:
             return data
         ratio = sr_out / sr_in
-        new_len = int(len(data) * ratio)
-        x_old = np.linspace(0, 1, len(data))
-        x_new = np.linspace(0, 1, new_len)
-        return np.interp(x_new, x_old, data).astype(np.float32)
+        length = len(data)
+        new_len = int(length * ratio)
+        src = np.asarray(data, dtype=np.float32)
+        if length <= 1 or new_len <= 1:
+            return np.full(max(new_len, 0), src[0] if length else 0.0, dtype=np.float32)
+        pos = np.arange(new_len, dtype=np.float64) * ((length - 1) / (new_len - 1))
+        idx = pos.astype(np.intp)
+        np.minimum(idx, length - 2, out=idx)
+        frac = (pos - idx).astype(np.float32)
+        out = src[idx]
+        out += (src[idx + 1] - out) * frac
+        return out
 
     def _get_recorded_concat(self) -> np.ndarray:
         if self._recorded_cache is not None and self._recorded_cache_samples == self._recorded_samples:
@@ -6,7 +6,22 @@ import numpy as np
 class RingBuffer:
     def __init__(self, size: int):
         self.size = size
-        self.buffer = np.zeros(size, dtype=np.float32)
+        self._storage = np.zeros(size, dtype=np.float32)
+        self.buffer = self._storage
+        self.index = 0
+        self.full = False
+
+    def resize(self, size: int) -> None:
+        kept = self.get(size)
+        if size > len(self._storage):
+            self._storage = np.zeros(size, dtype=np.float32)
+        self.size = size
+        self.buffer = self._storage[:size]
+        self.buffer[:len(kept)] = kept
+        self.index = len(kept) % size
+        self.full = len(kept) == size
+
+    def clear(self) -> None:
         self.index = 0
         self.full = False
 
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import os
+import struct
+from pathlib import Path
+from typing import Optional
+
+
+def read_wav_duration(path: Path) -> Optional[float]:
+    try:
+        with open(path, "rb") as f:
+            header = f.read(12)
+            if len(header) < 12 or header[:4] != b"RIFF" or header[8:12] != b"WAVE":
+                return None
+            file_size = os.fstat(f.fileno()).st_size
+            sample_rate = 0
+            block_align = 0
+            while True:
+                chunk = f.read(8)
+                if len(chunk) < 8:
+                    return None
+                chunk_id, size = struct.unpack("<4sI", chunk)
+                if chunk_id == b"data":
+                    if not sample_rate or not block_align or size > file_size - f.tell():
+                        return None
+                    return (size // block_align) / sample_rate
+                if chunk_id == b"fmt ":
+                    fmt = f.read(size)
+                    if len(fmt) < 14:
+                        return None
+                    _tag, _channels, sample_rate, _byte_rate, block_align = struct.unpack_from("<HHIIH", fmt)
+                    f.seek(size & 1, os.SEEK_CUR)
+                else:
+                    f.seek(size + (size & 1), os.SEEK_CUR)
+    except OSError:
+        return None
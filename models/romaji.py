@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict
+from functools import lru_cache
+from typing import Dict, Optional
 
 
 _BASIC: Dict[str, str] = {
@@ -55,6 +56,13 @@ def needs_romaji(text: str) -> bool:
     return any("\u3040" <= ch <= "\u30ff" for ch in text)
 
 
+@lru_cache(maxsize=4096)
+def alias_romaji(alias: str) -> Optional[str]:
+    if not needs_romaji(alias):
+        return None
+    return "_".join(kana_to_romaji_tokens(alias))
+
+
 def kana_to_romaji(text: str) -> str:
     return "".join(kana_to_romaji_tokens(text))
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field
 from enum import Enum
 from pathlib import Path
 from typing import List, Optional
@@ -29,9 +29,16 @@ class Item:
         return Item(id=str(uuid.uuid4())[:8], alias=alias, note=note)
 
     def to_dict(self) -> dict:
-        data = asdict(self)
-        data["status"] = self.status.value
-        return data
+        return {
+            "id": self.id,
+            "alias": self.alias,
+            "note": self.note,
+            "romaji": self.romaji,
+            "status": self.status.value,
+            "wav_path": self.wav_path,
+            "notes": self.notes,
+            "duration_sec": self.duration_sec,
+        }
 
     @staticmethod
     def from_dict(data: dict) -> "Item":
@@ -93,7 +100,7 @@ class Session:
             "bit_depth": self.bit_depth,
             "channels": self.channels,
             "voicebank_path": str(self.voicebank_path) if self.voicebank_path else None,
-            "voicebank_paths": self.voicebank_paths,
+            "voicebank_paths": list(self.voicebank_paths),
             "voicebank_prefix": self.voicebank_prefix,
             "voicebank_suffix": self.voicebank_suffix,
             "voicebank_use_bgm": self.voicebank_use_bgm,
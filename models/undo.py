@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field, fields
+from typing import List, Literal, Optional
+
+from models.session import Item
+
+
+@dataclass
+class UndoOp:
+    kind: Literal["add", "delete", "modify", "bulk"]
+    index: int = -1
+    before: Optional[dict] = None
+    after: Optional[dict] = None
+    ops: List["UndoOp"] = field(default_factory=list)
+
+
+def invert_op(op: UndoOp) -> UndoOp:
+    if op.kind == "add":
+        return UndoOp("delete", op.index, before=op.after)
+    if op.kind == "delete":
+        return UndoOp("add", op.index, after=op.before)
+    if op.kind == "modify":
+        return UndoOp("modify", op.index, before=op.after, after=op.before)
+    return UndoOp("bulk", ops=[invert_op(sub) for sub in reversed(op.ops)])
+
+
+def _restore_item(item: Item, data: dict) -> None:
+    restored = Item.from_dict(data)
+    for f in fields(Item):
+        setattr(item, f.name, getattr(restored, f.name))
+
+
+def apply_op(items: List[Item], op: UndoOp) -> None:
+    if op.kind == "add":
+        items.insert(op.index, Item.from_dict(op.after))
+    elif op.kind == "delete":
+        items.pop(op.index)
+    elif op.kind == "modify":
+        _restore_item(items[op.index], op.after)
+    else:
+        for sub in op.ops:
+            apply_op(items, sub)
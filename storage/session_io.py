@@ -12,22 +12,36 @@ SESSION_FILENAME = "session.json"
 
 def save_session(session: Session, path: Optional[Path] = None) -> Path:
     session_dir = path if path else session.session_dir()
+    return save_session_data(session.to_dict(), session_dir)
+
+
+def save_session_data(data: dict, session_dir: Path) -> Path:
     session_dir.mkdir(parents=True, exist_ok=True)
     (session_dir / "Recordings").mkdir(parents=True, exist_ok=True)
-    _write_character_txt(session, session_dir)
-    data = session.to_dict()
+    _write_character_txt(data.get("singer", ""), data.get("name", ""), session_dir)
     out_path = session_dir / SESSION_FILENAME
-    out_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path = out_path.with_name(out_path.name + ".tmp")
+    tmp_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(out_path)
     return out_path
 
 
+def session_file(path: Path) -> Path:
+    return path / SESSION_FILENAME if path.is_dir() else path
+
+
 def load_session(path: Path) -> Session:
-    if path.is_dir():
-        path = path / SESSION_FILENAME
-    data = json.loads(path.read_text(encoding="utf-8"))
+    data = json.loads(session_file(path).read_text(encoding="utf-8"))
     return Session.from_dict(data)
 
 
+def load_session_summary(path: Path) -> tuple[str, str, int, int]:
+    data = json.loads(session_file(path).read_text(encoding="utf-8"))
+    items = data.get("items", [])
+    recorded = sum(1 for item in items if item.get("status", "pending") != "pending")
+    return data.get("singer", ""), data.get("name", ""), recorded, len(items)
+
+
 def export_recordings_json(session: Session, out_path: Path) -> None:
     data = [{
         "id": item.id,
@@ -40,7 +54,7 @@ def export_recordings_json(session: Session, out_path: Path) -> None:
     out_path.write_text(json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8")
 
 
-def _write_character_txt(session: Session, session_dir: Path) -> None:
-    name = f"{session.singer} {session.name}".strip()
+def _write_character_txt(singer: str, session_name: str, session_dir: Path) -> None:
+    name = f"{singer} {session_name}".strip()
     content = f"name={name}\n" "description=Recorded by UTAU_Recorder\n"
     (session_dir / "character.txt").write_text(content, encoding="utf-8")
@@ -0,0 +1,42 @@
+import unittest
+
+import numpy as np
+
+from audio.dsp import estimate_f0, estimate_f0_yin, f0s_to_midi, midi_to_note, next_regular, note_to_freq
+
+
+class TestDsp(unittest.TestCase):
+    def test_next_regular(self):
+        self.assertEqual(next_regular(2048), 2048)
+        self.assertEqual(next_regular(1000), 1000)
+        self.assertEqual(next_regular(1021), 1024)
+        self.assertEqual(next_regular(7), 8)
+        self.assertEqual(next_regular(0), 1)
+
+    def test_f0s_to_midi(self):
+        f0s = np.array([440.0, 0.0, 880.0, -1.0], dtype=np.float32)
+        midi = f0s_to_midi(f0s)
+        self.assertEqual(midi.dtype, np.float32)
+        self.assertAlmostEqual(float(midi[0]), 69.0, places=4)
+        self.assertAlmostEqual(float(midi[2]), 81.0, places=4)
+        self.assertTrue(np.isnan(midi[1]))
+        self.assertTrue(np.isnan(midi[3]))
+
+    def test_note_round_trip(self):
+        self.assertAlmostEqual(note_to_freq("A4"), 440.0)
+        self.assertAlmostEqual(note_to_freq("c#5"), 554.365, places=3)
+        self.assertIsNone(note_to_freq("H4"))
+        self.assertEqual(midi_to_note(69.4), "A4")
+        self.assertEqual(midi_to_note(59.6), "C4")
+
+    def test_estimate_f0_sine(self):
+        sr = 16000
+        t = np.arange(2048, dtype=np.float32) / sr
+        frame = 0.5 * np.sin(2 * np.pi * 220.0 * t).astype(np.float32)
+        self.assertAlmostEqual(estimate_f0_yin(frame, sr), 220.0, delta=3.0)
+        self.assertAlmostEqual(estimate_f0(frame, sr), 220.0, delta=3.0)
+        self.assertIsNone(estimate_f0_yin(np.zeros(2048, dtype=np.float32), sr))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,37 @@
+import unittest
+
+import numpy as np
+
+from audio.ring_buffer import RingBuffer
+
+
+class TestRingBuffer(unittest.TestCase):
+    def test_resize_keeps_newest_samples(self):
+        ring = RingBuffer(8)
+        ring.push(np.arange(5, dtype=np.float32))
+        ring.push(np.arange(5, 11, dtype=np.float32))
+        np.testing.assert_array_equal(ring.get(8), np.arange(3, 11, dtype=np.float32))
+
+        ring.resize(4)
+        np.testing.assert_array_equal(ring.get(8), np.arange(7, 11, dtype=np.float32))
+        ring.push(np.array([11.0, 12.0], dtype=np.float32))
+        np.testing.assert_array_equal(ring.get(4), np.arange(9, 13, dtype=np.float32))
+
+        ring.resize(16)
+        np.testing.assert_array_equal(ring.get(16), np.arange(9, 13, dtype=np.float32))
+        ring.push(np.arange(13, 20, dtype=np.float32))
+        np.testing.assert_array_equal(ring.get(16), np.arange(9, 20, dtype=np.float32))
+        ring.push(np.arange(20, 30, dtype=np.float32))
+        np.testing.assert_array_equal(ring.get(16), np.arange(14, 30, dtype=np.float32))
+
+    def test_clear_empties_buffer(self):
+        ring = RingBuffer(4)
+        ring.push(np.arange(6, dtype=np.float32))
+        ring.clear()
+        self.assertEqual(ring.get(4).size, 0)
+        ring.push(np.array([7.0], dtype=np.float32))
+        np.testing.assert_array_equal(ring.get(4), np.array([7.0], dtype=np.float32))
+
+
+if __name__ == "__main__":
+    unittest.main()
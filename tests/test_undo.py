@@ -0,0 +1,32 @@
+import unittest
+
+from models.session import Item
+from models.undo import UndoOp, apply_op, invert_op
+
+
+class TestUndo(unittest.TestCase):
+    def test_modify_restores_in_place(self):
+        item = Item.new("a")
+        items = [item]
+        before = item.to_dict()
+        item.alias = "b"
+        op = UndoOp("modify", 0, before=before, after=item.to_dict())
+        apply_op(items, invert_op(op))
+        self.assertIs(items[0], item)
+        self.assertEqual(item.alias, "a")
+
+    def test_bulk_delete_round_trip(self):
+        items = [Item.new(alias) for alias in ("a", "b", "c", "d")]
+        ops = []
+        for idx in (3, 1):
+            ops.append(UndoOp("delete", idx, before=items[idx].to_dict()))
+            items.pop(idx)
+        op = UndoOp("bulk", ops=ops)
+        apply_op(items, invert_op(op))
+        self.assertEqual([item.alias for item in items], ["a", "b", "c", "d"])
+        apply_op(items, op)
+        self.assertEqual([item.alias for item in items], ["a", "c"])
+
+
+if __name__ == "__main__":
+    unittest.main()
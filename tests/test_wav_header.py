@@ -0,0 +1,29 @@
+import tempfile
+import unittest
+import wave
+from pathlib import Path
+
+from audio.wav_header import read_wav_duration
+
+
+class TestWavHeader(unittest.TestCase):
+    def test_read_wav_duration(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.wav"
+            with wave.open(str(path), "wb") as w:
+                w.setnchannels(2)
+                w.setsampwidth(2)
+                w.setframerate(8000)
+                w.writeframes(b"\x00" * 4 * 4000)
+            self.assertAlmostEqual(read_wav_duration(path), 0.5)
+
+    def test_rejects_non_wav(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / "a.wav"
+            path.write_bytes(b"not a wav file")
+            self.assertIsNone(read_wav_duration(path))
+            self.assertIsNone(read_wav_duration(Path(tmp) / "missing.wav"))
+
+
+if __name__ == "__main__":
+    unittest.main()